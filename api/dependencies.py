@@ -0,0 +1,118 @@
+"""
+API dependencies
+Application-scoped service container, shared by every route through FastAPI Depends
+"""
+import asyncio
+import threading
+import time
+from typing import Optional
+from fastapi import Depends, Request
+from config.config import Config
+from src.answer_evaluator import AnswerEvaluator, ProgressTracker
+from src.answer_store import AnswerStore, get_answer_store as shared_answer_store
+from src.jd_analyzer import JDAnalyzer
+from src.jd_cache import JDResultCache
+from src.llm_service import LLMService, close_provider, get_provider, get_response_cache
+from src.question_bank_manager import QuestionBankManager, QuestionBankSnapshot
+from src.vector_store import VectorStore
+
+
+class ServiceContainer:
+    """One instance of each service per process, created in the app lifespan"""
+    
+    def __init__(self):
+        """Create the lightweight services; the vector store is built on first use"""
+        self.llm_service = LLMService()
+        self.progress_tracker = ProgressTracker()
+        self.evaluator = AnswerEvaluator(
+            llm_service=self.llm_service,
+            progress_tracker=self.progress_tracker
+        )
+        self.jd_analyzer = JDAnalyzer(llm_service=self.llm_service)
+        self.jd_cache = JDResultCache(Config.JD_RESULT_CACHE_SIZE, ttl=Config.JD_RESULT_CACHE_TTL)
+        self.answer_store: Optional[AnswerStore] = shared_answer_store()
+        self.question_bank = QuestionBankManager(
+            Config.QUESTIONS_FILE,
+            shared_dir=Config.QUESTION_INDEX_DIR if Config.QUESTION_INDEX_SHARED else None,
+            compiled_path=Config.QUESTION_BANK_COMPILED
+        )
+        if self.answer_store is not None:
+            # Answers precomputed while the server runs are picked up on the next poll
+            self.question_bank.on_poll(self.answer_store.refresh)
+        self._vector_store: Optional[VectorStore] = None
+        self._vector_store_lock = threading.Lock()
+    
+    @property
+    def vector_store(self) -> VectorStore:
+        """The shared vector store (built once, safe to call from several threads)"""
+        if self._vector_store is None:
+            with self._vector_store_lock:
+                if self._vector_store is None:
+                    self._vector_store = VectorStore(question_bank=self.question_bank)
+        return self._vector_store
+    
+    @property
+    def loaded_vector_store(self) -> Optional[VectorStore]:
+        """The vector store if it has been built, without triggering a build"""
+        return self._vector_store
+    
+    def start(self):
+        """Open the LLM response cache (purging expired rows) and start question bank hot reload"""
+        get_response_cache()
+        self.question_bank.start()
+    
+    def warm_up(self):
+        """Build the heavy components that would otherwise load on the first request"""
+        started = time.perf_counter()
+        try:
+            get_provider()
+            self.vector_store  # builds it
+        except Exception as e:
+            print(f"Warning: warm-up failed, components will load on first use: {e}")
+            return
+        print(f"Warm-up finished in {time.perf_counter() - started:.1f}s")
+    
+    async def close(self):
+        """Stop the question bank poller and release pooled LLM connections"""
+        await asyncio.to_thread(self.question_bank.stop)
+        await close_provider()
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """The container created in the app lifespan"""
+    return request.app.state.services
+
+
+async def get_llm_service(services: ServiceContainer = Depends(get_services)) -> LLMService:
+    return services.llm_service
+
+
+async def get_evaluator(services: ServiceContainer = Depends(get_services)) -> AnswerEvaluator:
+    return services.evaluator
+
+
+async def get_progress_tracker(services: ServiceContainer = Depends(get_services)) -> ProgressTracker:
+    return services.progress_tracker
+
+
+async def get_jd_analyzer(services: ServiceContainer = Depends(get_services)) -> JDAnalyzer:
+    return services.jd_analyzer
+
+
+async def get_jd_cache(services: ServiceContainer = Depends(get_services)) -> JDResultCache:
+    return services.jd_cache
+
+
+async def get_question_bank(services: ServiceContainer = Depends(get_services)) -> QuestionBankSnapshot:
+    # One snapshot per request, even if a reload lands while it runs
+    return services.question_bank.snapshot
+
+
+async def get_answer_store(services: ServiceContainer = Depends(get_services)) -> Optional[AnswerStore]:
+    return services.answer_store
+
+
+def get_vector_store(services: ServiceContainer = Depends(get_services)) -> VectorStore:
+    # Sync on purpose: FastAPI runs it in the threadpool, so a first-use
+    # build does not block the event loop
+    return services.vector_store
@@ -1,14 +1,44 @@
 """
 FastAPI main application entry point
 """
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.routes import jd_routes, question_routes, answer_routes, progress_routes
+from api.dependencies import ServiceContainer
+from api.routes import jd_routes, question_routes, answer_routes, progress_routes, system_routes
+from config.config import Config
+from src.token_counter import preload_encoding
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared services, warm them up in the background, release them on shutdown"""
+    services = ServiceContainer()
+    app.state.services = services
+    services.start()
+    
+    # The tokenizer may need a download; fetch it off the event loop
+    encoding_task = asyncio.create_task(preload_encoding())
+    
+    # Warm-up runs in a worker thread so the server answers health checks immediately
+    warmup_task = None
+    if Config.WARMUP_ON_STARTUP:
+        warmup_task = asyncio.create_task(asyncio.to_thread(services.warm_up))
+    
+    yield
+    
+    await encoding_task
+    if warmup_task is not None and not warmup_task.done():
+        await warmup_task
+    await services.close()
+
 
 app = FastAPI(
     title="AI Interview Assistant API",
     description="Backend API for AI-powered interview assistant",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for React frontend
@@ -30,6 +60,7 @@ app.include_router(jd_routes.router, prefix="/api", tags=["Job Description"])
 app.include_router(question_routes.router, prefix="/api", tags=["Questions"])
 app.include_router(answer_routes.router, prefix="/api", tags=["Answers"])
 app.include_router(progress_routes.router, prefix="/api", tags=["Progress"])
+app.include_router(system_routes.router, prefix="/api", tags=["System"])
 
 
 @app.get("/")
@@ -2,7 +2,7 @@
 Pydantic models for API request/response validation
 """
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 
@@ -43,6 +43,7 @@ class Question(BaseModel):
 class QuestionListResponse(BaseModel):
     questions: List[Question]
     total: int
+    next_cursor: Optional[str] = None
 
 
 # Answer Models
@@ -74,6 +75,7 @@ class EvaluateAnswerRequest(BaseModel):
     category: str
     difficulty: str
     model_answer: Optional[str] = None
+    evaluation_mode: Optional[Literal["multi", "structured"]] = None  # Defaults to server config
 
 
 class AnswerScores(BaseModel):
@@ -87,6 +89,7 @@ class AnswerScores(BaseModel):
 class EvaluateAnswerResponse(BaseModel):
     scores: AnswerScores
     strengths: List[str]
+    weaknesses: List[str] = []
     improvements: List[str]
     follow_up_questions: List[str]
     feedback: str
@@ -1,4 +1,4 @@
 """Package initialization for API routes"""
-from . import jd_routes, question_routes, answer_routes, progress_routes
+from . import jd_routes, question_routes, answer_routes, progress_routes, system_routes
 
-__all__ = ["jd_routes", "question_routes", "answer_routes", "progress_routes"]
+__all__ = ["jd_routes", "question_routes", "answer_routes", "progress_routes", "system_routes"]
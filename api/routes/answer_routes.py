@@ -1,7 +1,10 @@
 """
 Answer generation and evaluation API routes
 """
-from fastapi import APIRouter, HTTPException
+import json
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from api.models.schemas import (
     GenerateAnswerRequest,
     GenerateAnswerResponse,
@@ -9,28 +12,46 @@ from api.models.schemas import (
     EvaluateAnswerResponse,
     AnswerScores
 )
-from src.llm_service import LLMService
+from api.dependencies import get_answer_store, get_evaluator, get_llm_service
+from src.llm_service import LLMService, is_behavioral_question
 from src.answer_evaluator import AnswerEvaluator
+from src.answer_store import AnswerStore
 
 router = APIRouter()
 
-# Initialize services
-llm_service = LLMService()
-evaluator = AnswerEvaluator()
+
+def _stored_answer(request: GenerateAnswerRequest, answer_store: Optional[AnswerStore]):
+    """Precomputed answer for a curated question, when no job context applies"""
+    if answer_store is None or request.job_context:
+        return None
+    return answer_store.get(request.question, request.hints)
+
+
+def _sse_event(event: str, data) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
 
 @router.post("/generate-answer", response_model=GenerateAnswerResponse)
-async def generate_answer(request: GenerateAnswerRequest):
+async def generate_answer(
+    request: GenerateAnswerRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+    answer_store: Optional[AnswerStore] = Depends(get_answer_store)
+):
     """
     Generate an AI model answer for a given interview question.
     """
     try:
         # Check if it's a behavioral question (for STAR method)
-        behavioral_keywords = ["tell me about", "describe a time", "give an example"]
-        use_star = any(keyword in request.question.lower() for keyword in behavioral_keywords)
+        use_star = is_behavioral_question(request.question)
+        
+        # Serve curated questions from the precomputed store
+        stored = _stored_answer(request, answer_store)
+        if stored is not None:
+            return GenerateAnswerResponse(answer=stored, formatted=use_star)
         
         # Generate answer
-        answer = llm_service.generate_answer(
+        answer = await llm_service.generate_answer(
             question=request.question,
             job_context=request.job_context,
             answer_hints=request.hints,
@@ -46,20 +67,72 @@ async def generate_answer(request: GenerateAnswerRequest):
         raise HTTPException(status_code=500, detail=f"Answer generation failed: {str(e)}")
 
 
+@router.post("/generate-answer/stream")
+async def generate_answer_stream(
+    request: GenerateAnswerRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+    answer_store: Optional[AnswerStore] = Depends(get_answer_store)
+):
+    """
+    Stream a model answer over Server-Sent Events.
+    
+    Events: "token" (raw text delta), "field" (a completed answer field such
+    as summary or key_points), "done" (the full GenerateAnswerResponse) and
+    "error".
+    """
+    use_star = is_behavioral_question(request.question)
+    
+    async def event_stream():
+        stored = _stored_answer(request, answer_store)
+        if stored is not None:
+            for name, value in stored.items():
+                yield _sse_event("field", {"name": name, "value": value})
+            response = GenerateAnswerResponse(answer=stored, formatted=use_star)
+            yield _sse_event("done", response.model_dump())
+            return
+        
+        try:
+            async for event, data in llm_service.stream_answer(
+                question=request.question,
+                job_context=request.job_context,
+                answer_hints=request.hints,
+                use_star_method=use_star
+            ):
+                if event == "answer":
+                    response = GenerateAnswerResponse(answer=data, formatted=use_star)
+                    yield _sse_event("done", response.model_dump())
+                else:
+                    yield _sse_event(event, data)
+        except Exception as e:
+            yield _sse_event("error", {"detail": f"Answer generation failed: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/evaluate-answer", response_model=EvaluateAnswerResponse)
-async def evaluate_answer(request: EvaluateAnswerRequest):
+async def evaluate_answer(
+    request: EvaluateAnswerRequest,
+    evaluator: AnswerEvaluator = Depends(get_evaluator)
+):
     """
     Evaluate a user's answer and provide detailed feedback.
+    The attempt is recorded in the shared progress tracker.
     """
     try:
         # Perform comprehensive evaluation
-        evaluation = evaluator.evaluate_comprehensive(
+        evaluation = await evaluator.evaluate_comprehensive(
             question=request.question,
             user_answer=request.user_answer,
             category=request.category,
             difficulty=request.difficulty,
-            ideal_answer=request.model_answer
+            ideal_answer=request.model_answer,
+            mode=request.evaluation_mode
         )
+        evaluator.record_practice(request.question, request.category, request.difficulty, evaluation)
         
         # Extract scores
         scores = AnswerScores(
@@ -73,8 +146,9 @@ async def evaluate_answer(request: EvaluateAnswerRequest):
         return EvaluateAnswerResponse(
             scores=scores,
             strengths=evaluation.get("strengths", []),
+            weaknesses=evaluation.get("weaknesses", []),
             improvements=evaluation.get("improvements", []),
-            follow_up_questions=evaluation.get("follow_up_questions", []),
+            follow_up_questions=evaluation.get("followup_questions", []),
             feedback=evaluation.get("feedback", "")
         )
     
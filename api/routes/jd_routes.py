@@ -1,10 +1,13 @@
 """
 Job Description Analysis API routes
 """
-from fastapi import APIRouter, HTTPException, UploadFile, File
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from pydantic import BaseModel
+from api.dependencies import get_jd_analyzer, get_jd_cache, get_vector_store
 from api.models.schemas import JobDescriptionRequest, JobDescriptionResponse
 from src.jd_analyzer import JDAnalyzer
+from src.jd_cache import JDResultCache
 from src.vector_store import VectorStore
 from src.content_extractor import ContentExtractor
 from config.config import Config
@@ -15,44 +18,73 @@ router = APIRouter()
 class URLRequest(BaseModel):
     url: str
 
-# Initialize services
-jd_analyzer = JDAnalyzer()
-vector_store = VectorStore()
 
-
-@router.post("/analyze-jd", response_model=JobDescriptionResponse)
-async def analyze_job_description(request: JobDescriptionRequest):
-    """
-    Analyze a job description and return extracted skills, requirements,
-    and matched interview questions.
-    """
-    try:
-        # Analyze job description
-        analysis = jd_analyzer.analyze(request.job_description)
+async def _analyze(
+    job_description: str,
+    jd_analyzer: JDAnalyzer,
+    vector_store: VectorStore,
+    jd_cache: JDResultCache
+) -> JobDescriptionResponse:
+    """Analyze a job description and match questions, reusing a cached result for the same posting"""
+    generation = vector_store.generation
+    result = jd_cache.get(job_description, generation)
+    if result is None:
+        analysis = await jd_analyzer.analyze(job_description)
         
         # Generate search query for relevant questions
         search_query = jd_analyzer.generate_search_query(analysis)
         
-        # Find matched questions
-        matched_questions = vector_store.search_questions(
+        # Find matched questions (off the event loop: queries may be encoded)
+        matched_questions = await asyncio.to_thread(
+            vector_store.search_questions,
             query=search_query,
             n_results=10
         )
         
-        return JobDescriptionResponse(
-            analysis=analysis,
-            summary=f"Position: {analysis.get('job_role', 'Not specified')}. "
-                   f"Level: {analysis.get('experience_level', 'Not specified')}. "
-                   f"Key skills: {', '.join(analysis.get('required_skills', [])[:5])}",
-            matched_questions=matched_questions
-        )
+        result = {
+            "analysis": analysis,
+            "search_query": search_query,
+            "matched_questions": matched_questions
+        }
+        # A failed LLM step leaves only defaults; retry it next time instead of caching them
+        if analysis.get("analysis_complete", True):
+            jd_cache.set(job_description, result, generation)
+    
+    analysis = result["analysis"]
+    return JobDescriptionResponse(
+        analysis=analysis,
+        summary=f"Position: {analysis.get('job_role', 'Not specified')}. "
+               f"Level: {analysis.get('experience_level', 'Not specified')}. "
+               f"Key skills: {', '.join(analysis.get('required_skills', [])[:5])}",
+        matched_questions=result["matched_questions"]
+    )
+
+
+@router.post("/analyze-jd", response_model=JobDescriptionResponse)
+async def analyze_job_description(
+    request: JobDescriptionRequest,
+    jd_analyzer: JDAnalyzer = Depends(get_jd_analyzer),
+    vector_store: VectorStore = Depends(get_vector_store),
+    jd_cache: JDResultCache = Depends(get_jd_cache)
+):
+    """
+    Analyze a job description and return extracted skills, requirements,
+    and matched interview questions.
+    """
+    try:
+        return await _analyze(request.job_description, jd_analyzer, vector_store, jd_cache)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
 @router.post("/analyze-jd-file", response_model=JobDescriptionResponse)
-async def analyze_job_description_file(file: UploadFile = File(...)):
+async def analyze_job_description_file(
+    file: UploadFile = File(...),
+    jd_analyzer: JDAnalyzer = Depends(get_jd_analyzer),
+    vector_store: VectorStore = Depends(get_vector_store),
+    jd_cache: JDResultCache = Depends(get_jd_cache)
+):
     """
     Analyze a job description from an uploaded PDF or DOCX file
     """
@@ -86,21 +118,8 @@ async def analyze_job_description_file(file: UploadFile = File(...)):
                 detail="Could not extract sufficient content from the file"
             )
         
-        # Analyze job description (same as text endpoint)
-        analysis = jd_analyzer.analyze(job_description)
-        search_query = jd_analyzer.generate_search_query(analysis)
-        matched_questions = vector_store.search_questions(
-            query=search_query,
-            n_results=10
-        )
-        
-        return JobDescriptionResponse(
-            analysis=analysis,
-            summary=f"Position: {analysis.get('job_role', 'Not specified')}. "
-                   f"Level: {analysis.get('experience_level', 'Not specified')}. "
-                   f"Key skills: {', '.join(analysis.get('required_skills', [])[:5])}",
-            matched_questions=matched_questions
-        )
+        # Analyze job description (same as text endpoint, and the same cache)
+        return await _analyze(job_description, jd_analyzer, vector_store, jd_cache)
     
     except HTTPException:
         raise
@@ -111,7 +130,12 @@ async def analyze_job_description_file(file: UploadFile = File(...)):
 
 
 @router.post("/analyze-jd-url", response_model=JobDescriptionResponse)
-async def analyze_job_description_url(request: URLRequest):
+async def analyze_job_description_url(
+    request: URLRequest,
+    jd_analyzer: JDAnalyzer = Depends(get_jd_analyzer),
+    vector_store: VectorStore = Depends(get_vector_store),
+    jd_cache: JDResultCache = Depends(get_jd_cache)
+):
     """
     Analyze a job description from a web page URL
     """
@@ -129,21 +153,8 @@ async def analyze_job_description_url(request: URLRequest):
                 detail="Could not extract sufficient content from the URL"
             )
         
-        # Analyze job description (same as text endpoint)
-        analysis = jd_analyzer.analyze(job_description)
-        search_query = jd_analyzer.generate_search_query(analysis)
-        matched_questions = vector_store.search_questions(
-            query=search_query,
-            n_results=10
-        )
-        
-        return JobDescriptionResponse(
-            analysis=analysis,
-            summary=f"Position: {analysis.get('job_role', 'Not specified')}. "
-                   f"Level: {analysis.get('experience_level', 'Not specified')}. "
-                   f"Key skills: {', '.join(analysis.get('required_skills', [])[:5])}",
-            matched_questions=matched_questions
-        )
+        # Analyze job description (same as text endpoint, and the same cache)
+        return await _analyze(job_description, jd_analyzer, vector_store, jd_cache)
     
     except HTTPException:
         raise
@@ -154,12 +165,16 @@ async def analyze_job_description_url(request: URLRequest):
 
 
 @router.post("/explain-term")
-async def explain_term(term: str, context: str = None):
+async def explain_term(
+    term: str,
+    context: str = None,
+    jd_analyzer: JDAnalyzer = Depends(get_jd_analyzer)
+):
     """
     Explain a technical term in simple language.
     """
     try:
-        explanation = jd_analyzer.explain_term(term, context)
+        explanation = await jd_analyzer.explain_term(term, context)
         return explanation
     
     except Exception as e:
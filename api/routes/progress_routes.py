@@ -1,26 +1,24 @@
 """
 Progress tracking API routes
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from api.dependencies import get_progress_tracker
 from api.models.schemas import ProgressResponse, ProgressStats, PracticeEntry
-from src.answer_evaluator import AnswerEvaluator
+from src.answer_evaluator import ProgressTracker
 from typing import List
 from datetime import datetime
 
 router = APIRouter()
 
-# Initialize evaluator (handles progress tracking)
-evaluator = AnswerEvaluator()
-
 
 @router.get("/progress", response_model=ProgressResponse)
-async def get_progress():
+async def get_progress(progress_tracker: ProgressTracker = Depends(get_progress_tracker)):
     """
     Get user's practice statistics and progress.
     """
     try:
-        # Get stats from evaluator
-        stats_data = evaluator.get_statistics()
+        # Get stats from the shared tracker
+        stats_data = progress_tracker.get_statistics()
         
         # Format practice history
         recent_practices = []
@@ -68,12 +66,12 @@ async def get_progress():
 
 
 @router.delete("/progress")
-async def reset_progress():
+async def reset_progress(progress_tracker: ProgressTracker = Depends(get_progress_tracker)):
     """
     Reset all progress data (for testing/demo purposes).
     """
     try:
-        evaluator.reset_statistics()
+        progress_tracker.reset_statistics()
         return {"message": "Progress data reset successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to reset progress: {str(e)}")
@@ -1,21 +1,44 @@
 """
 Question retrieval API routes
 """
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional
+from api.dependencies import get_question_bank, get_services, ServiceContainer
 from api.models.schemas import QuestionListResponse, Question
-from src.vector_store import VectorStore
-import json
+from src.question_bank_manager import QuestionBankSnapshot
 
 router = APIRouter()
 
-# Initialize vector store
-vector_store = VectorStore()
 
-# Load questions database
-with open("data/interview_questions.json", "r", encoding="utf-8") as f:
-    questions_data = json.load(f)
-    questions_db = questions_data.get("questions", [])
+def _parse_cursor(cursor: Optional[str], bank: QuestionBankSnapshot) -> Optional[int]:
+    """
+    Position encoded in a next_cursor value ("<generation>.<position>")
+    
+    Positions are only meaningful within one version of the bank, so a
+    cursor issued before a reload is rejected instead of skipping or
+    repeating questions.
+    """
+    if cursor is None:
+        return None
+    try:
+        generation, position = (int(part) for part in cursor.split("."))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if generation != bank.generation:
+        raise HTTPException(status_code=410, detail="Question bank was reloaded; restart from the first page")
+    return position
+
+
+def _question(position: int, q: dict) -> Question:
+    hints = q.get("answer_hints", "")
+    return Question(
+        id=str(position),
+        question=q.get("question", ""),
+        category=q.get("category", "General"),
+        difficulty=q.get("difficulty", "Medium"),
+        hints=[hints] if isinstance(hints, str) else hints
+    )
 
 
 @router.get("/questions", response_model=QuestionListResponse)
@@ -23,15 +46,29 @@ async def get_questions(
     category: Optional[str] = Query(None, description="Filter by category"),
     difficulty: Optional[str] = Query(None, description="Filter by difficulty"),
     search: Optional[str] = Query(None, description="Semantic search query"),
-    limit: int = Query(10, ge=1, le=200, description="Number of results")
+    limit: int = Query(10, ge=1, le=200, description="Number of results"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    services: ServiceContainer = Depends(get_services),
+    bank: QuestionBankSnapshot = Depends(get_question_bank)
 ):
     """
     Retrieve interview questions with optional filtering and semantic search.
+    Filtered listings are paginated: pass next_cursor back as cursor to get
+    the following page, and total is the number of matching questions.
     """
+    after = _parse_cursor(cursor, bank)
     try:
         if search:
-            # Semantic search using vector store
-            results = vector_store.search_questions(query=search, n_results=limit)
+            # Semantic search using vector store; in a worker thread because the
+            # first use builds the store (client, encoder, sync) and queries encode
+            results = await asyncio.to_thread(
+                lambda: services.vector_store.search_questions(
+                    query=search,
+                    n_results=limit,
+                    category=category,
+                    difficulty=difficulty
+                )
+            )
             questions = [
                 Question(
                     id=r.get("id", str(i)),
@@ -42,33 +79,14 @@ async def get_questions(
                 )
                 for i, r in enumerate(results)
             ]
-        else:
-            # Filter questions by category and/or difficulty
-            filtered = questions_db.copy()
-            
-            if category:
-                filtered = [q for q in filtered if q.get("category", "").lower() == category.lower()]
-            
-            if difficulty:
-                filtered = [q for q in filtered if q.get("difficulty", "").lower() == difficulty.lower()]
-            
-            # Limit results
-            filtered = filtered[:limit]
-            
-            questions = [
-                Question(
-                    id=str(i),
-                    question=q.get("question", ""),
-                    category=q.get("category", "General"),
-                    difficulty=q.get("difficulty", "Medium"),
-                    hints=[q.get("answer_hints", "")] if isinstance(q.get("answer_hints"), str) else q.get("answer_hints", [])
-                )
-                for i, q in enumerate(filtered)
-            ]
+            return QuestionListResponse(questions=questions, total=len(questions))
         
+        # Page through the precomputed category/difficulty posting list
+        positions, next_position = bank.filters.page(limit, category, difficulty, after)
         return QuestionListResponse(
-            questions=questions,
-            total=len(questions)
+            questions=[_question(i, bank.questions[i]) for i in positions.tolist()],
+            total=bank.filters.count(category, difficulty),
+            next_cursor=None if next_position is None else f"{bank.generation}.{next_position}"
         )
     
     except Exception as e:
@@ -76,39 +94,35 @@ async def get_questions(
 
 
 @router.get("/questions/{question_id}")
-async def get_question_by_id(question_id: str):
+async def get_question_by_id(
+    question_id: str,
+    bank: QuestionBankSnapshot = Depends(get_question_bank)
+):
     """
     Get a specific question by ID.
     """
     try:
         question_idx = int(question_id)
-        if 0 <= question_idx < len(questions_db):
-            q = questions_db[question_idx]
-            answer_hints = q.get("answer_hints", "")
-            return Question(
-                id=question_id,
-                question=q.get("question", ""),
-                category=q.get("category", "General"),
-                difficulty=q.get("difficulty", "Medium"),
-                hints=[answer_hints] if isinstance(answer_hints, str) else answer_hints
-            )
+        if 0 <= question_idx < len(bank.questions):
+            return _question(question_idx, bank.questions[question_idx])
         else:
             raise HTTPException(status_code=404, detail="Question not found")
     
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid question ID")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/categories")
-async def get_categories():
+async def get_categories(bank: QuestionBankSnapshot = Depends(get_question_bank)):
     """
     Get list of all question categories.
     """
     try:
-        # Get unique categories from questions
-        categories = list(set(q.get("category", "General") for q in questions_db if isinstance(q, dict)))
-        return {"categories": sorted(categories)}
+        # Precomputed when the bank snapshot is built
+        return {"categories": bank.categories}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve categories: {str(e)}")
@@ -0,0 +1,34 @@
+"""
+System and runtime statistics API routes
+"""
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from api.dependencies import get_services, ServiceContainer
+from src.llm_service import get_response_cache, inflight_requests, rate_limiter
+
+router = APIRouter()
+
+
+@router.get("/stats")
+async def get_system_stats(services: ServiceContainer = Depends(get_services)):
+    """
+    Get runtime statistics such as LLM cache hit rates, coalesced calls
+    and rate limiter queue depth. Search cache stats appear once the
+    vector store has been built.
+    """
+    try:
+        cache = get_response_cache()
+        answer_store = services.answer_store
+        vector_store = services.loaded_vector_store
+        return {
+            # Counts SQLite rows, so it runs off the event loop
+            "llm_cache": await asyncio.to_thread(cache.get_stats) if cache else {"enabled": False},
+            "llm_coalescing": inflight_requests.get_stats(),
+            "llm_rate_limiter": rate_limiter.get_stats(),
+            "answer_store": answer_store.get_stats() if answer_store else {"enabled": False},
+            "question_bank": services.question_bank.get_stats(),
+            "search_cache": vector_store.get_cache_stats() if vector_store else {"loaded": False},
+            "jd_cache": services.jd_cache.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve stats: {str(e)}")
@@ -0,0 +1,84 @@
+"""
+API Throughput Benchmark
+Drives the FastAPI app in-process against the fake LLM provider, so server
+overhead can be measured without network access or Groq quota.
+
+Usage:
+    python benchmarks/api_throughput.py --requests 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Must be set before the app (and Config) are imported
+os.environ.setdefault("LLM_PROVIDER", "fake")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("LLM_RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("WARMUP_ON_STARTUP", "false")
+
+import httpx  # noqa: E402
+from api.main import app  # noqa: E402
+
+ENDPOINTS = {
+    "generate-answer": lambda i: {
+        "question": f"Explain benchmark topic number {i}.",
+        "category": "Python",
+        "difficulty": "Medium"
+    },
+    "evaluate-answer": lambda i: {
+        "question": f"Explain benchmark topic number {i}.",
+        "user_answer": "It is a concept used to structure programs. For example, in a web service.",
+        "category": "Python",
+        "difficulty": "Medium"
+    },
+}
+
+
+async def run(endpoint: str, total: int, concurrency: int):
+    """Send total requests with at most concurrency in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+    
+    # ASGITransport does not send lifespan events, so enter the lifespan here
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), \
+            httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def one(i: int):
+            nonlocal failures
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post(f"/api/{endpoint}", json=ENDPOINTS[endpoint](i))
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    failures += 1
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    print(f"{endpoint}: {total} requests, concurrency {concurrency}, {failures} failed")
+    print(f"  throughput: {total / elapsed:.1f} req/s over {elapsed:.2f}s")
+    print(f"  latency p50={statistics.median(latencies) * 1000:.0f}ms "
+          f"p95={latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f}ms "
+          f"max={latencies[-1] * 1000:.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="generate-answer")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.endpoint, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Dense Index Recall Benchmark
+Compares IVF search against exact search at several nprobe settings, so
+DENSE_IVF_NPROBE (and --nlist at build time) can be picked from data.
+
+Usage:
+    python benchmarks/dense_recall.py --questions data/interview_questions.json
+    python benchmarks/dense_recall.py --synthetic 200000 --int8 --nprobe 1 4 8 16 32
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Only local files are used; no LLM calls are made
+os.environ.setdefault("LLM_PROVIDER", "fake")
+
+from config.config import Config  # noqa: E402
+from src.dense_index import DenseIndex, write_dense_index  # noqa: E402
+
+
+def synthetic_bank(count: int, dim: int, seed: int = 0):
+    """Clustered random unit vectors standing in for a large generated bank"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(count // 400, 1), dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), count)]
+    vectors += 0.6 * rng.normal(size=(count, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    questions = [
+        {"question": f"Synthetic question {i}", "category": Config.CATEGORIES[i % len(Config.CATEGORIES)],
+         "difficulty": Config.DIFFICULTY_LEVELS[i % 3]}
+        for i in range(count)
+    ]
+    queries = vectors[rng.integers(0, count, 200)] + 0.4 * rng.normal(size=(200, dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    return vectors, questions, queries
+
+
+def question_bank(path: Path, model_name: str):
+    """Embed a question bank; queries are the bare question texts (documents add keywords)"""
+    from src.embeddings import encode, question_document
+    
+    with open(path, "r", encoding="utf-8") as f:
+        questions = json.load(f).get("questions", [])
+    vectors = encode([question_document(q) for q in questions], model_name)
+    sample = np.random.default_rng(0).choice(len(questions), min(200, len(questions)), replace=False)
+    queries = encode([questions[i]["question"] for i in sample], model_name)
+    return vectors, questions, queries
+
+
+def measure(index: DenseIndex, queries: np.ndarray, k: int, category: str = None):
+    """Run every query; return (result question texts, latencies in seconds)"""
+    results, latencies = [], []
+    for query in queries:
+        started = time.perf_counter()
+        hits = index.search(query, k, category=category)
+        latencies.append(time.perf_counter() - started)
+        results.append({hit["question"] for hit in hits})
+    return results, latencies
+
+
+def report(label: str, latencies, recall: float = None):
+    latencies = sorted(latencies)
+    line = (f"{label:<14} p50={statistics.median(latencies) * 1000:7.2f}ms "
+            f"p95={latencies[int(len(latencies) * 0.95) - 1] * 1000:7.2f}ms")
+    if recall is not None:
+        line += f"  recall={recall:.3f}"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=Path, default=Config.QUESTIONS_FILE)
+    parser.add_argument("--synthetic", type=int, default=0, help="Use N random vectors instead of --questions")
+    parser.add_argument("--dim", type=int, default=384, help="Dimension of synthetic vectors")
+    parser.add_argument("--model", default=Config.EMBEDDING_MODEL)
+    parser.add_argument("--int8", action="store_true", help="Benchmark the int8 storage format")
+    parser.add_argument("--nlist", type=int, default=-1, help="IVF lists (default ~4*sqrt(n))")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--category", help="Also apply this category filter")
+    args = parser.parse_args()
+    
+    if args.synthetic:
+        vectors, questions, queries = synthetic_bank(args.synthetic, args.dim)
+    else:
+        vectors, questions, queries = question_bank(args.questions, args.model)
+    storage = "int8" if args.int8 else "float32"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        exact_dir, ivf_dir = Path(tmp) / "exact", Path(tmp) / "ivf"
+        write_dense_index(vectors, questions, exact_dir, args.model)
+        
+        started = time.perf_counter()
+        write_dense_index(vectors, questions, ivf_dir, args.model, storage, nlist=args.nlist)
+        build_time = time.perf_counter() - started
+        
+        exact = DenseIndex(exact_dir)
+        ivf = DenseIndex(ivf_dir)
+        print(f"{len(questions)} questions, {len(queries)} queries, k={args.k}, "
+              f"index {ivf.kind}, built in {build_time:.1f}s")
+        
+        truth, latencies = measure(exact, queries, args.k, args.category)
+        report("exact", latencies)
+        
+        for nprobe in args.nprobe:
+            ivf.nprobe = nprobe
+            found, latencies = measure(ivf, queries, args.k, args.category)
+            recall = sum(len(f & t) for f, t in zip(found, truth)) / max(sum(len(t) for t in truth), 1)
+            report(f"nprobe={nprobe}", latencies, recall)
+
+
+if __name__ == "__main__":
+    main()
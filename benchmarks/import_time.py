@@ -0,0 +1,102 @@
+"""
+Cold Start Benchmark
+Measures how long a fresh interpreter takes to import the API, how much the
+heavy optional dependencies would add if they were imported eagerly, and
+how long uvicorn takes to answer /health.
+
+Usage:
+    python benchmarks/import_time.py --runs 5
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Imported lazily by the app; listed here to show what eager imports cost
+HEAVY_MODULES = ["groq", "PyPDF2", "docx", "bs4", "requests", "chromadb", "sentence_transformers"]
+
+
+def child_env() -> dict:
+    env = dict(os.environ)
+    env.setdefault("LLM_PROVIDER", "fake")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def time_import(statement: str, runs: int) -> float:
+    """Median wall time of running statement in a fresh interpreter"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=ROOT, env=child_env(), check=True)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def installed(module: str) -> bool:
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module}"], cwd=ROOT, env=child_env(), capture_output=True
+    )
+    return result.returncode == 0
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def time_to_healthy(timeout: float = 60) -> float:
+    """Seconds from launching uvicorn until /health returns 200"""
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=child_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError("server did not become healthy")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    
+    baseline = time_import("pass", args.runs)
+    app_import = time_import("import api.main", args.runs)
+    print(f"interpreter startup:         {baseline * 1000:7.0f}ms")
+    print(f"import api.main:             {app_import * 1000:7.0f}ms")
+    
+    heavy = [m for m in HEAVY_MODULES if installed(m)]
+    if heavy:
+        eager = time_import(f"import api.main, {', '.join(heavy)}", args.runs)
+        print(f"  + eager {', '.join(heavy)}:")
+        print(f"                             {eager * 1000:7.0f}ms")
+    missing = sorted(set(HEAVY_MODULES) - set(heavy))
+    if missing:
+        print(f"  (not installed, not measured: {', '.join(missing)})")
+    
+    healthy = statistics.median(time_to_healthy() for _ in range(args.runs))
+    print(f"uvicorn launch to /health:   {healthy * 1000:7.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Worker Memory Benchmark
+Starts several worker processes that each load a (synthetically enlarged)
+question bank, either privately or by attaching to the shared compiled
+bank, and reports every worker's private memory (USS) and proportional
+share (PSS) from /proc/<pid>/smaps_rollup. Linux only.
+
+Usage:
+    python benchmarks/worker_memory.py --copies 500 --workers 4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+WORKER = """
+import sys, time
+from src.question_bank_manager import QuestionBankManager
+manager = QuestionBankManager(sys.argv[1], poll_interval=0, shared_dir=sys.argv[2] or None)
+# Touch the index the way requests do, so mapped pages are actually read
+index = manager.snapshot.keyword_index
+for query in ("python decorators", "system design cache", "sql index join"):
+    index.search(query, 10, category="Python")
+print(len(manager.snapshot), flush=True)
+time.sleep(3600)
+"""
+
+
+def enlarged_bank(copies: int, path: Path) -> int:
+    """Write copies of the real bank, each question made unique, to path"""
+    with open(ROOT / "data" / "interview_questions.json", "r", encoding="utf-8") as f:
+        questions = json.load(f)["questions"]
+    enlarged = [
+        dict(q, question=f"{q['question']} (variant {i})")
+        for i in range(copies) for q in questions
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"questions": enlarged}, f)
+    return len(enlarged)
+
+
+def memory_kb(pid: int) -> dict:
+    """Private (USS) and proportional (PSS) memory of a process in kB"""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        "pss": fields.get("Pss", 0)
+    }
+
+
+def run(bank: Path, workers: int, shared_dir: str) -> list:
+    env = dict(os.environ, LLM_PROVIDER=os.environ.get("LLM_PROVIDER", "fake"))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    processes = []
+    try:
+        # Like a process manager forking workers: all start at once
+        for _ in range(workers):
+            processes.append(subprocess.Popen(
+                [sys.executable, "-c", WORKER, str(bank), shared_dir],
+                cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ))
+        for process in processes:
+            process.stdout.readline()
+        time.sleep(0.5)
+        return [memory_kb(process.pid) for process in processes]
+    finally:
+        for process in processes:
+            process.kill()
+            process.wait()
+
+
+def report(label: str, usage: list):
+    uss = [u["uss"] / 1024 for u in usage]
+    pss = [u["pss"] / 1024 for u in usage]
+    print(f"{label:<8} USS per worker: " + " ".join(f"{m:6.1f}" for m in uss) + " MB")
+    print(f"{'':<8} PSS total: {sum(pss):7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=500, help="Copies of the bank (150 questions each)")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = Path(tmp) / "bank.json"
+        count = enlarged_bank(args.copies, bank)
+        print(f"{count} questions, {args.workers} workers")
+        report("private", run(bank, args.workers, ""))
+        report("shared", run(bank, args.workers, str(Path(tmp) / "shared")))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,25 +11,92 @@ load_dotenv()
 class Config:
     """Application configuration"""
     
-    # API Key - Groq only
+    # LLM Provider: "groq" (production) or "fake" (offline load testing)
+    LLM_PROVIDER = os.getenv("LLM_PROVIDER", "groq").lower()
+    
+    # API Key - required for the Groq provider
     GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
     
     # Model Configuration
     LLM_MODEL = os.getenv("LLM_MODEL", "llama-3.3-70b-versatile")
     TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
     
+    # LLM Client Connection Pool
+    LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+    LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))  # Seconds per request
+    
+    # Fake provider latency (milliseconds); distribution: fixed, uniform, normal, lognormal
+    FAKE_LLM_LATENCY_MS = float(os.getenv("FAKE_LLM_LATENCY_MS", "800"))
+    FAKE_LLM_JITTER_MS = float(os.getenv("FAKE_LLM_JITTER_MS", "200"))
+    FAKE_LLM_LATENCY_DISTRIBUTION = os.getenv("FAKE_LLM_LATENCY_DISTRIBUTION", "lognormal")
+    FAKE_LLM_SEED = int(os.getenv("FAKE_LLM_SEED", "42"))
+    
+    # Client-side rate limiting (defaults match the Groq free tier for llama-3.3-70b)
+    LLM_RATE_LIMIT_ENABLED = os.getenv("LLM_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "30"))
+    LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "12000"))
+    LLM_RATE_LIMIT_HEADROOM = float(os.getenv("LLM_RATE_LIMIT_HEADROOM", "0.9"))  # Fraction of the limits to use
+    LLM_RATE_LIMIT_RETRIES = int(os.getenv("LLM_RATE_LIMIT_RETRIES", "2"))  # Retries after a 429
+    LLM_RATE_LIMIT_BACKOFF = float(os.getenv("LLM_RATE_LIMIT_BACKOFF", "5"))  # Seconds, if no Retry-After
+    TOKENIZER_ENCODING = os.getenv("TOKENIZER_ENCODING", "cl100k_base")  # tiktoken encoding for estimates
+    
+    # LLM Response Cache (in-memory LRU backed by SQLite)
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+    # TTLs in seconds; 0 disables caching for that call type
+    LLM_CACHE_TTL_DEFAULT = float(os.getenv("LLM_CACHE_TTL_DEFAULT", "86400"))
+    LLM_CACHE_TTL_ANSWER = float(os.getenv("LLM_CACHE_TTL_ANSWER", "604800"))
+    LLM_CACHE_TTL_EXPLAIN = float(os.getenv("LLM_CACHE_TTL_EXPLAIN", "2592000"))
+    LLM_CACHE_TTL_EVALUATION = float(os.getenv("LLM_CACHE_TTL_EVALUATION", "86400"))
+    LLM_CACHE_TTL_JD_ANALYSIS = float(os.getenv("LLM_CACHE_TTL_JD_ANALYSIS", "86400"))
+    
+    # Job Description Compaction (applied before LLM analysis)
+    JD_COMPACTION_ENABLED = os.getenv("JD_COMPACTION_ENABLED", "true").lower() == "true"
+    JD_MAX_PROMPT_TOKENS = int(os.getenv("JD_MAX_PROMPT_TOKENS", "1500"))
+    
     # Vector Database
     BASE_DIR = Path(__file__).resolve().parent.parent
     CHROMA_PERSIST_DIR = os.getenv("CHROMA_PERSIST_DIR", str(BASE_DIR / "data" / "chroma_db"))
     USE_EMBEDDINGS = os.getenv("USE_EMBEDDINGS", "false").lower() == "true"  # Disable for low memory
+    # Semantic backend when embeddings are on: "chroma", or "numpy" (precomputed matrix, low memory)
+    VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "chroma").lower()
+    EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))  # Texts per encoder batch when indexing
+    DENSE_INDEX_DIR = Path(os.getenv("DENSE_INDEX_DIR", str(BASE_DIR / "data" / "dense_index")))
+    DENSE_RESCORE_FACTOR = int(os.getenv("DENSE_RESCORE_FACTOR", "4"))  # int8 index: float rescoring shortlist per result
+    DENSE_IVF_NPROBE = int(os.getenv("DENSE_IVF_NPROBE", "8"))  # IVF index: inverted lists scanned per query
+    
+    # Search caches in VectorStore (entry counts; 0 disables that level)
+    SEARCH_EMBEDDING_CACHE_SIZE = int(os.getenv("SEARCH_EMBEDDING_CACHE_SIZE", "1024"))
+    SEARCH_RESULT_CACHE_SIZE = int(os.getenv("SEARCH_RESULT_CACHE_SIZE", "512"))
+    # Complete /analyze-jd results keyed by normalized JD text (0 size disables, 0 TTL = no expiry)
+    JD_RESULT_CACHE_SIZE = int(os.getenv("JD_RESULT_CACHE_SIZE", "256"))
+    JD_RESULT_CACHE_TTL = float(os.getenv("JD_RESULT_CACHE_TTL", "86400"))
     
     # Application Settings
     MAX_QUESTIONS_PER_SESSION = int(os.getenv("MAX_QUESTIONS_PER_SESSION", "10"))
     ANSWER_MAX_TOKENS = int(os.getenv("ANSWER_MAX_TOKENS", "500"))
+    EVALUATION_TIMEOUT = float(os.getenv("EVALUATION_TIMEOUT", "20"))  # Seconds for all evaluation calls
+    EVALUATION_MODE = os.getenv("EVALUATION_MODE", "multi")  # "multi" (3 prompts) or "structured" (1 JSON prompt)
+    # Build the vector store and LLM client in the background right after startup
+    WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
     
     # Data Paths
     DATA_DIR = BASE_DIR / "data"
     QUESTIONS_FILE = DATA_DIR / "interview_questions.json"
+    # Seconds between checks for an edited question bank (hot reload); 0 disables
+    QUESTION_BANK_POLL_SECONDS = float(os.getenv("QUESTION_BANK_POLL_SECONDS", "5"))
+    # Compile the bank once into a memory-mapped file shared by all workers (multi-worker deployments)
+    QUESTION_INDEX_SHARED = os.getenv("QUESTION_INDEX_SHARED", "false").lower() == "true"
+    QUESTION_INDEX_DIR = Path(os.getenv("QUESTION_INDEX_DIR", str(DATA_DIR / "question_index")))
+    # Prebuilt bank artifact mapped at startup when present (build: python -m src.compiled_bank)
+    QUESTION_BANK_COMPILED = Path(os.getenv("QUESTION_BANK_COMPILED", str(DATA_DIR / "question_bank.bin")))
+    ANSWER_STORE_PATH = Path(os.getenv("ANSWER_STORE_PATH", str(DATA_DIR / "model_answers.json")))
+    ANSWER_STORE_ENABLED = os.getenv("ANSWER_STORE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH = Path(os.getenv("LLM_CACHE_PATH", str(DATA_DIR / "llm_cache.sqlite3")))
+    # Canonical skill names and aliases matched in job descriptions
+    SKILL_TAXONOMY_PATH = Path(os.getenv("SKILL_TAXONOMY_PATH", str(DATA_DIR / "skill_taxonomy.json")))
     
     # Supported Categories
     CATEGORIES = [
@@ -52,11 +119,12 @@ class Config:
     @classmethod
     def validate(cls):
         """Validate required configuration"""
-        if not cls.GROQ_API_KEY:
+        if cls.LLM_PROVIDER == "groq" and not cls.GROQ_API_KEY:
             raise ValueError(
                 "GROQ_API_KEY is required.\n"
                 "Get a FREE API key at: https://console.groq.com/\n"
-                "Then add it to your .env file."
+                "Then add it to your .env file.\n"
+                "(Set LLM_PROVIDER=fake to run offline without a key.)"
             )
         
         # Create necessary directories
@@ -30,6 +30,7 @@ export interface AnswerScores {
 export interface EvaluationResponse {
   scores: AnswerScores;
   strengths: string[];
+  weaknesses?: string[];
   improvements: string[];
   follow_up_questions: string[];
   feedback: string;
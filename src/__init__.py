@@ -6,10 +6,24 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __description__ = "AI-powered interview assistant using RAG and LLMs"
 
-from .vector_store import VectorStore, initialize_vector_store
-from .llm_service import LLMService
-from .jd_analyzer import JDAnalyzer
-from .answer_evaluator import AnswerEvaluator, ProgressTracker
+# Exports are resolved on first access, so importing one submodule does
+# not pull in the others (and their heavy dependencies)
+_EXPORTS = {
+    'VectorStore': '.vector_store',
+    'initialize_vector_store': '.vector_store',
+    'LLMService': '.llm_service',
+    'JDAnalyzer': '.jd_analyzer',
+    'AnswerEvaluator': '.answer_evaluator',
+    'ProgressTracker': '.answer_evaluator',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'VectorStore',
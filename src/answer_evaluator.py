@@ -2,8 +2,12 @@
 Answer Evaluator Module
 Evaluates user answers and provides structured feedback
 """
-from typing import Dict, List
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional
+from config.config import Config
 from src.llm_service import LLMService
+from src.question_bank import question_id
 
 
 class ProgressTracker:
@@ -87,18 +91,31 @@ class ProgressTracker:
 class AnswerEvaluator:
     """Evaluates and scores interview answers"""
     
-    def __init__(self):
-        """Initialize the evaluator with LLM service"""
-        self.llm_service = LLMService()
-        self.progress_tracker = ProgressTracker()
+    EVALUATION_MODES = ("multi", "structured")
     
-    def evaluate_comprehensive(
+    def __init__(
+        self,
+        llm_service: Optional[LLMService] = None,
+        progress_tracker: Optional[ProgressTracker] = None
+    ):
+        """
+        Initialize the evaluator
+        
+        Args:
+            llm_service: Shared LLM service (a new one if omitted)
+            progress_tracker: Shared progress tracker (a new one if omitted)
+        """
+        self.llm_service = llm_service or LLMService()
+        self.progress_tracker = progress_tracker or ProgressTracker()
+    
+    async def evaluate_comprehensive(
         self,
         question: str,
         user_answer: str,
         category: str,
         difficulty: str,
-        ideal_answer: str = None
+        ideal_answer: str = None,
+        mode: Optional[str] = None
     ) -> Dict:
         """
         Comprehensive evaluation of an answer
@@ -109,41 +126,156 @@ class AnswerEvaluator:
             category: Question category
             difficulty: Question difficulty
             ideal_answer: Optional reference answer
-            
+            mode: "multi" (three prompts) or "structured" (one JSON prompt);
+                defaults to Config.EVALUATION_MODE
+        
         Returns:
             Dictionary with detailed evaluation
         """
-        # Get basic evaluation from LLM
-        evaluation = self.llm_service.evaluate_answer(
-            question=question,
-            user_answer=user_answer,
-            ideal_answer=ideal_answer
-        )
+        mode = mode or Config.EVALUATION_MODE
+        if mode not in self.EVALUATION_MODES:
+            raise ValueError(f"Unknown evaluation mode: {mode}")
         
         # Calculate detailed scores
         detailed_scores = self._calculate_detailed_scores(
             question, user_answer, category, difficulty
         )
         
-        # Get improvement suggestions
-        improvements = self.llm_service.suggest_improvements(user_answer, question)
-        
-        # Generate follow-up questions
-        followups = self.llm_service.generate_followup_questions(question, user_answer)
+        if mode == "structured":
+            result = await self._evaluate_structured(
+                question, user_answer, ideal_answer, detailed_scores
+            )
+        else:
+            result = await self._evaluate_multi(
+                question, user_answer, ideal_answer, detailed_scores
+            )
         
         return {
-            "overall_score": evaluation["score"],
+            "overall_score": result["score"],
             "detailed_scores": detailed_scores,
-            "feedback": evaluation["feedback"],
-            "improvements": improvements,
-            "followup_questions": followups,
-            "strengths": self._extract_strengths(evaluation["feedback"]),
-            "weaknesses": self._extract_weaknesses(evaluation["feedback"]),
-            "grade": self._score_to_grade(evaluation["score"]),
+            "feedback": result["feedback"],
+            "improvements": result["improvements"],
+            "followup_questions": result["followup_questions"],
+            "strengths": result["strengths"],
+            "weaknesses": result["weaknesses"],
+            "grade": self._score_to_grade(result["score"]),
             "category": category,
             "difficulty": difficulty
         }
     
+    async def _evaluate_multi(
+        self,
+        question: str,
+        user_answer: str,
+        ideal_answer: Optional[str],
+        detailed_scores: Dict[str, int]
+    ) -> Dict:
+        """Evaluate with three concurrent prompts (score, improvements, follow-ups)"""
+        # Run the independent LLM sub-evaluations concurrently
+        evaluation_task = asyncio.create_task(self.llm_service.evaluate_answer(
+            question=question,
+            user_answer=user_answer,
+            ideal_answer=ideal_answer
+        ))
+        improvements_task = asyncio.create_task(
+            self.llm_service.suggest_improvements(user_answer, question)
+        )
+        followups_task = asyncio.create_task(
+            self.llm_service.generate_followup_questions(question, user_answer)
+        )
+        tasks = [evaluation_task, improvements_task, followups_task]
+        
+        # Wait up to the deadline, then drop whatever has not finished
+        _, pending = await asyncio.wait(tasks, timeout=Config.EVALUATION_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        
+        errors = [self._task_error(task) for task in tasks]
+        if all(errors):
+            raise Exception(f"All evaluation calls failed: {errors[0]}")
+        
+        if errors[0] is None:
+            evaluation = evaluation_task.result()
+        else:
+            # Fall back to the heuristic scores so the response stays usable
+            print(f"Evaluation call unavailable: {errors[0]}")
+            evaluation = self._fallback_evaluation(detailed_scores)
+        
+        return {
+            "score": evaluation["score"],
+            "feedback": evaluation["feedback"],
+            "improvements": improvements_task.result() if errors[1] is None else [],
+            "followup_questions": followups_task.result() if errors[2] is None else [],
+            "strengths": self._extract_strengths(evaluation["feedback"]),
+            "weaknesses": self._extract_weaknesses(evaluation["feedback"])
+        }
+    
+    async def _evaluate_structured(
+        self,
+        question: str,
+        user_answer: str,
+        ideal_answer: Optional[str],
+        detailed_scores: Dict[str, int]
+    ) -> Dict:
+        """Evaluate with a single structured-JSON prompt"""
+        try:
+            data = await asyncio.wait_for(
+                self.llm_service.evaluate_structured(question, user_answer, ideal_answer),
+                timeout=Config.EVALUATION_TIMEOUT
+            )
+        except Exception as e:
+            reason = "timed out" if isinstance(e, asyncio.TimeoutError) else e
+            print(f"Structured evaluation unavailable: {reason}")
+            evaluation = self._fallback_evaluation(detailed_scores)
+            return {
+                **evaluation,
+                "improvements": [],
+                "followup_questions": [],
+                "strengths": self._extract_strengths(evaluation["feedback"]),
+                "weaknesses": self._extract_weaknesses(evaluation["feedback"])
+            }
+        
+        return {
+            "score": data["score"],
+            "feedback": self._format_feedback(data),
+            "improvements": data["improvements"][:4],
+            "followup_questions": data["followup_questions"][:3],
+            "strengths": data["strengths"] or ["Good attempt at answering the question"],
+            "weaknesses": data["weaknesses"] or ["Could provide more specific examples"]
+        }
+    
+    @staticmethod
+    def _fallback_evaluation(detailed_scores: Dict[str, int]) -> Dict:
+        """Heuristic score and notice used when the LLM score is unavailable"""
+        return {
+            "score": round(sum(detailed_scores.values()) / len(detailed_scores)),
+            "feedback": "Detailed feedback is unavailable right now. Scores are estimated from answer structure."
+        }
+    
+    @staticmethod
+    def _format_feedback(data: Dict) -> str:
+        """Render structured evaluation in the same text layout as evaluate_answer"""
+        sections = [f"SCORE: {data['score']}/10"]
+        for title, key in [
+            ("STRENGTHS", "strengths"),
+            ("AREAS FOR IMPROVEMENT", "weaknesses"),
+            ("SUGGESTIONS", "improvements")
+        ]:
+            if data[key]:
+                sections.append(f"{title}:\n" + "\n".join(f"- {item}" for item in data[key]))
+        if data.get("summary"):
+            sections.append(data["summary"])
+        return "\n\n".join(sections)
+    
+    @staticmethod
+    def _task_error(task: asyncio.Task) -> Optional[str]:
+        """Describe why a sub-evaluation produced no result, or None on success"""
+        if not task.done() or task.cancelled():
+            return "timed out"
+        if task.exception() is not None:
+            return str(task.exception())
+        return None
+    
     def _calculate_detailed_scores(
         self, question: str, answer: str, category: str, difficulty: str
     ) -> Dict[str, int]:
@@ -231,21 +363,21 @@ class AnswerEvaluator:
         else:
             return "D"
     
-    def quick_score(self, question: str, user_answer: str) -> int:
+    async def quick_score(self, question: str, user_answer: str) -> int:
         """
         Quick scoring without detailed evaluation
         
         Args:
             question: The interview question
             user_answer: User's answer
-            
+        
         Returns:
             Score from 0-10
         """
-        evaluation = self.llm_service.evaluate_answer(question, user_answer)
+        evaluation = await self.llm_service.evaluate_answer(question, user_answer)
         return evaluation["score"]
     
-    def compare_answers(
+    async def compare_answers(
         self, 
         question: str, 
         answer1: str, 
@@ -258,12 +390,14 @@ class AnswerEvaluator:
             question: The interview question
             answer1: First answer
             answer2: Second answer
-            
+        
         Returns:
             Comparison results
         """
-        score1 = self.quick_score(question, answer1)
-        score2 = self.quick_score(question, answer2)
+        score1, score2 = await asyncio.gather(
+            self.quick_score(question, answer1),
+            self.quick_score(question, answer2)
+        )
         
         return {
             "answer1_score": score1,
@@ -272,6 +406,25 @@ class AnswerEvaluator:
             "score_difference": abs(score1 - score2)
         }
     
+    def record_practice(self, question: str, category: str, difficulty: str, evaluation: Dict):
+        """
+        Record an evaluated answer in the progress tracker
+        
+        Args:
+            question: The interview question
+            category: Question category
+            difficulty: Question difficulty
+            evaluation: Result of evaluate_comprehensive
+        """
+        self.progress_tracker.add_practice_entry({
+            "question_id": question_id({"question": question, "category": category}),
+            "question": question,
+            "category": category,
+            "difficulty": difficulty,
+            "score": evaluation.get("overall_score", 0.0),
+            "timestamp": datetime.now()
+        })
+    
     def get_statistics(self) -> Dict:
         """Get progress statistics from tracker"""
         return self.progress_tracker.get_statistics()
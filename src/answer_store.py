@@ -0,0 +1,254 @@
+"""
+Answer Store Module
+Versioned store of precomputed model answers for the curated question bank
+
+Build or refresh it offline with:
+    python -m src.answer_store [--concurrency 4] [--force]
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from config.config import Config
+from src.question_bank import Signature, file_signature
+
+# Bump when the answer prompt changes so every stored answer is regenerated
+ANSWER_PROMPT_VERSION = 1
+
+STORE_FORMAT_VERSION = 1
+
+_answer_store: Optional["AnswerStore"] = None
+
+
+def normalize_hints(hints: Union[str, List[str], None]) -> List[str]:
+    """Hints arrive as a string (question bank) or a list (API); compare them as a list"""
+    if not hints:
+        return []
+    if isinstance(hints, str):
+        hints = [hints]
+    return [" ".join(str(h).split()) for h in hints if str(h).strip()]
+
+
+def answer_key(question: str, hints: Union[str, List[str], None] = None) -> str:
+    """Content hash identifying a model answer for a question and its hints"""
+    payload = json.dumps(
+        [ANSWER_PROMPT_VERSION, Config.LLM_MODEL, " ".join(question.split()), normalize_hints(hints)],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnswerStore:
+    """Precomputed model answers keyed by question content hash"""
+    
+    def __init__(self, path: Path):
+        """
+        Initialize the store and load existing answers
+        
+        Args:
+            path: JSON file holding the store
+        """
+        self.path = Path(path)
+        self.version = 0
+        self.answers: Dict[str, Dict] = {}
+        # Identity of the file last loaded; refresh() reloads when it changes
+        self.signature: Signature = None
+        self.hits = 0
+        self.misses = 0
+        self.load()
+    
+    def load(self):
+        """Load answers from disk (an unreadable or outdated file is ignored)"""
+        self.signature = file_signature(self.path)
+        if self.signature is None:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: could not read answer store {self.path}: {e}")
+            return
+        if not isinstance(data, dict) or not isinstance(data.get("answers", {}), dict):
+            print(f"Warning: answer store {self.path} is not a JSON object of answers, ignoring it")
+            return
+        if data.get("format_version") != STORE_FORMAT_VERSION:
+            print("Warning: answer store format changed, ignoring existing file")
+            return
+        self.version = data.get("version", 0)
+        # One assignment, so concurrent readers see either the old or the new answers
+        self.answers = data.get("answers", {})
+    
+    def refresh(self) -> bool:
+        """
+        Reload the file if it changed since it was loaded
+        
+        Picks up answers precomputed while the server runs, including those
+        for questions added by a question bank reload.
+        
+        Returns:
+            True if the file was reloaded
+        """
+        if file_signature(self.path) == self.signature:
+            return False
+        self.load()
+        print(f"Reloaded answer store: {len(self.answers)} answers (version {self.version})")
+        return True
+    
+    def save(self):
+        """Write the store atomically and bump its version"""
+        self.version += 1
+        data = {
+            "format_version": STORE_FORMAT_VERSION,
+            "version": self.version,
+            "prompt_version": ANSWER_PROMPT_VERSION,
+            "model": Config.LLM_MODEL,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            "answers": self.answers
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self.signature = file_signature(self.path)
+    
+    def get(self, question: str, hints: Union[str, List[str], None] = None) -> Optional[Dict]:
+        """Return the stored answer for question and hints, if any"""
+        entry = self.answers.get(answer_key(question, hints))
+        if not isinstance(entry, dict) or "answer" not in entry:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["answer"]
+    
+    def put(self, question: str, hints: Union[str, List[str], None], answer: Dict):
+        """Store an answer (call save() to persist)"""
+        self.answers[answer_key(question, hints)] = {
+            "question": question,
+            "answer": answer,
+            "generated_at": datetime.now().isoformat(timespec="seconds")
+        }
+    
+    def get_stats(self) -> Dict:
+        """Get store size and hit/miss counters"""
+        return {
+            "answers": len(self.answers),
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+def get_answer_store() -> Optional[AnswerStore]:
+    """Return the shared answer store, or None when it is disabled"""
+    global _answer_store
+    if _answer_store is None and Config.ANSWER_STORE_ENABLED:
+        _answer_store = AnswerStore(Config.ANSWER_STORE_PATH)
+    return _answer_store
+
+
+async def precompute_answers(
+    store: AnswerStore,
+    questions: List[Dict],
+    concurrency: int = 4,
+    force: bool = False
+) -> Dict:
+    """
+    Generate model answers for a question bank
+    
+    Only questions whose text or hints changed since the last run (or that
+    have no answer yet) are generated; answers for questions no longer in
+    the bank are dropped.
+    
+    Args:
+        store: Answer store to fill
+        questions: Question bank entries (question, answer_hints, ...)
+        concurrency: Maximum generations in flight
+        force: Regenerate every answer
+    
+    Returns:
+        Counts of generated, unchanged, failed and removed answers
+    """
+    from src.llm_service import LLMService, is_behavioral_question
+    from src.rate_limiter import Priority
+    
+    llm_service = LLMService()
+    semaphore = asyncio.Semaphore(concurrency)
+    stats = {"generated": 0, "unchanged": 0, "failed": 0, "removed": 0}
+    
+    # The API receives hints as a list, so generate with the same prompt
+    wanted = {}
+    for q in questions:
+        hints = normalize_hints(q.get("answer_hints"))
+        wanted[answer_key(q["question"], hints)] = (q["question"], hints)
+    
+    for key in [k for k in store.answers if k not in wanted]:
+        del store.answers[key]
+        stats["removed"] += 1
+    
+    async def generate(question: str, hints: List[str]):
+        async with semaphore:
+            try:
+                answer = await llm_service.generate_answer(
+                    question=question,
+                    answer_hints=hints or None,
+                    use_star_method=is_behavioral_question(question),
+                    priority=Priority.BACKGROUND
+                )
+            except Exception as e:
+                print(f"Failed: {question[:60]}... ({e})")
+                stats["failed"] += 1
+                return
+            
+            # A plain-text fallback means the model did not return valid JSON
+            if not answer.get("key_points"):
+                print(f"Skipped unstructured answer: {question[:60]}...")
+                stats["failed"] += 1
+                return
+            
+            store.put(question, hints, answer)
+            stats["generated"] += 1
+            done = stats["generated"] + stats["failed"]
+            if done % 10 == 0:
+                print(f"Progress: {done}/{len(pending)}")
+    
+    pending = [
+        (question, hints) for key, (question, hints) in wanted.items()
+        if force or key not in store.answers
+    ]
+    stats["unchanged"] = len(wanted) - len(pending)
+    
+    try:
+        await asyncio.gather(*(generate(question, hints) for question, hints in pending))
+    finally:
+        if stats["generated"] or stats["removed"]:
+            store.save()
+    
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute model answers for the question bank")
+    parser.add_argument("--questions", type=Path, default=Config.QUESTIONS_FILE)
+    parser.add_argument("--output", type=Path, default=Config.ANSWER_STORE_PATH)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--force", action="store_true", help="Regenerate every answer")
+    args = parser.parse_args()
+    
+    with open(args.questions, "r", encoding="utf-8") as f:
+        questions = json.load(f).get("questions", [])
+    
+    store = AnswerStore(args.output)
+    stats = asyncio.run(precompute_answers(store, questions, args.concurrency, args.force))
+    print(
+        f"Answer store v{store.version}: {stats['generated']} generated, "
+        f"{stats['unchanged']} unchanged, {stats['failed']} failed, {stats['removed']} removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Cache Module
+In-memory LRU cache and the two-tier (memory + SQLite) LLM response cache
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class LRUCache:
+    """Bounded in-memory LRU cache with optional per-entry TTL"""
+    
+    def __init__(self, max_size: int, default_ttl: Optional[float] = None):
+        """
+        Initialize the cache
+        
+        Args:
+            max_size: Maximum number of entries kept before evicting the oldest
+            default_ttl: Seconds an entry stays valid (None = no expiry)
+        """
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+    
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None):
+        """Store value under key, evicting least recently used entries if full"""
+        if self.max_size <= 0:
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+class LLMResponseCache:
+    """Content-addressed LLM response cache: memory LRU in front of SQLite"""
+    
+    # Expired rows are deleted at startup and after this many disk writes
+    PURGE_EVERY_WRITES = 500
+    
+    def __init__(self, db_path: Path, max_memory_entries: int = 1000):
+        """
+        Initialize the cache
+        
+        Args:
+            db_path: SQLite file used as the persistent tier
+            max_memory_entries: Size of the in-memory LRU tier
+        """
+        self.memory = LRUCache(max_memory_entries)
+        self.disk_hits = 0
+        self.misses = 0
+        self.purged = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+            "created_at REAL NOT NULL, expires_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_expires_at ON llm_cache (expires_at)")
+        self._db.commit()
+        self.purge_expired()
+    
+    @staticmethod
+    def make_key(model: str, temperature: float, max_tokens: int, messages: List[Dict]) -> str:
+        """Hash the request parameters and whitespace-normalized messages"""
+        normalized = [
+            {
+                "role": message.get("role", "").strip().lower(),
+                "content": " ".join(str(message.get("content", "")).split())
+            }
+            for message in messages
+        ]
+        payload = json.dumps(
+            [model, round(float(temperature), 4), max_tokens, normalized],
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, checking memory first, then SQLite"""
+        response = self.memory.get(key)
+        if response is not None:
+            return response
+        return self._get_disk(key)
+    
+    async def aget(self, key: str) -> Optional[str]:
+        """
+        get() for coroutines: the memory tier is checked on the event loop,
+        the SQLite tier in a worker thread so disk I/O never blocks it
+        """
+        response = self.memory.get(key)
+        if response is not None:
+            return response
+        return await asyncio.to_thread(self._get_disk, key)
+    
+    def _get_disk(self, key: str) -> Optional[str]:
+        """Look key up in SQLite, promoting a hit to the memory tier"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        
+        if row is not None:
+            response, expires_at = row
+            if expires_at is None or expires_at > time.time():
+                self.disk_hits += 1
+                ttl = expires_at - time.time() if expires_at is not None else None
+                self.memory.set(key, response, ttl=ttl)
+                return response
+            self._delete(key)
+        
+        self.misses += 1
+        return None
+    
+    def set(self, key: str, response: str, ttl: Optional[float] = None):
+        """Store a response in both tiers (ttl in seconds, None = no expiry)"""
+        self.memory.set(key, response, ttl=ttl)
+        self._set_disk(key, response, ttl)
+    
+    async def aset(self, key: str, response: str, ttl: Optional[float] = None):
+        """set() for coroutines: the SQLite write and commit run in a worker thread"""
+        self.memory.set(key, response, ttl=ttl)
+        await asyncio.to_thread(self._set_disk, key, response, ttl)
+    
+    def _set_disk(self, key: str, response: str, ttl: Optional[float]):
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response, now, expires_at)
+            )
+            self._db.commit()
+            self._writes += 1
+            purge = self._writes % self.PURGE_EVERY_WRITES == 0
+        if purge:
+            # Rows are otherwise only removed when their key is looked up again
+            self.purge_expired()
+    
+    def _delete(self, key: str):
+        with self._lock:
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._db.commit()
+    
+    def purge_expired(self) -> int:
+        """Delete expired rows from SQLite and return how many were removed"""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)
+            )
+            self._db.commit()
+            self.purged += cursor.rowcount
+            return cursor.rowcount
+    
+    def clear(self):
+        """Remove all cached responses"""
+        self.memory.clear()
+        with self._lock:
+            self._db.execute("DELETE FROM llm_cache")
+            self._db.commit()
+    
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters for both tiers"""
+        with self._lock:
+            disk_entries = self._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        memory_hits = self.memory.hits
+        lookups = memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self.memory),
+            "disk_entries": disk_entries,
+            "memory_hits": memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "purged": self.purged,
+            "hit_rate": round((memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,367 @@
+"""
+Compiled Question Bank
+Single-file, memory-mapped question bank snapshot shared by worker processes
+
+One worker compiles the bank (question records, BM25 postings and
+category/difficulty posting lists) into a read-only file and every worker
+maps it. The pages are held once in the OS page cache however many
+workers attach, so per-worker memory stays flat as workers are added.
+
+A CURRENT pointer file names the newest build and its generation. Workers
+poll it, so after a reload they all serve the same generation (and accept
+each other's list cursors).
+
+The same format is the deployable build artifact: compile it once with
+    python -m src.compiled_bank [--embeddings]
+and the API maps it at startup (QUESTION_BANK_COMPILED) instead of parsing
+the JSON bank. With --embeddings it also carries the document embeddings
+used to fill an empty Chroma collection without loading the encoder.
+
+File layout:
+    8 bytes   magic
+    8 bytes   header length (little-endian uint64)
+    header    JSON: format version, generation, source signature and
+              SHA-256, CRC-32 of the data, counts, filter keys and a
+              table of sections
+    sections  raw little-endian arrays, each 64-byte aligned
+"""
+import argparse
+import json
+import math
+import mmap
+import os
+import re
+import zlib
+from collections.abc import Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+from config.config import Config
+from src.filter_index import FilterIndex
+from src.question_bank import Signature, file_digest, file_signature, load_question_bank
+from src.question_bank_manager import QuestionBankSnapshot
+from src.search_index import BM25Index
+
+try:
+    import fcntl
+except ImportError:  # Windows: builds are not serialized across processes
+    fcntl = None
+
+MAGIC = b"IQBANK\x00\x00"
+FORMAT_VERSION = 3
+ALIGNMENT = 64
+
+POINTER_FILE = "CURRENT"
+LOCK_FILE = ".lock"
+BUILD_PATTERN = re.compile(r"bank-(\d+)\.bin$")
+# Builds kept on disk; older ones are removed (workers still mapping them keep their pages)
+KEEP_BUILDS = 2
+
+
+class RecordList(Sequence):
+    """Question records decoded on access from a JSON-per-record byte blob"""
+    
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("question index out of range")
+        return json.loads(self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes())
+
+
+def _aligned(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_compiled_bank(
+    questions: List[Dict],
+    path: Path,
+    generation: int,
+    source_signature: Signature = None,
+    source_digest: Optional[str] = None,
+    embeddings: Optional[np.ndarray] = None,
+    embedding_model: Optional[str] = None
+):
+    """
+    Compile a question bank into one mappable file (written atomically)
+    
+    Args:
+        questions: Question bank entries
+        path: Output file
+        generation: Generation recorded in the header
+        source_signature: Signature of the JSON file the questions came from
+        source_digest: SHA-256 of that file
+        embeddings: Optional document embeddings, one row per question
+        embedding_model: Model that produced embeddings
+    """
+    index = BM25Index(questions)
+    records = [json.dumps(q, ensure_ascii=False).encode("utf-8") for q in questions]
+    record_offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum([len(r) for r in records], out=record_offsets[1:])
+    filter_keys, filter_ids, filter_offsets = index.filters.to_arrays()
+    
+    sections = {
+        "records": np.frombuffer(b"".join(records), dtype=np.uint8),
+        "record_offsets": record_offsets,
+        "vocabulary": index.vocabulary,
+        "term_offsets": index.term_offsets,
+        "doc_ids": index.doc_ids,
+        "weights": index.weights,
+        "filter_ids": filter_ids,
+        "filter_offsets": filter_offsets
+    }
+    if embeddings is not None:
+        if len(embeddings) != len(questions):
+            raise ValueError("embeddings must have one row per question")
+        sections["embeddings"] = np.asarray(embeddings, dtype=np.float32)
+    
+    table = {}
+    offset = 0
+    for name, array in sections.items():
+        offset = _aligned(offset)
+        table[name] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+        offset += array.nbytes
+    
+    # Data region exactly as it will sit on disk, padding included, for the checksum
+    data = bytearray(offset)
+    for name, array in sections.items():
+        start = table[name]["offset"]
+        data[start:start + array.nbytes] = np.ascontiguousarray(array).tobytes()
+    
+    header = json.dumps({
+        "format_version": FORMAT_VERSION,
+        "generation": generation,
+        "source_signature": list(source_signature) if source_signature else None,
+        "source_digest": source_digest,
+        "checksum": zlib.crc32(data),
+        "embedding_model": embedding_model if embeddings is not None else None,
+        "count": len(questions),
+        "k1": index.k1,
+        "b": index.b,
+        "categories": sorted({q.get("category", "General") for q in questions if isinstance(q, dict)}),
+        "filter_keys": [list(key) for key in filter_keys],
+        "sections": table
+    }).encode("utf-8")
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+    
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        f.seek(data_start)
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def open_compiled_bank(path: Path, verify: bool = True) -> QuestionBankSnapshot:
+    """
+    Map a compiled bank read-only and wrap it as a snapshot
+    
+    Nothing is parsed or rebuilt; the only pass over the data is the
+    optional checksum.
+    
+    Args:
+        path: File written by write_compiled_bank
+        verify: Check the CRC-32 of the data region
+    
+    Returns:
+        Snapshot whose records and indexes are views into the mapping
+    
+    Raises:
+        ValueError: Not a compiled bank, unsupported version, truncated or corrupt
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < len(MAGIC) + 8:
+            raise ValueError(f"Compiled question bank {path} is truncated")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    if buffer[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a compiled question bank")
+    header_length = int.from_bytes(buffer[len(MAGIC):len(MAGIC) + 8], "little")
+    header = json.loads(buffer[len(MAGIC) + 8:len(MAGIC) + 8 + header_length])
+    if header.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported compiled question bank format in {path}")
+    data_start = _aligned(len(MAGIC) + 8 + header_length)
+    if verify and zlib.crc32(memoryview(buffer)[data_start:]) != header["checksum"]:
+        raise ValueError(f"Compiled question bank {path} failed its checksum")
+    
+    arrays = {}
+    for name, spec in header["sections"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = math.prod(spec["shape"])
+        start = data_start + spec["offset"]
+        if start + count * dtype.itemsize > len(buffer):
+            raise ValueError(f"Compiled question bank {path} is truncated")
+        if count == 0:
+            arrays[name] = np.zeros(spec["shape"], dtype=dtype)
+        else:
+            arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=start).reshape(spec["shape"])
+    
+    records = RecordList(arrays["records"], arrays["record_offsets"])
+    filters = FilterIndex.from_arrays(
+        [tuple(key) for key in header["filter_keys"]],
+        arrays["filter_ids"],
+        arrays["filter_offsets"],
+        header["count"]
+    )
+    keyword_index = BM25Index.from_arrays(
+        records,
+        arrays["vocabulary"],
+        arrays["term_offsets"],
+        arrays["doc_ids"],
+        arrays["weights"],
+        filters,
+        k1=header["k1"],
+        b=header["b"]
+    )
+    signature = tuple(header["source_signature"]) if header["source_signature"] else None
+    return QuestionBankSnapshot(
+        records,
+        header["generation"],
+        signature,
+        keyword_index=keyword_index,
+        categories=header["categories"],
+        source_digest=header["source_digest"],
+        embeddings=arrays.get("embeddings"),
+        embedding_model=header["embedding_model"]
+    )
+
+
+def read_pointer(directory: Path) -> Optional[Dict]:
+    """The CURRENT pointer (format version, generation, file, source identity), or None"""
+    try:
+        with open(Path(directory) / POINTER_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_pointer(directory: Path, pointer: Dict):
+    """Atomically replace the CURRENT pointer of directory"""
+    tmp_path = directory / (POINTER_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(pointer, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, directory / POINTER_FILE)
+
+
+@contextmanager
+def build_lock(directory: Path):
+    """Exclusive lock so only one worker builds into directory at a time (also used by src.dense_index)"""
+    with open(directory / LOCK_FILE, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _remove_old_builds(directory: Path, generation: int):
+    for path in directory.iterdir():
+        match = BUILD_PATTERN.match(path.name)
+        if match and int(match.group(1)) <= generation - KEEP_BUILDS:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def publish_compiled_bank(source: Path, directory: Path, force: bool = False, min_generation: int = 0) -> Path:
+    """
+    Make sure directory holds a build of the current source file
+    
+    The first worker to notice a change compiles it; workers that arrive
+    while it holds the lock, or later, reuse that build.
+    
+    Args:
+        source: Question bank JSON file
+        directory: Shared build directory
+        force: Compile a new generation even if the current build matches
+        min_generation: Generation the caller already serves (e.g. from the
+            prebuilt artifact); builds at or below it are never reused and
+            new builds are numbered above it
+    
+    Returns:
+        Path of the current build
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with build_lock(directory):
+        signature = file_signature(source)
+        digest = file_digest(source)
+        pointer = read_pointer(directory)
+        if (
+            not force and pointer is not None and digest is not None
+            and pointer.get("format_version") == FORMAT_VERSION
+            and pointer.get("source_digest") == digest
+            and pointer.get("generation", 0) > min_generation
+            and (directory / pointer["file"]).exists()
+        ):
+            return directory / pointer["file"]
+        
+        questions = load_question_bank(source)
+        generation = max(pointer["generation"] if pointer else 0, min_generation) + 1
+        name = f"bank-{generation:06d}.bin"
+        write_compiled_bank(questions, directory / name, generation, signature, digest)
+        write_pointer(directory, {
+            "format_version": FORMAT_VERSION,
+            "generation": generation,
+            "file": name,
+            "source_signature": list(signature) if signature else None,
+            "source_digest": digest
+        })
+        _remove_old_builds(directory, generation)
+    
+    print(f"Compiled question bank: {len(questions)} questions (generation {generation})")
+    return directory / name
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the question bank into a memory-mappable artifact")
+    parser.add_argument("--questions", type=Path, default=Config.QUESTIONS_FILE)
+    parser.add_argument("--output", type=Path, default=Config.QUESTION_BANK_COMPILED)
+    parser.add_argument("--embeddings", action="store_true", help="Also store document embeddings (for Chroma)")
+    parser.add_argument("--model", default=Config.EMBEDDING_MODEL)
+    parser.add_argument("--batch-size", type=int, default=Config.EMBEDDING_BATCH_SIZE)
+    args = parser.parse_args()
+    
+    questions = load_question_bank(args.questions)
+    embeddings = None
+    if args.embeddings:
+        from src.embeddings import encode, question_document
+        embeddings = encode([question_document(q) for q in questions], args.model, args.batch_size)
+    
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    write_compiled_bank(
+        questions,
+        args.output,
+        generation=1,
+        source_signature=file_signature(args.questions),
+        source_digest=file_digest(args.questions),
+        embeddings=embeddings,
+        embedding_model=args.model if args.embeddings else None
+    )
+    open_compiled_bank(args.output)
+    print(f"Compiled question bank: {len(questions)} questions written to {args.output}"
+          f"{' (with embeddings)' if args.embeddings else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,12 @@
 """
 Document and Web Content Extractor
 Handles PDF, DOCX, and web page scraping for job descriptions
+
+The parsing and HTTP libraries are imported on first use, so importing
+this module (and the API) stays fast.
 """
 import re
 from typing import Optional
-import requests
-from bs4 import BeautifulSoup
-from PyPDF2 import PdfReader
-from docx import Document
 from io import BytesIO
 
 
@@ -25,6 +24,8 @@ class ContentExtractor:
         Returns:
             Extracted text content
         """
+        from PyPDF2 import PdfReader
+        
         try:
             pdf_file = BytesIO(file_bytes)
             pdf_reader = PdfReader(pdf_file)
@@ -51,6 +52,8 @@ class ContentExtractor:
         Returns:
             Extracted text content
         """
+        from docx import Document
+        
         try:
             docx_file = BytesIO(file_bytes)
             doc = Document(docx_file)
@@ -83,6 +86,9 @@ class ContentExtractor:
         Returns:
             Extracted text content
         """
+        import requests
+        from bs4 import BeautifulSoup
+        
         try:
             # Add headers to mimic browser
             headers = {
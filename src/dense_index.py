@@ -0,0 +1,521 @@
+"""
+Dense Index Module
+Brute-force semantic search over a memory-mapped matrix of question embeddings
+
+A low-memory alternative to ChromaDB: question embeddings are computed
+offline and searched with a single matrix-vector product. Build with:
+    python -m src.dense_index [--questions data/interview_questions.json] [--int8]
+
+With --int8 the scan runs over int8 codes with a per-vector scale (about a
+quarter of the float32 size); the float32 rows are kept on disk and only
+the top candidates are read back to rescore them exactly.
+
+With --ivf the rows are partitioned by a k-means coarse quantizer and a
+query only scans the DENSE_IVF_NPROBE lists whose centroids are closest
+(approximate search for banks of 100k+ questions). Pick nprobe with
+benchmarks/dense_recall.py.
+"""
+import argparse
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+from config.config import Config
+from src.compiled_bank import build_lock, read_pointer, write_pointer
+from src.filter_index import FilterIndex
+from src.question_bank import content_hash, load_question_bank
+from src.search_index import format_question
+
+INDEX_FORMAT_VERSION = 1
+
+META_FILE = "meta.json"
+EMBEDDINGS_FILE = "embeddings.npy"
+CODES_FILE = "codes_int8.npy"
+SCALES_FILE = "scales.npy"
+CENTROIDS_FILE = "ivf_centroids.npy"
+OFFSETS_FILE = "ivf_offsets.npy"
+RECORDS_FILE = "questions.json"
+INDEX_FILES = (META_FILE, EMBEDDINGS_FILE, CODES_FILE, SCALES_FILE, CENTROIDS_FILE, OFFSETS_FILE, RECORDS_FILE)
+
+# Each build goes to its own directory; the CURRENT pointer names the live one
+BUILD_PATTERN = re.compile(r"build-(\d+)$")
+# Builds kept on disk; older ones are removed (open indexes keep their mapped pages)
+KEEP_BUILDS = 2
+
+STORAGE_TYPES = ("float32", "int8")
+
+# Rows per block when scanning int8 codes (bounds the float32 working copy)
+SCAN_CHUNK_ROWS = 8192
+
+
+def quantize_int8(embeddings: np.ndarray):
+    """
+    Symmetric per-vector int8 quantization
+    
+    Args:
+        embeddings: float32 matrix of shape (n, dim)
+    
+    Returns:
+        (codes, scales) where embeddings[i] ~= codes[i] * scales[i]
+    """
+    max_abs = np.abs(embeddings).max(axis=1) if len(embeddings) else np.zeros(0, dtype=np.float32)
+    scales = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+    codes = np.clip(np.rint(embeddings / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales
+
+
+def index_build_path(path: Path) -> Path:
+    """Directory holding the live build of an index (path itself for the older flat layout)"""
+    pointer = read_pointer(path)
+    if pointer is None or pointer.get("format_version") != INDEX_FORMAT_VERSION:
+        return Path(path)
+    return Path(path) / pointer["dir"]
+
+
+class DenseIndex:
+    """Normalized question embeddings (float32 or int8) with cosine search"""
+    
+    def __init__(self, path: Path, rescore_factor: Optional[int] = None, nprobe: Optional[int] = None):
+        """
+        Open an index directory written by build_dense_index
+        
+        Args:
+            path: Index directory (the build named by its CURRENT pointer is opened)
+            rescore_factor: int8 only; candidates rescored in float per result
+            nprobe: IVF only; inverted lists scanned per query
+        """
+        self.path = Path(path)
+        self.build_path = index_build_path(self.path)
+        with open(self.build_path / META_FILE, 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported dense index format in {self.build_path}")
+        
+        with open(self.build_path / RECORDS_FILE, 'r', encoding='utf-8') as f:
+            self.questions: List[Dict] = json.load(f)
+        
+        self.storage = self.meta.get("storage", "float32")
+        if self.storage not in STORAGE_TYPES:
+            raise ValueError(f"Unknown dense index storage {self.storage!r} in {self.build_path}")
+        self.rescore_factor = Config.DENSE_RESCORE_FACTOR if rescore_factor is None else rescore_factor
+        
+        # Read-only mappings: pages are shared through the OS page cache, so
+        # workers opening the same index do not each hold a private copy
+        self.codes = None
+        self.scales = None
+        self.embeddings = None
+        if self.storage == "int8":
+            self.codes = np.load(self.build_path / CODES_FILE, mmap_mode='r')
+            self.scales = np.load(self.build_path / SCALES_FILE, mmap_mode='r')
+            rows = self.codes.shape[0]
+            # Float rows are optional; without them int8 scores are final
+            if (self.build_path / EMBEDDINGS_FILE).exists():
+                self.embeddings = np.load(self.build_path / EMBEDDINGS_FILE, mmap_mode='r')
+        else:
+            self.embeddings = np.load(self.build_path / EMBEDDINGS_FILE, mmap_mode='r')
+            rows = self.embeddings.shape[0]
+        if rows != len(self.questions):
+            raise ValueError(f"Dense index {self.build_path} has mismatched embeddings and questions")
+        
+        # Inverted lists: rows offsets[i]:offsets[i + 1] belong to centroid i
+        self.centroids = None
+        self.offsets = None
+        self.nprobe = Config.DENSE_IVF_NPROBE if nprobe is None else nprobe
+        if self.meta.get("ivf"):
+            self.centroids = np.load(self.build_path / CENTROIDS_FILE)
+            self.offsets = np.load(self.build_path / OFFSETS_FILE)
+            if self.offsets[-1] != rows:
+                raise ValueError(f"Dense index {self.build_path} has mismatched IVF lists")
+        
+        self.filters = FilterIndex(self.questions)
+    
+    @property
+    def model_name(self) -> str:
+        return self.meta.get("model", Config.EMBEDDING_MODEL)
+    
+    @property
+    def kind(self) -> str:
+        """Storage and search type, e.g. int8, IVF 1264 lists"""
+        if self.centroids is None:
+            return self.storage
+        return f"{self.storage}, IVF {len(self.centroids)} lists"
+    
+    def __len__(self) -> int:
+        return len(self.questions)
+    
+    def filter_rows(self, category: Optional[str] = None, difficulty: Optional[str] = None) -> Optional[np.ndarray]:
+        """Sorted rows of questions passing the filters (None when unfiltered)"""
+        if not category and not difficulty:
+            return None
+        return self.filters.lookup(category, difficulty)
+    
+    def search(
+        self,
+        query_vector: np.ndarray,
+        n_results: int = 5,
+        category: Optional[str] = None,
+        difficulty: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Return the questions most similar to a query embedding
+        
+        Args:
+            query_vector: L2-normalized query embedding
+            n_results: Number of results
+            category: Category filter (case-insensitive)
+            difficulty: Difficulty filter (case-insensitive)
+        
+        Returns:
+            Result dicts in the same shape as VectorStore.search_questions
+        """
+        allowed = self.filter_rows(category, difficulty)
+        query_vector = np.asarray(query_vector, dtype=np.float32)
+        if self.centroids is not None:
+            candidates = self._probe(query_vector, allowed, n_results)
+        else:
+            candidates = allowed
+        
+        if self.codes is None:
+            scores = self._float_scores(candidates, query_vector)
+            top = self._top(scores, n_results)
+            rows = top if candidates is None else candidates[top]
+            scores = scores[top]
+        else:
+            # Coarse pass over int8 codes, then exact rescoring of a shortlist
+            scores = self._int8_scores(candidates, query_vector)
+            shortlist = self._top(scores, n_results * max(self.rescore_factor, 1))
+            rows = shortlist if candidates is None else candidates[shortlist]
+            scores = scores[shortlist]
+            if self.embeddings is not None and len(rows):
+                scores = self.embeddings[rows] @ query_vector
+            top = self._top(scores, n_results)
+            rows, scores = rows[top], scores[top]
+        
+        results = []
+        for row, score in zip(rows, scores):
+            result = format_question(self.questions[row])
+            result["relevance_score"] = float(score)
+            results.append(result)
+        return results
+    
+    def _probe(self, query_vector: np.ndarray, allowed: Optional[np.ndarray], n_results: int) -> np.ndarray:
+        """
+        Rows of the nprobe lists nearest the query (IVF candidate set)
+        
+        Each list is a contiguous row range, so its filtered rows are a
+        slice of the sorted allowed rows. More lists are probed when
+        filters leave fewer than n_results rows.
+        """
+        lists = np.argsort(-(self.centroids @ query_vector))
+        blocks = []
+        found = 0
+        for probed, list_id in enumerate(lists):
+            if probed >= self.nprobe and found >= n_results:
+                break
+            if allowed is None:
+                rows = np.arange(self.offsets[list_id], self.offsets[list_id + 1])
+            else:
+                start, end = np.searchsorted(allowed, self.offsets[list_id:list_id + 2])
+                rows = allowed[start:end]
+            blocks.append(rows)
+            found += len(rows)
+        return np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int64)
+    
+    def _float_scores(self, candidates: Optional[np.ndarray], query_vector: np.ndarray) -> np.ndarray:
+        """Exact cosine scores for candidates (all rows when None)"""
+        if candidates is None:
+            return self.embeddings @ query_vector
+        return self.embeddings[candidates] @ query_vector
+    
+    def _int8_scores(self, candidates: Optional[np.ndarray], query_vector: np.ndarray) -> np.ndarray:
+        """Approximate cosine scores from int8 codes, scanned in blocks"""
+        total = len(self.questions) if candidates is None else len(candidates)
+        scores = np.empty(total, dtype=np.float32)
+        for start in range(0, total, SCAN_CHUNK_ROWS):
+            end = min(start + SCAN_CHUNK_ROWS, total)
+            if candidates is None:
+                block, scale = self.codes[start:end], self.scales[start:end]
+            else:
+                rows = candidates[start:end]
+                block, scale = self.codes[rows], self.scales[rows]
+            scores[start:end] = (block.astype(np.float32) @ query_vector) * scale
+        return scores
+    
+    @staticmethod
+    def _top(scores: np.ndarray, k: int) -> np.ndarray:
+        """Positions of the k highest scores, best first"""
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top], kind='stable')]
+
+
+def build_dense_index(
+    questions: List[Dict],
+    output_dir: Path,
+    model_name: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    storage: str = "float32",
+    keep_float: bool = True,
+    nlist: int = 0,
+    incremental: bool = True
+) -> Path:
+    """
+    Embed a question bank and write it as a dense index
+    
+    When output_dir already holds an index built with the same model, the
+    embeddings of questions whose content hash is unchanged are reused, so
+    only new and edited questions go through the encoder.
+    
+    Args:
+        questions: Question bank entries
+        output_dir: Index directory to (re)write
+        model_name: sentence-transformers model (defaults to Config.EMBEDDING_MODEL)
+        batch_size: Questions per encoder batch (defaults to Config.EMBEDDING_BATCH_SIZE)
+        storage: "float32" or "int8"
+        keep_float: int8 only; also write float32 rows for rescoring
+        nlist: Number of IVF lists (0 = exhaustive search, -1 = about 4 * sqrt(n))
+        incremental: Reuse embeddings of unchanged questions from output_dir
+    
+    Returns:
+        The index directory
+    """
+    model_name = model_name or Config.EMBEDDING_MODEL
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with build_lock(output_dir):
+        embeddings = _embed_questions(questions, output_dir, model_name, batch_size, incremental)
+        return _write_build(embeddings, questions, output_dir, model_name, storage, keep_float, nlist)
+
+
+def _embed_questions(
+    questions: List[Dict],
+    output_dir: Path,
+    model_name: str,
+    batch_size: Optional[int] = None,
+    incremental: bool = True
+) -> np.ndarray:
+    """Embeddings for questions, reusing those of unchanged questions in output_dir"""
+    from src.embeddings import encode, question_document
+    
+    hashes = [content_hash(q) for q in questions]
+    reusable = _reusable_embeddings(output_dir, model_name, set(hashes)) if incremental else {}
+    
+    pending = [i for i, h in enumerate(hashes) if h not in reusable]
+    encoded = encode([question_document(questions[i]) for i in pending], model_name, batch_size)
+    dim = encoded.shape[1] if len(pending) else len(next(iter(reusable.values()), ()))
+    
+    embeddings = np.zeros((len(questions), dim), dtype=np.float32)
+    for i, h in enumerate(hashes):
+        if h in reusable:
+            embeddings[i] = reusable[h]
+    if pending:
+        embeddings[pending] = encoded
+    print(f"Embedded {len(pending)} new or changed questions, reused {len(questions) - len(pending)}")
+    return embeddings
+
+
+def _matches(index: DenseIndex, hashes: List[str]) -> bool:
+    """Whether index holds exactly these questions (in any row order)"""
+    return sorted(content_hash(q) for q in index.questions) == sorted(hashes)
+
+
+def refresh_dense_index(index: DenseIndex, questions: List[Dict]) -> DenseIndex:
+    """
+    Bring an open index up to date with a (reloaded) question bank
+    
+    A new build is written with the index's own model, storage and IVF
+    settings; unchanged questions reuse their stored embeddings. When
+    several workers reload at once, the first rebuilds and the others
+    reopen its result. The old index stays usable until the caller swaps
+    in the returned one: builds are never modified once published.
+    
+    Args:
+        index: Currently open index
+        questions: Question bank entries it should contain
+    
+    Returns:
+        index itself if already current, otherwise the reopened index
+    """
+    hashes = [content_hash(q) for q in questions]
+    if _matches(index, hashes):
+        return index
+    
+    with build_lock(index.path):
+        try:
+            current = DenseIndex(index.path, index.rescore_factor, index.nprobe)
+        except (OSError, ValueError):
+            current = None
+        if current is not None and current.model_name == index.model_name and _matches(current, hashes):
+            return current
+        
+        embeddings = _embed_questions(questions, index.path, index.model_name)
+        keep_float = index.storage == "float32" or index.embeddings is not None
+        nlist = len(index.centroids) if index.centroids is not None else 0
+        _write_build(embeddings, questions, index.path, index.model_name, index.storage, keep_float, nlist)
+    return DenseIndex(index.path, index.rescore_factor, index.nprobe)
+
+
+def _reusable_embeddings(output_dir: Path, model_name: str, wanted: set) -> Dict[str, np.ndarray]:
+    """Vectors from an existing index, keyed by content hash, for the wanted hashes"""
+    try:
+        index = DenseIndex(output_dir)
+    except (OSError, ValueError):
+        return {}
+    if index.model_name != model_name:
+        return {}
+    
+    reusable = {}
+    for row, q in enumerate(index.questions):
+        h = content_hash(q)
+        if h in wanted and h not in reusable:
+            if index.embeddings is not None:
+                reusable[h] = np.array(index.embeddings[row], dtype=np.float32)
+            else:
+                reusable[h] = index.codes[row].astype(np.float32) * index.scales[row]
+    return reusable
+
+
+def write_dense_index(
+    embeddings: np.ndarray,
+    questions: List[Dict],
+    output_dir: Path,
+    model_name: str,
+    storage: str = "float32",
+    keep_float: bool = True,
+    nlist: int = 0
+) -> Path:
+    """
+    Write precomputed, L2-normalized embeddings as a dense index
+    
+    Every write goes to a fresh build directory and then switches the
+    CURRENT pointer atomically, so a reader never mixes the records of one
+    build with the vectors of another.
+    
+    With nlist > 0 the vectors are clustered with k-means and stored grouped
+    by list, so each inverted list is one contiguous block of rows.
+    
+    Args:
+        embeddings: float32 matrix of shape (len(questions), dim)
+        questions: Question bank entries, in embedding row order
+        output_dir: Index directory to (re)write
+        model_name: Model that produced the embeddings
+        storage: "float32" or "int8"
+        keep_float: int8 only; also write float32 rows for rescoring
+        nlist: Number of IVF lists (0 = exhaustive search, -1 = about 4 * sqrt(n))
+    
+    Returns:
+        The index directory
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with build_lock(output_dir):
+        return _write_build(embeddings, questions, output_dir, model_name, storage, keep_float, nlist)
+
+
+def _write_build(
+    embeddings: np.ndarray,
+    questions: List[Dict],
+    output_dir: Path,
+    model_name: str,
+    storage: str = "float32",
+    keep_float: bool = True,
+    nlist: int = 0
+) -> Path:
+    """write_dense_index for a caller already holding the build lock"""
+    if storage not in STORAGE_TYPES:
+        raise ValueError(f"Unknown storage: {storage}. Choose from {', '.join(STORAGE_TYPES)}")
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    
+    ivf_meta = None
+    if nlist and len(questions):
+        from src.ivf import assign, default_nlist, train_kmeans
+        
+        if nlist < 0:
+            nlist = default_nlist(len(questions))
+        centroids = train_kmeans(embeddings, nlist)
+        labels = assign(embeddings, centroids)
+        order = np.argsort(labels, kind='stable')
+        embeddings = embeddings[order]
+        questions = [questions[i] for i in order]
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(labels, minlength=len(centroids))))).astype(np.int64)
+        ivf_meta = {"nlist": len(centroids)}
+    
+    # Never touch a published build: write a new one, then switch the pointer
+    output_dir = Path(output_dir)
+    pointer = read_pointer(output_dir)
+    generation = (pointer.get("generation", 0) if pointer else 0) + 1
+    build_name = f"build-{generation:06d}"
+    build_dir = output_dir / build_name
+    shutil.rmtree(build_dir, ignore_errors=True)  # left over from an interrupted build
+    build_dir.mkdir(parents=True)
+    
+    if storage == "int8":
+        codes, scales = quantize_int8(embeddings)
+        np.save(build_dir / CODES_FILE, codes)
+        np.save(build_dir / SCALES_FILE, scales)
+    if storage == "float32" or keep_float:
+        np.save(build_dir / EMBEDDINGS_FILE, embeddings)
+    if ivf_meta:
+        np.save(build_dir / CENTROIDS_FILE, centroids)
+        np.save(build_dir / OFFSETS_FILE, offsets)
+    with open(build_dir / RECORDS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(questions, f, ensure_ascii=False)
+    meta = {
+        "format_version": INDEX_FORMAT_VERSION,
+        "storage": storage,
+        "model": model_name,
+        "count": len(questions),
+        "dim": int(embeddings.shape[1]) if embeddings.ndim == 2 else 0,
+        "ivf": ivf_meta
+    }
+    with open(build_dir / META_FILE, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    
+    write_pointer(output_dir, {
+        "format_version": INDEX_FORMAT_VERSION,
+        "generation": generation,
+        "dir": build_name
+    })
+    _remove_old_builds(output_dir, generation)
+    return output_dir
+
+
+def _remove_old_builds(output_dir: Path, generation: int):
+    """Delete superseded builds and files of the older flat layout"""
+    for path in output_dir.iterdir():
+        match = BUILD_PATTERN.match(path.name)
+        if match and int(match.group(1)) <= generation - KEEP_BUILDS:
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.name in INDEX_FILES:
+            path.unlink(missing_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the dense question index")
+    parser.add_argument("--questions", type=Path, default=Config.QUESTIONS_FILE)
+    parser.add_argument("--output", type=Path, default=Config.DENSE_INDEX_DIR)
+    parser.add_argument("--model", default=Config.EMBEDDING_MODEL)
+    parser.add_argument("--batch-size", type=int, default=Config.EMBEDDING_BATCH_SIZE)
+    parser.add_argument("--int8", action="store_true", help="Store int8-quantized vectors")
+    parser.add_argument("--no-float", action="store_true", help="With --int8, skip the float32 rescoring rows")
+    parser.add_argument("--ivf", action="store_true", help="Partition into k-means inverted lists")
+    parser.add_argument("--nlist", type=int, default=-1, help="With --ivf, number of lists (default ~4*sqrt(n))")
+    parser.add_argument("--full", action="store_true", help="Re-embed every question")
+    args = parser.parse_args()
+    
+    questions = load_question_bank(args.questions)
+    
+    storage = "int8" if args.int8 else "float32"
+    nlist = args.nlist if args.ivf else 0
+    build_dense_index(
+        questions, args.output, args.model, args.batch_size, storage, not args.no_float, nlist, not args.full
+    )
+    print(f"Dense index ({storage}{', IVF' if nlist else ''}): {len(questions)} questions written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
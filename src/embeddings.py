@@ -0,0 +1,64 @@
+"""
+Embeddings Module
+Shared sentence-transformers encoder for question and query embeddings
+"""
+from typing import Dict, List, Optional
+import numpy as np
+from config.config import Config
+
+_models: Dict[str, object] = {}
+
+
+def get_embedding_model(model_name: Optional[str] = None):
+    """
+    Load a sentence-transformers model once per process
+    
+    Args:
+        model_name: Model name (defaults to Config.EMBEDDING_MODEL)
+    
+    Returns:
+        SentenceTransformer instance
+    """
+    model_name = model_name or Config.EMBEDDING_MODEL
+    if model_name not in _models:
+        from sentence_transformers import SentenceTransformer
+        _models[model_name] = SentenceTransformer(model_name)
+    return _models[model_name]
+
+
+def question_document(q: Dict) -> str:
+    """Text embedded for a question: the question plus its keywords"""
+    keywords = q.get('keywords', [])
+    if isinstance(keywords, str):
+        keywords = [k.strip() for k in keywords.split(',') if k.strip()]
+    return f"{q['question']} {' '.join(keywords)}"
+
+
+def encode(texts: List[str], model_name: Optional[str] = None, batch_size: Optional[int] = None) -> np.ndarray:
+    """
+    Encode texts into L2-normalized float32 vectors
+    
+    Args:
+        texts: Texts to encode
+        model_name: Model name (defaults to Config.EMBEDDING_MODEL)
+        batch_size: Texts per forward pass (defaults to Config.EMBEDDING_BATCH_SIZE)
+    
+    Returns:
+        Array of shape (len(texts), dim); dot products are cosine similarities
+    """
+    model = get_embedding_model(model_name)
+    vectors = model.encode(
+        texts,
+        batch_size=batch_size or Config.EMBEDDING_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def encode_query(text: str, model_name: Optional[str] = None) -> np.ndarray:
+    """Encode one search query into an L2-normalized float32 vector"""
+    model = get_embedding_model(model_name)
+    vector = model.encode(text, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False)
+    return np.asarray(vector, dtype=np.float32)
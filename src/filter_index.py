@@ -0,0 +1,119 @@
+"""
+Filter Index Module
+Precomputed category/difficulty posting lists over the question bank
+"""
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+FilterKey = Tuple[Optional[str], Optional[str]]
+
+EMPTY_POSTINGS = np.zeros(0, dtype=np.int64)
+EMPTY_POSTINGS.flags.writeable = False
+
+
+def filter_value(value: Optional[str]) -> Optional[str]:
+    """Normalize a category/difficulty value; matching is case-insensitive"""
+    if value is None:
+        return None
+    return value.strip().lower() or None
+
+
+class FilterIndex:
+    """
+    Sorted question positions for every category, difficulty and
+    (category, difficulty) pair.
+    
+    All combinations are built up front (three entries per question), so a
+    filtered lookup is one dict access and never intersects or scans; the
+    caller's cost is proportional to the number of matching questions.
+    """
+    
+    def __init__(self, questions: List[Dict]):
+        """
+        Build the posting lists
+        
+        Args:
+            questions: Question bank entries, in bank order
+        """
+        postings: Dict[FilterKey, List[int]] = {}
+        for position, q in enumerate(questions):
+            category = filter_value(q.get('category', ''))
+            difficulty = filter_value(q.get('difficulty', ''))
+            for key in ((category, difficulty), (category, None), (None, difficulty)):
+                postings.setdefault(key, []).append(position)
+        
+        self.size = len(questions)
+        self.postings: Dict[FilterKey, np.ndarray] = {
+            key: np.array(ids, dtype=np.int64) for key, ids in postings.items()
+        }
+        self.postings[(None, None)] = np.arange(self.size, dtype=np.int64)
+        for ids in self.postings.values():
+            ids.flags.writeable = False
+    
+    @classmethod
+    def from_arrays(cls, keys: List[FilterKey], ids: np.ndarray, offsets: np.ndarray, size: int) -> "FilterIndex":
+        """
+        Wrap posting lists stored back to back (e.g. memory-mapped)
+        
+        Args:
+            keys: Filter key of each list, in storage order
+            ids: All lists concatenated
+            offsets: List i is ids[offsets[i]:offsets[i + 1]]
+            size: Number of questions
+        """
+        index = cls.__new__(cls)
+        index.size = size
+        index.postings = {
+            tuple(key): ids[offsets[i]:offsets[i + 1]] for i, key in enumerate(keys)
+        }
+        return index
+    
+    def to_arrays(self) -> Tuple[List[FilterKey], np.ndarray, np.ndarray]:
+        """Inverse of from_arrays: (keys, concatenated ids, offsets)"""
+        keys = list(self.postings)
+        lengths = [len(self.postings[key]) for key in keys]
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        ids = np.concatenate([self.postings[key] for key in keys]) if keys else EMPTY_POSTINGS
+        return keys, ids.astype(np.int64), offsets
+    
+    def lookup(self, category: Optional[str] = None, difficulty: Optional[str] = None) -> np.ndarray:
+        """
+        Positions of the questions matching both filters, ascending
+        
+        Args:
+            category: Category filter (None or empty = any)
+            difficulty: Difficulty filter (None or empty = any)
+        
+        Returns:
+            Read-only int64 array (shared, do not modify)
+        """
+        return self.postings.get((filter_value(category), filter_value(difficulty)), EMPTY_POSTINGS)
+    
+    def page(
+        self,
+        limit: int,
+        category: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        after: Optional[int] = None
+    ) -> Tuple[np.ndarray, Optional[int]]:
+        """
+        One page of matching positions, for cursor pagination
+        
+        Args:
+            limit: Page size
+            category: Category filter
+            difficulty: Difficulty filter
+            after: Position of the last question on the previous page
+        
+        Returns:
+            (positions, cursor for the next page or None on the last page)
+        """
+        ids = self.lookup(category, difficulty)
+        start = 0 if after is None else int(np.searchsorted(ids, after, side='right'))
+        page = ids[start:start + limit]
+        more = start + limit < len(ids)
+        return page, int(page[-1]) if more and len(page) else None
+    
+    def count(self, category: Optional[str] = None, difficulty: Optional[str] = None) -> int:
+        """Number of questions matching both filters"""
+        return len(self.lookup(category, difficulty))
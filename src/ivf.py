@@ -0,0 +1,87 @@
+"""
+IVF Module
+Spherical k-means coarse quantizer for inverted-file (IVF) dense search
+"""
+from typing import Optional
+import numpy as np
+
+# Rows per block when assigning vectors to centroids
+ASSIGN_CHUNK_ROWS = 16384
+
+
+def default_nlist(n_vectors: int) -> int:
+    """Rule-of-thumb list count: about 4 * sqrt(n), at least 1"""
+    return max(1, min(n_vectors, int(4 * np.sqrt(n_vectors))))
+
+
+def assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """
+    Nearest centroid (by cosine) for every vector
+    
+    Args:
+        vectors: L2-normalized vectors of shape (n, dim)
+        centroids: L2-normalized centroids of shape (nlist, dim)
+    
+    Returns:
+        int32 array of list ids
+    """
+    labels = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_CHUNK_ROWS):
+        block = np.asarray(vectors[start:start + ASSIGN_CHUNK_ROWS], dtype=np.float32)
+        labels[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def train_kmeans(
+    vectors: np.ndarray,
+    nlist: int,
+    iterations: int = 20,
+    sample_size: Optional[int] = None,
+    seed: int = 42
+) -> np.ndarray:
+    """
+    Train centroids with spherical k-means
+    
+    Args:
+        vectors: L2-normalized vectors of shape (n, dim)
+        nlist: Number of centroids (inverted lists)
+        iterations: Lloyd iterations
+        sample_size: Train on a random sample of this many vectors
+            (defaults to 64 per list, which is plenty for a coarse quantizer)
+        seed: Random seed for sampling and initialization
+    
+    Returns:
+        float32 centroids of shape (nlist, dim), L2-normalized
+    """
+    rng = np.random.default_rng(seed)
+    n_vectors = len(vectors)
+    nlist = max(1, min(nlist, n_vectors))
+    
+    sample_size = sample_size or 64 * nlist
+    if n_vectors > sample_size:
+        sample = np.asarray(vectors[np.sort(rng.choice(n_vectors, sample_size, replace=False))], dtype=np.float32)
+    else:
+        sample = np.asarray(vectors, dtype=np.float32)
+    
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(iterations):
+        labels = assign(sample, centroids)
+        counts = np.bincount(labels, minlength=nlist)
+        
+        # Per-list sums via one sort and a segmented reduce
+        order = np.argsort(labels, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        filled = np.flatnonzero(counts)
+        sums = np.zeros_like(centroids)
+        sums[filled] = np.add.reduceat(sample[order], starts[filled], axis=0)
+        
+        # Re-seed empty lists from random sample points
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            sums[empty] = sample[rng.choice(len(sample), len(empty), replace=False)]
+        
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centroids = (sums / norms).astype(np.float32)
+    
+    return centroids
@@ -2,47 +2,50 @@
 Job Description Analyzer
 Extracts skills, technologies, and requirements from job descriptions using LLM
 """
-import re
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from config.config import Config
+from src.jd_compactor import JDCompactor
+from src.skill_matcher import get_skill_matcher
 
 
 class JDAnalyzer:
     """Analyzes job descriptions to extract relevant information"""
     
-    def __init__(self):
-        """Initialize JD Analyzer"""
+    def __init__(self, llm_service=None):
+        """
+        Initialize JD Analyzer
+        
+        Args:
+            llm_service: Shared LLMService (a new one if omitted)
+        """
         # Import and initialize LLM service
         from src.llm_service import LLMService
-        self.llm_service = LLMService()
-        
-        # Common technology keywords
-        self.tech_keywords = {
-            "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
-            "react", "angular", "vue", "node.js", "express", "django", "flask", "fastapi",
-            "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy",
-            "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "git",
-            "sql", "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
-            "rest", "graphql", "microservices", "api", "ci/cd",
-            "machine learning", "deep learning", "nlp", "computer vision",
-            "agile", "scrum", "devops"
-        }
+        self.llm_service = llm_service or LLMService()
+        
+        # Trims boilerplate so long scraped/uploaded postings fit the prompt budget
+        self.compactor = JDCompactor(max_tokens=Config.JD_MAX_PROMPT_TOKENS)
+        
+        # Skill taxonomy with aliases, compiled once per process into one matcher
+        self.skill_matcher = get_skill_matcher(Config.SKILL_TAXONOMY_PATH)
     
-    def analyze(self, job_description: str) -> Dict:
+    async def analyze(self, job_description: str) -> Dict:
         """
         Analyze job description comprehensively
         
         Args:
             job_description: The job description text
-            
+        
         Returns:
-            Dictionary with extracted information
+            Dictionary with extracted information; analysis_complete is
+            False when the LLM step failed and only defaults are filled in
         """
         # Extract basic info
         extracted_skills = self._extract_skills_simple(job_description)
         
         # Use LLM for comprehensive analysis
-        llm_analysis = self._analyze_with_llm(job_description)
+        llm_analysis = await self._analyze_with_llm(job_description)
+        analysis_complete = llm_analysis is not None
+        llm_analysis = llm_analysis or {}
         
         # Combine results
         result = {
@@ -56,26 +59,21 @@ class JDAnalyzer:
             "technologies": llm_analysis.get("technologies", []),
             "soft_skills": llm_analysis.get("soft_skills", []),
             "interview_focus_areas": llm_analysis.get("interview_focus_areas", []),
-            "summary": llm_analysis.get("summary", "")
+            "summary": llm_analysis.get("summary", ""),
+            "analysis_complete": analysis_complete
         }
         
         return result
     
     def _extract_skills_simple(self, text: str) -> Set[str]:
-        """Extract skills using keyword matching"""
-        text_lower = text.lower()
-        found_skills = set()
-        
-        for keyword in self.tech_keywords:
-            # Look for whole word matches
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.add(keyword)
-        
-        return found_skills
+        """Extract canonical skill names (aliases such as k8s included) in one pass over the text"""
+        return self.skill_matcher.find(text)
     
-    def _analyze_with_llm(self, job_description: str) -> Dict:
-        """Use LLM for comprehensive job description analysis"""
+    async def _analyze_with_llm(self, job_description: str) -> Optional[Dict]:
+        """Use LLM for comprehensive job description analysis (None if the call fails)"""
+        if Config.JD_COMPACTION_ENABLED:
+            job_description = self.compactor.compact(job_description)
+        
         prompt = f"""Analyze this job description and extract key information for interview preparation.
 
 Job Description:
@@ -119,21 +117,22 @@ SUMMARY:
 [2-3 sentence summary of the role and ideal candidate]
 
 Be specific and extract actual skills/technologies mentioned."""
-
+        
         try:
-            response = self.llm_service._call_llm(
+            response = await self.llm_service._call_llm(
                 messages=[
                     {"role": "system", "content": "You are an expert recruiter and job description analyzer."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=800
+                max_tokens=800,
+                cache_ttl=Config.LLM_CACHE_TTL_JD_ANALYSIS
             )
             
             return self._parse_llm_analysis(response)
-            
+        
         except Exception as e:
             print(f"Error in LLM analysis: {e}")
-            return {}
+            return None
     
     def _parse_llm_analysis(self, analysis_text: str) -> Dict:
         """Parse structured analysis from LLM output"""
@@ -194,7 +193,7 @@ Be specific and extract actual skills/technologies mentioned."""
         
         Args:
             analysis: Job description analysis
-            
+        
         Returns:
             Search query string
         """
@@ -224,7 +223,7 @@ Be specific and extract actual skills/technologies mentioned."""
         
         Args:
             analysis: Job description analysis
-            
+        
         Returns:
             List of relevant question categories
         """
@@ -275,16 +274,16 @@ Be specific and extract actual skills/technologies mentioned."""
         
         return list(set(categories))
     
-    def explain_term(self, term: str, context: str = None) -> Dict:
+    async def explain_term(self, term: str, context: str = None) -> Dict:
         """
         Explain a technical term in simple language
         
         Args:
             term: The technical term to explain
             context: Optional context for more specific explanation
-            
+        
         Returns:
             Dictionary explanation of the term
         """
         # Use the LLMService's explain_term method
-        return self.llm_service.explain_term(term, context)
+        return await self.llm_service.explain_term(term, context)
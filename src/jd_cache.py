@@ -0,0 +1,86 @@
+"""
+JD Result Cache
+Complete job description analyses keyed by a fingerprint of the normalized text
+"""
+import hashlib
+import re
+import unicodedata
+from typing import Dict, Optional
+from src.cache import LRUCache
+
+LEADING_PUNCTUATION = re.compile(r"^\W+")
+# "+" and "#" survive at the end of a word so "c++" and "c#" stay distinct from "c"
+TRAILING_PUNCTUATION = re.compile(r"[^\w+#]+$")
+
+
+def normalize_jd(text: str) -> str:
+    """
+    Canonical form of a job description for fingerprinting
+    
+    Unicode is NFKC-normalized and lowercased, punctuation around words
+    (bullets, quotes, trailing commas and periods) is dropped and all
+    whitespace collapses to single spaces. Punctuation inside a word is
+    kept, so "node.js" and "ci/cd" still differ from "nodejs" and "cicd".
+    """
+    tokens = []
+    for token in unicodedata.normalize("NFKC", text).lower().split():
+        core = TRAILING_PUNCTUATION.sub("", LEADING_PUNCTUATION.sub("", token))
+        if core:
+            tokens.append(core)
+    return " ".join(tokens)
+
+
+def jd_fingerprint(text: str) -> str:
+    """SHA-256 of the normalized job description"""
+    return hashlib.sha256(normalize_jd(text).encode("utf-8")).hexdigest()
+
+
+class JDResultCache:
+    """
+    Cached /analyze-jd results (analysis, search query, matched questions).
+    
+    The same posting is often pasted, uploaded as a file and scraped from
+    its URL; all three normalize to the same fingerprint, so only the
+    first costs an LLM call and a search. Entries are also keyed by the
+    vector store generation, so a question bank reload makes the old
+    matches unreachable (they age out of the LRU).
+    """
+    
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        """
+        Initialize the cache
+        
+        Args:
+            max_size: Maximum number of results kept (0 disables caching)
+            ttl: Seconds a result stays valid (None or 0 = no expiry)
+        """
+        self.entries = LRUCache(max_size, default_ttl=ttl or None)
+    
+    def get(self, job_description: str, generation: int = 0) -> Optional[Dict]:
+        """
+        Look up a previous result for the same posting
+        
+        Args:
+            job_description: Raw job description text
+            generation: Vector store generation the matches must come from
+        
+        Returns:
+            Dict with analysis, search_query and matched_questions, or None
+        """
+        if self.entries.max_size <= 0:
+            return None
+        return self.entries.get((generation, jd_fingerprint(job_description)))
+    
+    def set(self, job_description: str, result: Dict, generation: int = 0):
+        """Store the result of analyzing job_description"""
+        if self.entries.max_size <= 0:
+            return
+        self.entries.set((generation, jd_fingerprint(job_description)), result)
+    
+    def clear(self):
+        """Drop every cached result"""
+        self.entries.clear()
+    
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters"""
+        return dict(self.entries.get_stats(), ttl=self.entries.default_ttl)
@@ -0,0 +1,159 @@
+"""
+Job Description Compactor
+Strips boilerplate from job descriptions and caps them to a token budget
+"""
+import re
+from typing import List, Optional, Tuple
+from src.token_counter import count_tokens
+
+
+class JDCompactor:
+    """Reduces a raw job description to the parts that matter for analysis"""
+    
+    # Section headings whose content is dropped (colon-terminated headings)
+    BOILERPLATE_HEADINGS = (
+        "benefit", "perks", "what we offer", "we offer", "why join", "why work",
+        "equal opportunit", "eeo", "about us", "about the company", "who we are",
+        "our culture", "our values", "life at", "diversity", "privacy", "how to apply",
+        "application process", "disclaimer", "legal", "compensation", "salary",
+        "follow us", "similar jobs", "related jobs", "share this"
+    )
+    BOILERPLATE_HEADING = re.compile(
+        r"\b(?:" + "|".join(re.escape(h) for h in BOILERPLATE_HEADINGS) + ")", re.IGNORECASE
+    )
+    
+    # Headings recognized without a colon: the whole line must be one of these
+    BOILERPLATE_TITLES = frozenset((
+        "benefits", "our benefits", "perks", "perks and benefits", "benefits and perks",
+        "compensation and benefits", "what we offer", "why join us", "why work with us",
+        "equal opportunity employer", "equal employment opportunity", "eeo statement",
+        "about us", "about the company", "who we are", "our culture", "our values",
+        "diversity and inclusion", "diversity, equity and inclusion", "privacy notice",
+        "privacy policy", "how to apply", "application process", "disclaimer",
+        "legal disclaimer", "follow us", "similar jobs", "related jobs", "share this job"
+    ))
+    
+    # Section headings kept first when the budget is tight
+    PRIORITY_HEADINGS = (
+        "requirement", "qualification", "skill", "responsibilit", "what you'll do",
+        "what you will do", "what you'll bring", "what you bring", "you will", "you have",
+        "must have", "nice to have", "preferred", "experience", "tech stack",
+        "technolog", "about the role", "the role", "duties", "key tasks"
+    )
+    
+    # Individual lines dropped wherever they appear
+    BOILERPLATE_LINE = re.compile(
+        r"\b(?:equal opportunity|regardless of (?:race|gender|age)|reasonable accommodation|"
+        r"cookies?|privacy (?:policy|notice)|all rights reserved|apply now|share this job|"
+        r"sign in|log in|create (?:an )?account|job alerts?)\b|©",
+        re.IGNORECASE
+    )
+    
+    def __init__(self, max_tokens: int):
+        """
+        Initialize compactor
+        
+        Args:
+            max_tokens: Token budget for the compacted text
+        """
+        self.max_tokens = max_tokens
+    
+    def compact(self, text: str) -> str:
+        """
+        Compact a job description
+        
+        Args:
+            text: Raw job description (pasted, scraped or extracted)
+        
+        Returns:
+            Text without repeated lines and boilerplate sections, capped to
+            the token budget while keeping requirement and skill sections;
+            text already within the budget is returned unchanged
+        """
+        if count_tokens(text) <= self.max_tokens:
+            return text
+        
+        sections = self._split_sections(self._unique_lines(text))
+        
+        # (priority, original index, line) for every line worth keeping
+        candidates: List[Tuple[int, int, str]] = []
+        index = 0
+        for kind, lines in sections:
+            if kind == "boilerplate":
+                continue
+            for line in lines:
+                if not self.BOILERPLATE_LINE.search(line):
+                    # The opening lines usually carry the title and team
+                    priority = 0 if kind == "priority" or index < 2 else 1
+                    candidates.append((priority, index, line))
+                index += 1
+        
+        if sum(count_tokens(line) + 1 for _, _, line in candidates) <= self.max_tokens:
+            return "\n".join(line for _, _, line in candidates)
+        
+        # Fill the budget by priority, then restore document order
+        selected = []
+        used = 0
+        for priority, idx, line in sorted(candidates):
+            cost = count_tokens(line) + 1
+            if used + cost > self.max_tokens:
+                continue
+            selected.append((idx, line))
+            used += cost
+        
+        return "\n".join(line for _, line in sorted(selected))
+    
+    def _unique_lines(self, text: str) -> List[str]:
+        """Split into non-empty lines, dropping repeats (case/punctuation-insensitive)"""
+        seen = set()
+        lines = []
+        for line in text.splitlines():
+            line = " ".join(line.split())
+            if not line:
+                continue
+            key = re.sub(r"[\W_]+", " ", line.lower()).strip()
+            if key in seen:
+                continue
+            seen.add(key)
+            lines.append(line)
+        return lines
+    
+    def _split_sections(self, lines: List[str]) -> List[Tuple[str, List[str]]]:
+        """Group lines under headings, labelling each group boilerplate/priority/neutral"""
+        sections = [("neutral", [])]
+        for line in lines:
+            kind = self._heading_kind(line)
+            if kind == "boilerplate" and sections[-1][0] == "priority" and not line.endswith(":"):
+                # A bare title inside requirements may be a short requirement
+                # ("Disclaimer", "Privacy policy"); only a colon heading ends them
+                kind = None
+            if kind:
+                sections.append((kind, [line]))
+            else:
+                sections[-1][1].append(line)
+        return sections
+    
+    def _heading_kind(self, line: str) -> Optional[str]:
+        """
+        Classify a section heading, or return None for body lines
+        
+        Short lines ending in a colon are headings; other short lines only
+        when they name a known section (e.g. "Benefits", "Requirements").
+        A line only opens a boilerplate section when it ends in a colon or
+        is exactly a known title, so a bullet such as "Data privacy" is
+        never mistaken for one.
+        """
+        words = line.rstrip(":").split()
+        if not words or len(words) > 8 or len(line) > 60 or line.startswith(("-", "•", "*")):
+            return None
+        if not line.endswith(":") and len(words) > 5:
+            return None
+        heading = line.lower()
+        if line.endswith(":"):
+            if self.BOILERPLATE_HEADING.search(heading):
+                return "boilerplate"
+        elif " ".join(heading.rstrip(".!").split()) in self.BOILERPLATE_TITLES:
+            return "boilerplate"
+        if any(h in heading for h in self.PRIORITY_HEADINGS):
+            return "priority"
+        return "neutral" if line.endswith(":") else None
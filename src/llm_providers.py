@@ -0,0 +1,273 @@
+"""
+LLM Providers Module
+Backends behind LLMService: Groq for production and a deterministic local fake
+"""
+import asyncio
+from abc import ABC, abstractmethod
+import hashlib
+import json
+import math
+import random
+import re
+from typing import AsyncIterator, Dict, List, Optional
+from config.config import Config
+from src.token_counter import count_message_tokens, count_tokens
+
+
+class LLMResponse:
+    """Completion text plus the token usage reported by the provider"""
+    
+    def __init__(self, content: str, total_tokens: Optional[int] = None):
+        self.content = content
+        self.total_tokens = total_tokens
+
+
+class LLMProvider(ABC):
+    """Interface every chat-completion backend implements"""
+    
+    name = "base"
+    
+    @abstractmethod
+    async def complete(
+        self, messages: List[Dict], model: str, temperature: float, max_tokens: int
+    ) -> LLMResponse:
+        """Return a full completion for messages"""
+    
+    @abstractmethod
+    def stream(
+        self, messages: List[Dict], model: str, temperature: float, max_tokens: int
+    ) -> AsyncIterator[str]:
+        """Yield completion text deltas as they are generated (async generator)"""
+    
+    async def close(self):
+        """Release network resources"""
+
+
+class GroqProvider(LLMProvider):
+    """Groq chat completions through a pooled async client"""
+    
+    name = "groq"
+    
+    def __init__(self):
+        """Create the AsyncGroq client with a bounded httpx connection pool"""
+        import httpx
+        from groq import AsyncGroq
+        
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=Config.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.LLM_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=Config.LLM_TIMEOUT
+        )
+        self.client = AsyncGroq(api_key=Config.GROQ_API_KEY, http_client=http_client)
+    
+    async def complete(
+        self, messages: List[Dict], model: str, temperature: float, max_tokens: int
+    ) -> LLMResponse:
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        usage = getattr(response, "usage", None)
+        return LLMResponse(
+            content=response.choices[0].message.content.strip(),
+            total_tokens=usage.total_tokens if usage is not None else None
+        )
+    
+    async def stream(
+        self, messages: List[Dict], model: str, temperature: float, max_tokens: int
+    ) -> AsyncIterator[str]:
+        stream = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    
+    async def close(self):
+        await self.client.close()
+
+
+class FakeProvider(LLMProvider):
+    """
+    Offline provider for load tests and profiling.
+    
+    Recognises every prompt the app sends (model answer, term explanation,
+    evaluation in text or JSON, suggestions, follow-ups, JD analysis) and
+    returns a response the app's parsers accept. Content is derived from a
+    hash of the prompt, so identical prompts give identical responses.
+    Latency is sampled from FAKE_LLM_LATENCY_DISTRIBUTION.
+    """
+    
+    name = "fake"
+    
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+    
+    def __init__(
+        self,
+        latency_ms: float = None,
+        jitter_ms: float = None,
+        distribution: str = None,
+        seed: int = None
+    ):
+        """
+        Initialize fake provider
+        
+        Args:
+            latency_ms: Mean completion latency
+            jitter_ms: Spread (uniform half-width, or standard deviation)
+            distribution: fixed, uniform, normal or lognormal
+            seed: Seed for the latency sampler
+        """
+        self.latency_ms = Config.FAKE_LLM_LATENCY_MS if latency_ms is None else latency_ms
+        self.jitter_ms = Config.FAKE_LLM_JITTER_MS if jitter_ms is None else jitter_ms
+        self.distribution = distribution or Config.FAKE_LLM_LATENCY_DISTRIBUTION
+        if self.distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        self._random = random.Random(Config.FAKE_LLM_SEED if seed is None else seed)
+    
+    def _sample_latency(self) -> float:
+        """Sample one completion latency in seconds"""
+        mean, spread = self.latency_ms, self.jitter_ms
+        if self.distribution == "uniform":
+            value = self._random.uniform(mean - spread, mean + spread)
+        elif self.distribution == "normal":
+            value = self._random.gauss(mean, spread)
+        elif self.distribution == "lognormal" and mean > 0:
+            # Parameterised so the samples have the requested mean and std dev
+            sigma2 = math.log(1 + (spread / mean) ** 2)
+            value = self._random.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        else:
+            value = mean
+        return max(value, 0.0) / 1000
+    
+    async def complete(
+        self, messages: List[Dict], model: str, temperature: float, max_tokens: int
+    ) -> LLMResponse:
+        await asyncio.sleep(self._sample_latency())
+        content = self._respond(messages)
+        return LLMResponse(
+            content=content,
+            total_tokens=count_message_tokens(messages) + count_tokens(content)
+        )
+    
+    async def stream(
+        self, messages: List[Dict], model: str, temperature: float, max_tokens: int
+    ) -> AsyncIterator[str]:
+        latency = self._sample_latency()
+        content = self._respond(messages)
+        chunks = [content[i:i + 16] for i in range(0, len(content), 16)] or [""]
+        
+        # 20% of the latency before the first token, the rest spread over the stream
+        await asyncio.sleep(latency * 0.2)
+        for chunk in chunks:
+            yield chunk
+            await asyncio.sleep(latency * 0.8 / len(chunks))
+    
+    def _respond(self, messages: List[Dict]) -> str:
+        """Build a schema-valid response for whichever prompt was sent"""
+        prompt = str(messages[-1].get("content", "")) if messages else ""
+        rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+        subject = self._subject(prompt)
+        
+        if '"detailed_answer"' in prompt:
+            return json.dumps({
+                "summary": f"A structured answer to: {subject}",
+                "key_points": [f"Key point {i} about {subject}" for i in range(1, 4)],
+                "detailed_answer": (
+                    f"When asked '{subject}', start with the core idea, then walk through "
+                    "how it works in practice and the trade-offs involved.\n\n"
+                    "Close with a concrete result from your own experience."
+                ),
+                "examples": [f"Example {i} from a production project" for i in range(1, 3)]
+            })
+        
+        if '"why_it_matters"' in prompt:
+            return json.dumps({
+                "definition": f"{subject} is a common technical concept.",
+                "analogy": f"Think of {subject} like a well-organised toolbox.",
+                "key_points": [f"{subject} point {i}" for i in range(1, 4)],
+                "example": f"A typical use of {subject} in a web service.",
+                "why_it_matters": f"{subject} comes up often in real systems and interviews."
+            })
+        
+        if '"followup_questions"' in prompt:
+            return json.dumps({
+                "score": rng.randint(5, 9),
+                "strengths": ["Clear structure", "Relevant example"],
+                "weaknesses": ["Could quantify the impact", "Missing edge cases"],
+                "improvements": [f"Suggestion {i}" for i in range(1, 5)],
+                "followup_questions": [f"Can you elaborate on part {i}?" for i in range(1, 4)],
+                "summary": "A solid answer with room for more depth."
+            })
+        
+        if "SCORE:" in prompt:
+            return (
+                f"SCORE: {rng.randint(5, 9)}/10\n\n"
+                "STRENGTHS:\n- Clear structure\n- Relevant example\n\n"
+                "AREAS FOR IMPROVEMENT:\n- Could quantify the impact\n- Missing edge cases\n\n"
+                "SUGGESTIONS:\n- Add metrics\n- Mention trade-offs"
+            )
+        
+        if "JOB ROLE:" in prompt:
+            skills = rng.sample(["Python", "SQL", "Docker", "AWS", "React", "Kubernetes", "Go"], 4)
+            return (
+                "JOB ROLE: Software Engineer\n\n"
+                "EXPERIENCE LEVEL: Mid-level\n\n"
+                "REQUIRED SKILLS:\n" + "\n".join(f"- {s}" for s in skills[:3]) + "\n\n"
+                f"PREFERRED SKILLS:\n- {skills[3]}\n\n"
+                "KEY TECHNOLOGIES:\n" + "\n".join(f"- {s}" for s in skills) + "\n\n"
+                "KEY RESPONSIBILITIES:\n- Build services\n- Review code\n- Improve reliability\n\n"
+                "SOFT SKILLS:\n- Communication\n- Ownership\n\n"
+                "INTERVIEW FOCUS AREAS:\n- System design\n- Coding\n- Behavioral\n\n"
+                "SUMMARY:\nA generalist engineering role building and operating backend services."
+            )
+        
+        if "suggest 3-4" in prompt:
+            return "\n".join(f"{i}. Improvement {i} for this answer" for i in range(1, 5))
+        
+        if "follow-up questions" in prompt:
+            return "\n".join(f"{i}. How would you handle case {i}?" for i in range(1, 4))
+        
+        return f"Fake response for: {subject}"
+    
+    @staticmethod
+    def _subject(prompt: str) -> str:
+        """Pull the question or term out of a prompt for more realistic text"""
+        for pattern in (r"Interview Question: (.+)", r"Question: (.+)", r'technical term "([^"]+)"'):
+            match = re.search(pattern, prompt)
+            if match:
+                return match.group(1).strip()
+        return "the topic"
+
+
+PROVIDERS = {
+    GroqProvider.name: GroqProvider,
+    FakeProvider.name: FakeProvider,
+}
+
+
+def create_provider(name: Optional[str] = None) -> LLMProvider:
+    """
+    Create the provider selected by name or Config.LLM_PROVIDER
+    
+    Args:
+        name: Provider name ("groq" or "fake")
+    
+    Returns:
+        LLMProvider instance
+    """
+    name = (name or Config.LLM_PROVIDER).lower()
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown LLM provider: {name}. Choose from {', '.join(PROVIDERS)}")
+    return PROVIDERS[name]()
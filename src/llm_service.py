@@ -1,58 +1,206 @@
 """
 LLM Service Module
-Handles interactions with Groq API for LLM operations
+Handles interactions with the LLM provider (Groq by default) for LLM operations
 """
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from config.config import Config
-from groq import Groq
+from src.cache import LLMResponseCache
+from src.llm_providers import LLMProvider, create_provider
+from src.rate_limiter import Priority, RateLimitScheduler
+from src.single_flight import SingleFlight
+from src.stream_parser import JSONFieldStreamer
+from src.token_counter import count_message_tokens
+
+
+# Process-wide provider; every LLMService shares its connection pool
+_provider: Optional[LLMProvider] = None
+
+# Process-wide response cache shared by every LLMService
+_response_cache: Optional[LLMResponseCache] = None
+
+# Identical prompts in flight at the same time share one upstream request
+inflight_requests = SingleFlight()
+
+# Keeps upstream traffic under the provider's RPM/TPM limits
+rate_limiter = RateLimitScheduler(
+    requests_per_minute=Config.LLM_REQUESTS_PER_MINUTE * Config.LLM_RATE_LIMIT_HEADROOM,
+    tokens_per_minute=Config.LLM_TOKENS_PER_MINUTE * Config.LLM_RATE_LIMIT_HEADROOM
+)
+
+
+def is_behavioral_question(question: str) -> bool:
+    """Behavioral questions are answered with the STAR method"""
+    behavioral_keywords = ["tell me about", "describe a time", "give an example"]
+    return any(keyword in question.lower() for keyword in behavioral_keywords)
+
+
+def get_provider() -> LLMProvider:
+    """Return the shared LLM provider selected by Config.LLM_PROVIDER"""
+    global _provider
+    if _provider is None:
+        _provider = create_provider()
+    return _provider
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds to back off if error is a provider rate-limit (429) response"""
+    if getattr(error, "status_code", None) != 429:
+        return None
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return Config.LLM_RATE_LIMIT_BACKOFF
+
+
+async def close_provider():
+    """Close the shared provider and release pooled connections"""
+    global _provider
+    if _provider is not None:
+        await _provider.close()
+        _provider = None
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """Return the shared LLM response cache, or None when caching is disabled"""
+    global _response_cache
+    if _response_cache is None and Config.LLM_CACHE_ENABLED:
+        _response_cache = LLMResponseCache(
+            db_path=Config.LLM_CACHE_PATH,
+            max_memory_entries=Config.LLM_CACHE_MAX_ENTRIES
+        )
+    return _response_cache
 
 
 class LLMService:
-    """Service for LLM-based answer generation and analysis using Groq"""
+    """Service for LLM-based answer generation and analysis"""
     
     def __init__(self):
-        """Initialize LLM service with Groq"""
+        """Initialize LLM service with the configured provider"""
         self.model = Config.LLM_MODEL
         self.temperature = Config.TEMPERATURE
-        self.client = Groq(api_key=Config.GROQ_API_KEY)
     
-    def _call_llm(self, messages: List[Dict], max_tokens: int = None) -> str:
-        """Call Groq API"""
+    @property
+    def provider(self) -> LLMProvider:
+        """Shared provider, created on first use"""
+        return get_provider()
+    
+    async def _call_llm(
+        self,
+        messages: List[Dict],
+        max_tokens: int = None,
+        cache_ttl: Optional[float] = None,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> str:
+        """
+        Call the LLM provider without blocking the event loop
+        
+        Responses are cached by model, temperature, max_tokens and messages.
+        cache_ttl is the lifetime in seconds (defaults to LLM_CACHE_TTL_DEFAULT);
+        0 skips the cache for this call. Concurrent calls with the same key
+        share a single upstream request. Upstream requests are admitted by
+        the rate limiter in priority order.
+        """
+        if max_tokens is None:
+            max_tokens = Config.ANSWER_MAX_TOKENS
+        if cache_ttl is None:
+            cache_ttl = Config.LLM_CACHE_TTL_DEFAULT
+        
+        cache_key = LLMResponseCache.make_key(self.model, self.temperature, max_tokens, messages)
+        cache = get_response_cache() if cache_ttl > 0 else None
+        if cache is not None:
+            cached = await cache.aget(cache_key)
+            if cached is not None:
+                return cached
+        
+        async def complete() -> str:
+            estimated_tokens = count_message_tokens(messages) + max_tokens
+            for attempt in range(Config.LLM_RATE_LIMIT_RETRIES + 1):
+                await self._acquire(estimated_tokens, priority)
+                try:
+                    response = await self.provider.complete(
+                        messages=messages,
+                        model=self.model,
+                        temperature=self.temperature,
+                        max_tokens=max_tokens
+                    )
+                    break
+                except Exception as e:
+                    backoff = _retry_after(e)
+                    if backoff is not None and Config.LLM_RATE_LIMIT_ENABLED:
+                        rate_limiter.backoff(backoff)
+                        if attempt < Config.LLM_RATE_LIMIT_RETRIES:
+                            continue
+                    raise Exception(f"Error calling {self.provider.name} API: {str(e)}")
+            
+            if response.total_tokens is not None and Config.LLM_RATE_LIMIT_ENABLED:
+                rate_limiter.reconcile(estimated_tokens, response.total_tokens)
+            
+            content = response.content
+            if cache is not None:
+                await cache.aset(cache_key, content, ttl=cache_ttl)
+            return content
+        
+        return await inflight_requests.do(cache_key, complete)
+    
+    async def _acquire(self, estimated_tokens: int, priority: Priority):
+        """Wait for the rate limiter to admit an upstream request"""
+        if Config.LLM_RATE_LIMIT_ENABLED:
+            await rate_limiter.acquire(estimated_tokens, priority)
+    
+    async def _stream_llm(
+        self,
+        messages: List[Dict],
+        max_tokens: int = None,
+        cache_ttl: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion, yielding text deltas as they arrive
+        
+        Shares the response cache with _call_llm: a cached response is
+        yielded as a single chunk, and a finished stream is stored.
+        """
         if max_tokens is None:
             max_tokens = Config.ANSWER_MAX_TOKENS
+        if cache_ttl is None:
+            cache_ttl = Config.LLM_CACHE_TTL_DEFAULT
+        
+        cache = get_response_cache() if cache_ttl > 0 else None
+        cache_key = None
+        if cache is not None:
+            cache_key = LLMResponseCache.make_key(self.model, self.temperature, max_tokens, messages)
+            cached = await cache.aget(cache_key)
+            if cached is not None:
+                yield cached
+                return
         
+        await self._acquire(count_message_tokens(messages) + max_tokens, Priority.INTERACTIVE)
+        
+        parts = []
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            async for delta in self.provider.stream(
                 messages=messages,
+                model=self.model,
                 temperature=self.temperature,
                 max_tokens=max_tokens
-            )
-            return response.choices[0].message.content.strip()
+            ):
+                parts.append(delta)
+                yield delta
         except Exception as e:
-            raise Exception(f"Error calling Groq API: {str(e)}")
+            raise Exception(f"Error calling {self.provider.name} API: {str(e)}")
+        
+        if cache is not None:
+            await cache.aset(cache_key, "".join(parts).strip(), ttl=cache_ttl)
     
-    def generate_answer(
+    def _build_answer_messages(
         self,
         question: str,
         job_context: Optional[str] = None,
         user_experience: Optional[str] = None,
         answer_hints: Optional[str] = None,
         use_star_method: bool = False
-    ) -> Dict:
-        """
-        Generate a personalized answer to an interview question
-        
-        Args:
-            question: The interview question
-            job_context: Context from the job description
-            user_experience: User's experience level or background
-            answer_hints: Hints for answering
-            use_star_method: Use STAR method for behavioral questions
-            
-        Returns:
-            Dictionary with structured answer
-        """
+    ) -> List[Dict]:
+        """Build the chat messages for model answer generation"""
         # Build context
         context_parts = []
         
@@ -89,16 +237,13 @@ Ensure the answer is:
 4. Sounds natural and conversational
 """
         
-        # Generate answer
-        response = self._call_llm(
-            messages=[
-                {"role": "system", "content": "You are an expert interview coach. You always respond with valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=Config.ANSWER_MAX_TOKENS
-        )
-        
-        # Parse JSON response
+        return [
+            {"role": "system", "content": "You are an expert interview coach. You always respond with valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _parse_answer(self, response: str) -> Dict:
+        """Parse a model answer JSON response, falling back to plain text"""
         import json
         try:
             # Clean up potential markdown code blocks
@@ -113,7 +258,79 @@ Ensure the answer is:
                 "examples": []
             }
     
-    def explain_term(self, term: str, context: Optional[str] = None) -> Dict:
+    async def generate_answer(
+        self,
+        question: str,
+        job_context: Optional[str] = None,
+        user_experience: Optional[str] = None,
+        answer_hints: Optional[str] = None,
+        use_star_method: bool = False,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> Dict:
+        """
+        Generate a personalized answer to an interview question
+        
+        Args:
+            question: The interview question
+            job_context: Context from the job description
+            user_experience: User's experience level or background
+            answer_hints: Hints for answering
+            use_star_method: Use STAR method for behavioral questions
+            priority: Rate limiter lane (BACKGROUND for batch/prefetch work)
+            
+        Returns:
+            Dictionary with structured answer
+        """
+        messages = self._build_answer_messages(
+            question, job_context, user_experience, answer_hints, use_star_method
+        )
+        
+        # Generate answer
+        response = await self._call_llm(
+            messages=messages,
+            max_tokens=Config.ANSWER_MAX_TOKENS,
+            cache_ttl=Config.LLM_CACHE_TTL_ANSWER,
+            priority=priority
+        )
+        
+        return self._parse_answer(response)
+    
+    async def stream_answer(
+        self,
+        question: str,
+        job_context: Optional[str] = None,
+        user_experience: Optional[str] = None,
+        answer_hints: Optional[str] = None,
+        use_star_method: bool = False
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streaming variant of generate_answer
+        
+        Yields (event, data) pairs:
+            ("token", str): raw text delta from the model
+            ("field", {"name": ..., "value": ...}): a top-level answer field
+                (summary, key_points, ...) as soon as it is complete
+            ("answer", dict): the full parsed answer once the stream ends
+        """
+        messages = self._build_answer_messages(
+            question, job_context, user_experience, answer_hints, use_star_method
+        )
+        
+        streamer = JSONFieldStreamer()
+        parts = []
+        async for delta in self._stream_llm(
+            messages=messages,
+            max_tokens=Config.ANSWER_MAX_TOKENS,
+            cache_ttl=Config.LLM_CACHE_TTL_ANSWER
+        ):
+            parts.append(delta)
+            yield "token", delta
+            for name, value in streamer.feed(delta):
+                yield "field", {"name": name, "value": value}
+        
+        yield "answer", self._parse_answer("".join(parts).strip())
+    
+    async def explain_term(self, term: str, context: Optional[str] = None) -> Dict:
         """
         Explain a technical term in simple language
         
@@ -139,12 +356,13 @@ Provide the output in strict JSON format with the following keys:
 
 Ensure the JSON is valid and the content is beginner-friendly."""
 
-        response = self._call_llm(
+        response = await self._call_llm(
             messages=[
                 {"role": "system", "content": "You are a patient teacher who excels at explaining complex technical concepts in simple terms. You always respond with valid JSON."},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=500
+            max_tokens=500,
+            cache_ttl=Config.LLM_CACHE_TTL_EXPLAIN
         )
         
         # Parse JSON response
@@ -163,7 +381,7 @@ Ensure the JSON is valid and the content is beginner-friendly."""
                 "why_it_matters": "Not available"
             }
     
-    def evaluate_answer(
+    async def evaluate_answer(
         self,
         question: str,
         user_answer: str,
@@ -203,12 +421,13 @@ SUGGESTIONS:
 
 Be constructive, specific, and encouraging."""
 
-        response = self._call_llm(
+        response = await self._call_llm(
             messages=[
                 {"role": "system", "content": "You are an expert interview coach providing constructive feedback."},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=500
+            max_tokens=500,
+            cache_ttl=Config.LLM_CACHE_TTL_EVALUATION
         )
         
         feedback = response
@@ -227,7 +446,86 @@ Be constructive, specific, and encouraging."""
             "feedback": feedback
         }
     
-    def suggest_improvements(self, answer: str, question: str) -> List[str]:
+    async def evaluate_structured(
+        self,
+        question: str,
+        user_answer: str,
+        ideal_answer: Optional[str] = None
+    ) -> Dict:
+        """
+        Evaluate an answer with a single structured-JSON completion
+        
+        Args:
+            question: The interview question
+            user_answer: User's answer
+            ideal_answer: Optional ideal answer for comparison
+            
+        Returns:
+            Dictionary with score, strengths, weaknesses, improvements,
+            followup_questions and summary
+        """
+        prompt = f"""You are an expert interview coach. Evaluate this candidate's answer to an interview question.
+
+Question: {question}
+
+Candidate's Answer: {user_answer}
+
+{f"Reference Answer: {ideal_answer}" if ideal_answer else ""}
+
+Provide the output in strict JSON format with the following keys:
+{{
+    "score": 7,
+    "strengths": ["2-3 strong points"],
+    "weaknesses": ["2-3 specific areas for improvement"],
+    "improvements": ["3-4 specific, actionable suggestions to make the answer stronger"],
+    "followup_questions": ["3 likely follow-up questions an interviewer might ask"],
+    "summary": "1-2 sentence overall assessment"
+}}
+
+The score is an integer from 0 to 10. Be constructive, specific, and encouraging."""
+
+        response = await self._call_llm(
+            messages=[
+                {"role": "system", "content": "You are an expert interview coach providing constructive feedback. You always respond with valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=700,
+            cache_ttl=Config.LLM_CACHE_TTL_EVALUATION
+        )
+        
+        # Parse JSON response
+        import json
+        try:
+            # Clean up potential markdown code blocks
+            clean_response = response.replace("```json", "").replace("```", "").strip()
+            data = json.loads(clean_response)
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            # Fallback for plain text, or JSON that is not an object (list, string, number)
+            data = {"summary": response}
+        
+        try:
+            score = max(0, min(10, int(data.get("score", 7))))
+        except (TypeError, ValueError):
+            score = 7
+        
+        def as_list(key: str) -> List[str]:
+            items = data.get(key)
+            if not isinstance(items, list):
+                return []
+            return [str(item).strip() for item in items if str(item).strip()]
+        
+        return {
+            "score": score,
+            "strengths": as_list("strengths"),
+            "weaknesses": as_list("weaknesses"),
+            "improvements": as_list("improvements"),
+            "followup_questions": as_list("followup_questions"),
+            "summary": str(data.get("summary", "")).strip()
+        }
+    
+    async def suggest_improvements(self, answer: str, question: str) -> List[str]:
         """
         Suggest specific improvements for an answer
         
@@ -250,12 +548,13 @@ Provide numbered, specific suggestions that would make this answer stronger. Foc
 - Clarity enhancements
 - Impact amplification"""
 
-        response = self._call_llm(
+        response = await self._call_llm(
             messages=[
                 {"role": "system", "content": "You are an expert interview coach."},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=300
+            max_tokens=300,
+            cache_ttl=Config.LLM_CACHE_TTL_EVALUATION
         )
         
         suggestions_text = response
@@ -272,7 +571,7 @@ Provide numbered, specific suggestions that would make this answer stronger. Foc
         
         return suggestions[:4]  # Return max 4 suggestions
     
-    def generate_followup_questions(self, question: str, answer: str) -> List[str]:
+    async def generate_followup_questions(self, question: str, answer: str) -> List[str]:
         """
         Generate potential follow-up questions an interviewer might ask
         
@@ -296,12 +595,13 @@ Generate follow-up questions that:
 
 List 3 questions, one per line."""
 
-        response = self._call_llm(
+        response = await self._call_llm(
             messages=[
                 {"role": "system", "content": "You are an experienced technical interviewer."},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=200
+            max_tokens=200,
+            cache_ttl=Config.LLM_CACHE_TTL_EVALUATION
         )
         
         followups_text = response
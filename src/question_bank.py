@@ -0,0 +1,89 @@
+"""
+Question Bank Module
+Loading, stable ids and content hashes for question bank entries
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# File identity used to detect changes: (mtime in ns, size in bytes)
+Signature = Optional[Tuple[int, int]]
+
+
+def _digest(value) -> str:
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def question_id(q: Dict) -> str:
+    """
+    Stable id derived from the question text and category
+    
+    Unlike a list position, it does not change when other questions are
+    inserted, removed or reordered in the bank.
+    """
+    return f"qid_{_digest([' '.join(q['question'].lower().split()), q.get('category', '')])}"
+
+
+def content_hash(q: Dict) -> str:
+    """Hash of every indexed field; changes whenever the entry must be re-indexed"""
+    return _digest([
+        q.get("question", ""),
+        q.get("keywords", []),
+        q.get("category", ""),
+        q.get("difficulty", ""),
+        q.get("answer_hints", "")
+    ])
+
+
+def load_question_bank(path: Path) -> List[Dict]:
+    """Read the questions list from a question bank JSON file"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("questions", [])
+
+
+def file_signature(path: Path) -> Signature:
+    """(mtime_ns, size) of a file, or None if it cannot be read"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def file_digest(path: Path) -> Optional[str]:
+    """SHA-256 of a file's bytes (same content, same digest, whatever its mtime)"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def assign_ids(questions: List[Dict]) -> Dict[str, Dict]:
+    """
+    Map stable ids to question bank entries
+    
+    Repeats of the same question in the same category get a numbered
+    suffix (qid_..._2), so every entry keeps its own id.
+    
+    Args:
+        questions: Question bank entries
+    
+    Returns:
+        Ordered dict of question id -> entry
+    """
+    by_id: Dict[str, Dict] = {}
+    for q in questions:
+        base = qid = question_id(q)
+        repeat = 1
+        while qid in by_id:
+            repeat += 1
+            qid = f"{base}_{repeat}"
+        by_id[qid] = q
+    return by_id
@@ -0,0 +1,263 @@
+"""
+Question Bank Manager
+Hot-reloadable question bank: immutable snapshots swapped in atomically
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+import numpy as np
+from config.config import Config
+from src.question_bank import Signature, file_digest, file_signature, load_question_bank
+from src.search_index import BM25Index
+
+
+class QuestionBankSnapshot:
+    """
+    One version of the question bank with every structure derived from it.
+    
+    Snapshots are never modified after construction. A request reads the
+    manager's current snapshot once and uses it throughout, so a reload
+    that lands mid-request cannot mix two versions of the bank.
+    """
+    
+    def __init__(
+        self,
+        questions: Sequence[Dict],
+        generation: int,
+        signature: Signature = None,
+        keyword_index: Optional[BM25Index] = None,
+        categories: Optional[List[str]] = None,
+        source_digest: Optional[str] = None,
+        embeddings: Optional[np.ndarray] = None,
+        embedding_model: Optional[str] = None
+    ):
+        """
+        Build (or wrap prebuilt) indexes for one version of the bank
+        
+        Args:
+            questions: Question bank entries
+            generation: Increases by one with every reload
+            signature: Identity of the file the questions were read from
+            keyword_index: Prebuilt index, e.g. from a compiled bank
+            categories: Prebuilt sorted category list
+            source_digest: SHA-256 of the source file, when known
+            embeddings: Precomputed document embeddings, one row per question
+            embedding_model: Model that produced embeddings
+        """
+        self.questions = questions
+        self.generation = generation
+        self.signature = signature
+        self.source_digest = source_digest
+        self.embeddings = embeddings
+        self.embedding_model = embedding_model
+        self.keyword_index = keyword_index or BM25Index(questions)
+        self.filters = self.keyword_index.filters
+        if categories is None:
+            categories = sorted({q.get("category", "General") for q in questions if isinstance(q, dict)})
+        self.categories = categories
+    
+    def __len__(self) -> int:
+        return len(self.questions)
+
+
+class QuestionBankManager:
+    """
+    Owns the current question bank snapshot and reloads it when the file changes.
+    
+    Reloads build a complete new snapshot on the polling thread and then
+    replace the reference in one assignment; readers never wait and never
+    see a half-built index. If the file cannot be parsed (for example while
+    it is being written) the previous snapshot stays in service.
+    
+    With shared_dir set, snapshots are compiled banks mapped from that
+    directory (see src.compiled_bank): one worker compiles each version and
+    the others attach to it, and generations are shared across workers.
+    
+    With compiled_path set and present, the first snapshot is mapped from
+    that prebuilt artifact instead of parsing the JSON, so startup does
+    not depend on the bank size; the poller still follows later edits.
+    An artifact compiled from different JSON content is ignored.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        poll_interval: Optional[float] = None,
+        shared_dir: Optional[Path] = None,
+        compiled_path: Optional[Path] = None
+    ):
+        """
+        Load the bank synchronously
+        
+        Args:
+            path: Question bank JSON file
+            poll_interval: Seconds between change checks once started
+                (defaults to Config.QUESTION_BANK_POLL_SECONDS; 0 disables)
+            shared_dir: Directory of compiled banks shared with other workers
+                (None builds a private in-process snapshot)
+            compiled_path: Prebuilt artifact (python -m src.compiled_bank)
+        """
+        self.path = Path(path)
+        self.poll_interval = Config.QUESTION_BANK_POLL_SECONDS if poll_interval is None else poll_interval
+        self.shared_dir = Path(shared_dir) if shared_dir else None
+        self.compiled_path = Path(compiled_path) if compiled_path else None
+        self._listeners: List[Callable[[QuestionBankSnapshot], None]] = []
+        self._poll_callbacks: List[Callable[[], None]] = []
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._failed_signature: Signature = None
+        # A newer mtime whose content was found identical to the current snapshot
+        self._verified_signature: Signature = None
+        self.reloads = 0
+        
+        if self.compiled_path is not None and self.compiled_path.exists():
+            from src.compiled_bank import open_compiled_bank
+            try:
+                snapshot = open_compiled_bank(self.compiled_path)
+                digest = file_digest(self.path)
+                if digest is not None and snapshot.source_digest not in (None, digest):
+                    raise ValueError(f"it was compiled from a different version of {self.path}")
+                self._snapshot = snapshot
+                return
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring compiled question bank {self.compiled_path}: {e}")
+        
+        if self.shared_dir is not None:
+            try:
+                self._snapshot = self._attach(force=False, min_generation=0)
+                return
+            except (OSError, ValueError) as e:
+                print(f"Warning: could not use shared question index in {self.shared_dir}, "
+                      f"loading privately: {e}")
+                self.shared_dir = None
+        
+        signature = file_signature(self.path)
+        try:
+            questions = load_question_bank(self.path)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: could not load question bank {self.path}: {e}")
+            questions, signature = [], None
+        self._snapshot = QuestionBankSnapshot(questions, generation=1, signature=signature)
+    
+    @property
+    def snapshot(self) -> QuestionBankSnapshot:
+        """The current snapshot; hold on to it for the whole request"""
+        return self._snapshot
+    
+    def _attach(self, force: bool, min_generation: int) -> QuestionBankSnapshot:
+        """Map the shared build of the current file, compiling it first if nobody has"""
+        from src.compiled_bank import open_compiled_bank, publish_compiled_bank
+        return open_compiled_bank(
+            publish_compiled_bank(self.path, self.shared_dir, force=force, min_generation=min_generation)
+        )
+    
+    def _is_current(self, signature: Signature, snapshot: QuestionBankSnapshot) -> bool:
+        """Whether snapshot already reflects the file (and, when shared, the newest build)"""
+        if signature not in (snapshot.signature, self._verified_signature):
+            # Same bytes under a new mtime (fresh checkout, deploy, touch) need no rebuild
+            if snapshot.source_digest is None or file_digest(self.path) != snapshot.source_digest:
+                return False
+            self._verified_signature = signature
+        if self.shared_dir is None:
+            return True
+        from src.compiled_bank import read_pointer
+        pointer = read_pointer(self.shared_dir)
+        return pointer is None or (
+            pointer.get("generation") == snapshot.generation
+            and pointer.get("source_digest") == snapshot.source_digest
+        )
+    
+    def subscribe(self, listener: Callable[[QuestionBankSnapshot], None]):
+        """Call listener(new_snapshot) after every successful reload"""
+        self._listeners.append(listener)
+    
+    def on_poll(self, callback: Callable[[], None]):
+        """Call callback() on the polling thread after every change check (for files that follow the bank)"""
+        self._poll_callbacks.append(callback)
+    
+    def reload(self, force: bool = False) -> bool:
+        """
+        Rebuild the snapshot if the file changed since it was loaded
+        
+        Args:
+            force: Rebuild even if the file looks unchanged
+        
+        Returns:
+            True if a new snapshot was swapped in
+        """
+        with self._reload_lock:
+            signature = file_signature(self.path)
+            current = self._snapshot
+            if signature is None or (
+                not force and (signature == self._failed_signature or self._is_current(signature, current))
+            ):
+                return False
+            
+            try:
+                if self.shared_dir is not None:
+                    # Numbered above the current snapshot, which may come from the
+                    # prebuilt artifact rather than the shared directory
+                    snapshot = self._attach(force, min_generation=current.generation)
+                else:
+                    snapshot = QuestionBankSnapshot(
+                        load_question_bank(self.path), current.generation + 1, signature
+                    )
+            except (OSError, ValueError) as e:
+                # Typically a write in progress; retried once the file changes again
+                self._failed_signature = signature
+                print(f"Warning: keeping question bank generation {current.generation}, reload failed: {e}")
+                return False
+            
+            if snapshot.generation == current.generation and snapshot.source_digest == current.source_digest:
+                return False
+            self._snapshot = snapshot
+            self._failed_signature = None
+            self.reloads += 1
+        
+        print(f"Reloaded question bank: {len(snapshot)} questions (generation {snapshot.generation})")
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                print(f"Warning: question bank reload listener failed: {e}")
+        return True
+    
+    def start(self):
+        """Poll the file for changes on a daemon thread"""
+        if self.poll_interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, name="question-bank-reload", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop polling (waits for a reload in progress to finish)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _poll(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"Warning: question bank reload failed: {e}")
+            for callback in self._poll_callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Warning: question bank poll callback failed: {e}")
+    
+    def get_stats(self) -> Dict:
+        """Current generation, size and reload count"""
+        snapshot = self._snapshot
+        return {
+            "generation": snapshot.generation,
+            "total_questions": len(snapshot),
+            "reloads": self.reloads,
+            "polling": self._thread is not None,
+            "shared": self.shared_dir is not None
+        }
@@ -0,0 +1,170 @@
+"""
+Rate Limiter Module
+Client-side token-bucket scheduler with priority lanes for LLM provider limits
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import Dict, List, Optional
+
+
+class Priority(IntEnum):
+    """Scheduling lanes; lower values are served first"""
+    INTERACTIVE = 0  # A user is waiting on the response
+    STANDARD = 1
+    BACKGROUND = 2  # Prefetch and batch jobs
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously up to its capacity"""
+    
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        Initialize a full bucket
+        
+        Args:
+            capacity: Maximum burst size
+            refill_per_second: Sustained rate
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.level = capacity
+        self._updated = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+    
+    def time_until(self, amount: float) -> float:
+        """Seconds until amount can be consumed (0 if available now)"""
+        self._refill()
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.refill_per_second
+    
+    def available(self) -> float:
+        """Current level after refilling"""
+        self._refill()
+        return self.level
+    
+    def consume(self, amount: float):
+        """Take amount from the bucket (the level may go negative)"""
+        self._refill()
+        self.level -= amount
+
+
+class RateLimitScheduler:
+    """
+    Admits LLM requests so they stay under requests-per-minute and
+    tokens-per-minute limits. Waiting requests are served strictly by
+    priority lane, then in arrival order.
+    """
+    
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        """
+        Initialize the scheduler
+        
+        Args:
+            requests_per_minute: Request budget per minute
+            tokens_per_minute: Token budget per minute
+        """
+        self.request_bucket = TokenBucket(requests_per_minute, requests_per_minute / 60)
+        self.token_bucket = TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+        self._waiters: List = []  # heap of (priority, sequence, tokens, future)
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._blocked_until = 0.0
+        
+        # Statistics
+        self.granted = {lane.name.lower(): 0 for lane in Priority}
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    async def acquire(self, tokens: int, priority: Priority = Priority.INTERACTIVE) -> float:
+        """
+        Wait until a request costing tokens may be sent
+        
+        Args:
+            tokens: Estimated tokens for the request (prompt + completion)
+            priority: Scheduling lane
+        
+        Returns:
+            Seconds spent waiting
+        """
+        tokens = min(tokens, self.token_bucket.capacity)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), tokens, future))
+        started = time.monotonic()
+        self._dispatch()
+        
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The cancelled entry is skipped when it reaches the head of the heap
+            self._dispatch()
+            raise
+        
+        waited = time.monotonic() - started
+        self.granted[Priority(priority).name.lower()] += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+    
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        """Correct the token budget once the provider reports real usage"""
+        self.token_bucket.consume(actual_tokens - min(estimated_tokens, self.token_bucket.capacity))
+    
+    def backoff(self, seconds: float):
+        """Pause all admissions, e.g. after the provider answered 429"""
+        self.throttled += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self.request_bucket.level = min(self.request_bucket.level, 0)
+    
+    def _dispatch(self):
+        """Grant waiters at the head of the queue while the budgets allow it"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            
+            delay = max(
+                self._blocked_until - time.monotonic(),
+                self.request_bucket.time_until(1),
+                self.token_bucket.time_until(tokens)
+            )
+            if delay > 0:
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(delay, self._dispatch)
+                return
+            
+            heapq.heappop(self._waiters)
+            self.request_bucket.consume(1)
+            self.token_bucket.consume(tokens)
+            future.set_result(None)
+    
+    def get_stats(self) -> Dict:
+        """Get queue depth, wait time and budget counters"""
+        queued = {lane.name.lower(): 0 for lane in Priority}
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                queued[Priority(priority).name.lower()] += 1
+        granted = sum(self.granted.values())
+        return {
+            "queue_depth": sum(queued.values()),
+            "queued_by_priority": queued,
+            "granted_by_priority": dict(self.granted),
+            "average_wait_seconds": round(self.total_wait / granted, 3) if granted else 0.0,
+            "max_wait_seconds": round(self.max_wait, 3),
+            "throttled_responses": self.throttled,
+            "available_requests": round(max(self.request_bucket.available(), 0), 2),
+            "available_tokens": round(max(self.token_bucket.available(), 0))
+        }
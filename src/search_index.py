@@ -0,0 +1,241 @@
+"""
+Keyword Search Index
+In-memory BM25 inverted index over the question bank (production search path)
+"""
+import math
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from src.filter_index import FilterIndex
+
+# Keeps tech terms such as c++, c#, node.js and ci/cd as single tokens
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:[./\-][a-z0-9+#]+)*")
+
+
+def fold_term(token: str) -> str:
+    """
+    Fold plural forms onto their singular (decorators -> decorator)
+    
+    Deliberately light and applied identically to documents and queries,
+    so only purely alphabetic tokens of four or more letters change and
+    words ending in -ss, -us or -is (class, status, redis) are kept.
+    """
+    if len(token) < 4 or not token.isalpha():
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith(("sses", "xes")):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into search terms (plurals folded, see fold_term)"""
+    return [fold_term(token) for token in TOKEN_PATTERN.findall(text.lower())]
+
+
+def format_question(q: Dict) -> Dict:
+    """Shape a question bank entry like the other search_questions results"""
+    hints = q.get('answer_hints', '')
+    if isinstance(hints, str):
+        hints = [hints] if hints else []
+    
+    return {
+        'question': q.get('question', ''),
+        'category': q.get('category', ''),
+        'difficulty': q.get('difficulty', ''),
+        'answer_hints': hints,
+        'keywords': q.get('keywords', []) if isinstance(q.get('keywords'), list) else []
+    }
+
+
+class BM25Index:
+    """
+    BM25F index over question text, keywords and category.
+    
+    Each term's contribution to each document is precomputed at build time
+    and all posting lists live in two flat arrays, so a query is a single
+    vectorized scatter-add over its terms' postings plus a partial sort.
+    """
+    
+    # Field weights, matching the original keyword scorer (2x text, 3x keywords)
+    FIELD_BOOSTS = {"text": 2.0, "keywords": 3.0, "category": 2.0}
+    
+    def __init__(self, questions: List[Dict], k1: float = 1.2, b: float = 0.75):
+        """
+        Build the index
+        
+        Args:
+            questions: Question bank entries
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.questions = questions
+        self.k1 = k1
+        self.b = b
+        # Sorted ASCII vocabulary; term i owns doc_ids/weights[term_offsets[i]:term_offsets[i + 1]],
+        # ids ascending within a term. Plain arrays, so a compiled bank can map them from disk.
+        self.vocabulary = np.zeros(0, dtype='S1')
+        self.term_offsets = np.zeros(1, dtype=np.int64)
+        self.doc_ids = np.zeros(0, dtype=np.uint32)
+        self.weights = np.zeros(0, dtype=np.float32)
+        self._build()
+        self.filters = FilterIndex(questions)
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        questions: Sequence[Dict],
+        vocabulary: np.ndarray,
+        term_offsets: np.ndarray,
+        doc_ids: np.ndarray,
+        weights: np.ndarray,
+        filters: FilterIndex,
+        k1: float = 1.2,
+        b: float = 0.75
+    ) -> "BM25Index":
+        """Wrap prebuilt (e.g. memory-mapped) index arrays without rebuilding"""
+        index = cls.__new__(cls)
+        index.questions = questions
+        index.k1 = k1
+        index.b = b
+        index.vocabulary = vocabulary
+        index.term_offsets = term_offsets
+        index.doc_ids = doc_ids
+        index.weights = weights
+        index.filters = filters
+        return index
+    
+    @staticmethod
+    def _fields(q: Dict) -> Dict[str, List[str]]:
+        """Tokenized searchable fields of a question"""
+        keywords = q.get('keywords', [])
+        if isinstance(keywords, str):
+            keywords = [k.strip() for k in keywords.split(',')]
+        return {
+            "text": tokenize(q.get('question', '')),
+            "keywords": tokenize(" ".join(keywords)),
+            "category": tokenize(q.get('category', ''))
+        }
+    
+    def _build(self):
+        n_docs = len(self.questions)
+        if n_docs == 0:
+            return
+        
+        doc_fields = [self._fields(q) for q in self.questions]
+        avg_length = {
+            field: max(sum(len(f[field]) for f in doc_fields) / n_docs, 1.0)
+            for field in self.FIELD_BOOSTS
+        }
+        
+        # term -> {doc id -> length-normalized, boosted term frequency}
+        weighted_tf: Dict[str, Dict[int, float]] = {}
+        for doc_id, fields in enumerate(doc_fields):
+            for field, tokens in fields.items():
+                if not tokens:
+                    continue
+                norm = 1 - self.b + self.b * len(tokens) / avg_length[field]
+                boost = self.FIELD_BOOSTS[field] / norm
+                for token in tokens:
+                    docs = weighted_tf.setdefault(token, {})
+                    docs[doc_id] = docs.get(doc_id, 0.0) + boost
+        
+        vocabulary = sorted(weighted_tf)
+        doc_ids = []
+        weights = []
+        term_offsets = [0]
+        for term in vocabulary:
+            docs = weighted_tf[term]
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id in sorted(docs):
+                tf = docs[doc_id]
+                doc_ids.append(doc_id)
+                weights.append(idf * tf * (self.k1 + 1) / (tf + self.k1))
+            term_offsets.append(len(doc_ids))
+        
+        # Tokens are ASCII by construction (see TOKEN_PATTERN)
+        self.vocabulary = np.array([term.encode('ascii') for term in vocabulary])
+        self.term_offsets = np.array(term_offsets, dtype=np.int64)
+        self.doc_ids = np.array(doc_ids, dtype=np.uint32)
+        self.weights = np.array(weights, dtype=np.float32)
+    
+    def __len__(self) -> int:
+        return len(self.questions)
+    
+    def postings(self, term: str) -> Optional[Tuple[int, int]]:
+        """(start, end) slice of doc_ids/weights for a term, or None if unindexed"""
+        key = term.encode('ascii', errors='ignore')
+        # Longer keys would be truncated to the vocabulary width and could false-match
+        if not key or len(key) > self.vocabulary.dtype.itemsize:
+            return None
+        i = int(np.searchsorted(self.vocabulary, key))
+        if i == len(self.vocabulary) or self.vocabulary[i] != key:
+            return None
+        return int(self.term_offsets[i]), int(self.term_offsets[i + 1])
+    
+    def score(self, query: str) -> np.ndarray:
+        """
+        Score every document against query
+        
+        Args:
+            query: Free-text query
+        
+        Returns:
+            Array of BM25 scores indexed by document id (0 = no match)
+        """
+        slices = [span for span in map(self.postings, set(tokenize(query))) if span is not None]
+        if not slices:
+            return np.zeros(len(self.questions), dtype=np.float64)
+        ids = np.concatenate([self.doc_ids[start:end] for start, end in slices])
+        weights = np.concatenate([self.weights[start:end] for start, end in slices])
+        return np.bincount(ids, weights=weights, minlength=len(self.questions))
+    
+    def top_k(self, scores: np.ndarray, n_results: int, candidates: Optional[np.ndarray] = None) -> List[int]:
+        """
+        Document ids of the n_results highest positive scores; ties keep bank order
+        
+        Args:
+            scores: Scores indexed by document id
+            n_results: Number of ids to return
+            candidates: Sorted document ids to choose from (all when None)
+        """
+        if candidates is None:
+            matched = np.flatnonzero(scores > 0)
+        else:
+            matched = candidates[scores[candidates] > 0]
+        if len(matched) > n_results:
+            keep = np.argpartition(-scores[matched], n_results - 1)[:n_results]
+            matched = matched[keep]
+        order = np.lexsort((matched, -scores[matched]))
+        return matched[order].tolist()
+    
+    def search(
+        self,
+        query: str,
+        n_results: int = 5,
+        category: Optional[str] = None,
+        difficulty: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Return the top n_results questions for query
+        
+        Args:
+            query: Free-text query
+            n_results: Number of results
+            category: Category filter (case-insensitive)
+            difficulty: Difficulty filter (case-insensitive)
+        
+        Returns:
+            Result dicts in the same shape as VectorStore.search_questions
+        """
+        if n_results <= 0:
+            return []
+        scores = self.score(query)
+        candidates = self.filters.lookup(category, difficulty) if category or difficulty else None
+        return [
+            format_question(self.questions[doc_id])
+            for doc_id in self.top_k(scores, n_results, candidates)
+        ]
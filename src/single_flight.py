@@ -0,0 +1,56 @@
+"""
+Single-Flight Module
+Coalesces concurrent identical async calls into one upstream execution
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its result"""
+    
+    def __init__(self):
+        """Initialize the in-flight call registry"""
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func() for key, or join the identical call already in flight
+        
+        Args:
+            key: Identity of the call (callers with equal keys share a result)
+            func: Zero-argument coroutine factory that performs the call
+        
+        Returns:
+            The shared result; an exception from the call is raised to every caller
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        
+        # Shield so one caller timing out does not cancel the call for the others
+        return await asyncio.shield(future)
+    
+    def _finish(self, key: str, future: asyncio.Future):
+        """Forget a completed call and mark its exception as retrieved"""
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()
+    
+    def get_stats(self) -> Dict:
+        """Get upstream vs. coalesced call counters"""
+        total = self.executed + self.coalesced
+        return {
+            "in_flight": len(self._calls),
+            "upstream_calls": self.executed,
+            "coalesced_calls": self.coalesced,
+            "coalesced_rate": round(self.coalesced / total, 3) if total else 0.0
+        }
@@ -0,0 +1,163 @@
+"""
+Skill Matcher Module
+Single-pass Aho-Corasick matching of a skill taxonomy (with aliases) in job descriptions
+"""
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+WHITESPACE = re.compile(r"\s+")
+
+# Used when no taxonomy file is available (the original built-in keyword list)
+DEFAULT_SKILLS = [
+    "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
+    "react", "angular", "vue", "node.js", "express", "django", "flask", "fastapi",
+    "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy",
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "git",
+    "sql", "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
+    "rest", "graphql", "microservices", "api", "ci/cd",
+    "machine learning", "deep learning", "nlp", "computer vision",
+    "agile", "scrum", "devops"
+]
+
+
+def normalize_term(text: str) -> str:
+    """Lowercase and collapse whitespace (applied to both patterns and text)"""
+    return WHITESPACE.sub(" ", text.lower()).strip()
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every skill name and alias.
+    
+    The automaton is built once; matching walks the text a single time, so
+    extraction is linear in the text length whatever the taxonomy size.
+    Matches must start and end on word boundaries (no letter, digit or
+    underscore on either side), which also works for names such as c++,
+    c# and .net that regex \\b boundaries miss.
+    """
+    
+    def __init__(self, taxonomy: Dict[str, Iterable[str]]):
+        """
+        Build the automaton
+        
+        Args:
+            taxonomy: Canonical skill name -> aliases
+        """
+        # goto[state][char] -> state; out[state] -> (pattern length, canonical name)
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[Tuple[Tuple[int, str], ...]] = [()]
+        self.canonical: Dict[str, str] = {}
+        
+        for name, aliases in taxonomy.items():
+            canonical = normalize_term(name)
+            for term in (name, *aliases):
+                term = normalize_term(term)
+                if term and term not in self.canonical:
+                    self.canonical[term] = canonical
+                    self._add(term, canonical)
+        self._link()
+    
+    def _add(self, term: str, canonical: str):
+        state = 0
+        for char in term:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append(())
+                self.goto[state][char] = next_state
+            state = next_state
+        self.out[state] = self.out[state] + ((len(term), canonical),)
+    
+    def _link(self):
+        """Breadth-first failure links; outputs of suffix states are merged in"""
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, child in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+                queue.append(child)
+    
+    def __len__(self) -> int:
+        """Number of names and aliases matched"""
+        return len(self.canonical)
+    
+    def find(self, text: str) -> Set[str]:
+        """
+        Canonical names of every skill or alias that occurs in text
+        
+        Args:
+            text: Free text (a job description)
+        
+        Returns:
+            Set of canonical skill names
+        """
+        text = normalize_term(text)
+        goto, fail, out = self.goto, self.fail, self.out
+        found = set()
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            if end < len(text) and _is_word_char(text[end]):
+                continue
+            for length, canonical in out[state]:
+                start = end - length
+                if canonical not in found and (start == 0 or not _is_word_char(text[start - 1])):
+                    found.add(canonical)
+        return found
+
+
+def load_taxonomy(path: Path) -> Dict[str, List[str]]:
+    """
+    Read a skill taxonomy file
+    
+    The file maps canonical names to aliases:
+        {"skills": {"kubernetes": ["k8s", "kube"], "python": []}}
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        skills = json.load(f).get("skills", {})
+    return {name: list(aliases or []) for name, aliases in skills.items()}
+
+
+_matchers: Dict[Optional[str], SkillMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_skill_matcher(path: Optional[Path] = None) -> SkillMatcher:
+    """
+    Shared matcher for a taxonomy file, built on first use
+    
+    Args:
+        path: Taxonomy JSON; the built-in keyword list if None or unreadable
+    """
+    key = str(path) if path else None
+    matcher = _matchers.get(key)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                taxonomy = {name: [] for name in DEFAULT_SKILLS}
+                if path is not None:
+                    try:
+                        taxonomy = load_taxonomy(path)
+                    except (OSError, json.JSONDecodeError) as e:
+                        print(f"Warning: could not load skill taxonomy {path}, using built-in list: {e}")
+                matcher = _matchers[key] = SkillMatcher(taxonomy)
+    return matcher
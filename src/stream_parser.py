@@ -0,0 +1,92 @@
+"""
+Streaming JSON Parser
+Extracts top-level fields from a JSON object while it is still being generated
+"""
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JSONFieldStreamer:
+    """
+    Incrementally scans a streamed JSON object and reports each top-level
+    field as soon as its value is complete.
+    
+    Text before the opening brace (such as a ```json fence) is ignored.
+    """
+    
+    def __init__(self):
+        """Initialize scanner state"""
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._finished = False
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+    
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        Add streamed text and return the fields completed by it
+        
+        Args:
+            text: Next chunk of model output
+        
+        Returns:
+            List of (field name, parsed value) pairs, in document order
+        """
+        self._buffer += text
+        completed = []
+        
+        while self._pos < len(self._buffer) and not self._finished:
+            i = self._pos
+            char = self._buffer[i]
+            self._pos += 1
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = json.loads(self._buffer[self._key_start:i + 1])
+                        self._key_start = None
+                continue
+            
+            if self._depth == 0:
+                # Skip anything before the top-level object opens
+                if char == "{":
+                    self._depth = 1
+                continue
+            
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._key is None:
+                    self._key_start = i
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 1:
+                    self._emit(i, completed)
+                    self._finished = True
+                self._depth -= 1
+            elif char == ":" and self._depth == 1 and self._key is not None and self._value_start is None:
+                self._value_start = i + 1
+            elif char == "," and self._depth == 1:
+                self._emit(i, completed)
+        
+        return completed
+    
+    def _emit(self, end: int, completed: List[Tuple[str, Any]]):
+        """Parse the value ending at end and reset for the next key"""
+        if self._key is not None and self._value_start is not None:
+            raw_value = self._buffer[self._value_start:end].strip()
+            try:
+                completed.append((self._key, json.loads(raw_value)))
+            except json.JSONDecodeError:
+                pass
+        self._key = None
+        self._value_start = None
@@ -0,0 +1,65 @@
+"""
+Token Counter Module
+Estimates prompt sizes with tiktoken, falling back to a character heuristic
+"""
+import asyncio
+import threading
+from typing import Awaitable, Dict, List, Optional
+from config.config import Config
+
+_encoding = None
+_encoding_loaded = False
+# Set while a background load is running; callers estimate instead of waiting
+_encoding_loading = False
+_encoding_lock = threading.Lock()
+
+
+def load_encoding():
+    """
+    Load the tiktoken encoding once (None if tiktoken is unavailable)
+    
+    Blocking: on a cold cache tiktoken downloads the BPE file, so call
+    this from a worker thread (see preload_encoding), never the event loop.
+    """
+    global _encoding, _encoding_loaded
+    with _encoding_lock:
+        if not _encoding_loaded:
+            try:
+                import tiktoken
+                _encoding = tiktoken.get_encoding(Config.TOKENIZER_ENCODING)
+            except Exception as e:
+                print(f"Warning: tiktoken unavailable, estimating tokens from length: {e}")
+                _encoding = None
+            _encoding_loaded = True
+    return _encoding
+
+
+def preload_encoding() -> Awaitable:
+    """Load the encoding in a worker thread; token counts are estimated until it finishes"""
+    global _encoding_loading
+    _encoding_loading = True
+    return asyncio.to_thread(load_encoding)
+
+
+def _get_encoding() -> Optional[object]:
+    if _encoding_loaded:
+        return _encoding
+    if _encoding_loading:
+        return None
+    # Scripts and tools that never preload: load on first use
+    return load_encoding()
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in text (approximate for non-OpenAI models)"""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: List[Dict]) -> int:
+    """Count tokens in a chat message list, including per-message overhead"""
+    return sum(count_tokens(str(m.get("content", ""))) + 4 for m in messages) + 2
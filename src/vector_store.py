@@ -2,88 +2,257 @@
 Vector Store Module - RAG Core
 Handles embeddings, vector storage, and semantic search using ChromaDB
 """
-import chromadb
-from chromadb.config import Settings
-from typing import List, Dict, Optional
-import json
+from typing import List, Dict, Optional, Sequence, Tuple
 from pathlib import Path
-from sentence_transformers import SentenceTransformer
+import numpy as np
 from config.config import Config
+from src.cache import LRUCache
+from src.embeddings import encode, encode_query, get_embedding_model, question_document
+from src.question_bank import assign_ids, content_hash, load_question_bank
+from src.question_bank_manager import QuestionBankManager, QuestionBankSnapshot
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query (cache key)"""
+    return " ".join(query.lower().split())
+
 
 class VectorStore:
     """Manages vector database operations for RAG"""
     
-    def __init__(self):
+    # Questions encoded and written to Chroma per add() call
+    ADD_CHUNK_SIZE = 1024
+    
+    def __init__(self, question_bank: Optional[QuestionBankManager] = None):
         """
         Initialize vector store - lightweight mode for production
+        
+        Args:
+            question_bank: Shared bank manager; keyword search follows its
+                reloads. A private, non-polling one is created if omitted.
         """
+        # Query embedding and result caches; generation changes on every rebuild
+        self.generation = 0
+        self.embedding_cache = LRUCache(Config.SEARCH_EMBEDDING_CACHE_SIZE)
+        self.result_cache = LRUCache(Config.SEARCH_RESULT_CACHE_SIZE)
+        
+        self.question_bank = question_bank or QuestionBankManager(
+            Config.QUESTIONS_FILE, poll_interval=0, compiled_path=Config.QUESTION_BANK_COMPILED
+        )
+        self.question_bank.subscribe(self._on_bank_reload)
+        
         # Skip ChromaDB initialization if embeddings disabled (production mode)
         if not Config.USE_EMBEDDINGS:
             print("Production mode: Keyword-based search (no ChromaDB)")
             self.client = None
             self.embedding_model = None
             self.collection = None
+            self.dense_index = None
+            return
+        
+        self.dense_index = None
+        if Config.VECTOR_BACKEND == "numpy":
+            self._init_dense_index()
             return
         
         # Initialize ChromaDB client for local development
+        import chromadb
+        from chromadb.config import Settings
+        
         self.client = chromadb.PersistentClient(
             path=Config.CHROMA_PERSIST_DIR,
             settings=Settings(anonymized_telemetry=False)
         )
         
         print("Development mode: Using embeddings (sentence-transformers)")
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-        
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
+        # One model embeds both documents and queries; Chroma gets explicit vectors
+        self.embedding_model = get_embedding_model(Config.EMBEDDING_MODEL)
+        self.collection = self._get_collection()
+        # Never serve from an empty or stale collection; only differences are embedded
+        self.sync_from_bank(self.question_bank.snapshot)
+    
+    def _get_collection(self):
+        """Get or create the questions collection (no Chroma-side embedding function)"""
+        return self.client.get_or_create_collection(
             name="interview_questions",
-            metadata={"hnsw:space": "cosine"}
+            metadata={"hnsw:space": "cosine"},
+            embedding_function=None
+        )
+    
+    def _init_dense_index(self):
+        """Open the precomputed numpy index, falling back to keyword search if missing"""
+        self.client = None
+        self.collection = None
+        from src.dense_index import DenseIndex
+        try:
+            self.dense_index = DenseIndex(Config.DENSE_INDEX_DIR)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not open dense index ({e}); using keyword search")
+            print("Build it with: python -m src.dense_index")
+            self.embedding_model = None
+            return
+        
+        print(
+            f"Development mode: Using numpy dense index "
+            f"({len(self.dense_index)} questions, {self.dense_index.kind})"
         )
+        self.embedding_model = get_embedding_model(self.dense_index.model_name)
+        # Like the Chroma sync: never serve from an index built for an older bank
+        self._refresh_dense_index(self.question_bank.snapshot)
     
-    def _get_embedding(self, text: str) -> List[float]:
-        """Generate embedding for text using local model"""
-        if self.embedding_model:
-            return self.embedding_model.encode(text).tolist()
-        else:
-            # Return dummy embedding for production (won't be used)
-            return [0.0] * 384
+    def _get_embedding(self, text: str) -> np.ndarray:
+        """Embed a search query with the same model used for the documents"""
+        model_name = self.dense_index.model_name if self.dense_index is not None else Config.EMBEDDING_MODEL
+        key = (self.generation, model_name, normalize_query(text))
+        embedding = self.embedding_cache.get(key)
+        if embedding is None:
+            embedding = encode_query(text, model_name)
+            self.embedding_cache.set(key, embedding)
+        return embedding
+    
+    def invalidate_caches(self):
+        """Drop cached embeddings and results after the index changes"""
+        self.generation += 1
+        self.embedding_cache.clear()
+        self.result_cache.clear()
+    
+    def _on_bank_reload(self, snapshot: QuestionBankSnapshot):
+        """Follow a question bank reload (runs on the manager's polling thread)"""
+        if self.collection is not None:
+            # Only the edited questions are re-embedded
+            self.sync_from_bank(snapshot)
+        if self.dense_index is not None:
+            self._refresh_dense_index(snapshot)
+        self.invalidate_caches()
+    
+    def _refresh_dense_index(self, snapshot: QuestionBankSnapshot):
+        """Rebuild the numpy index for a new bank version and swap it in"""
+        from src.dense_index import refresh_dense_index
+        try:
+            index = refresh_dense_index(self.dense_index, list(snapshot.questions))
+        except (OSError, ValueError) as e:
+            print(f"Warning: keeping the previous dense index, rebuild failed: {e}")
+            return
+        if index is not self.dense_index:
+            self.dense_index = index
+            print(f"Rebuilt dense index: {len(index)} questions")
+    
+    def sync_from_bank(self, snapshot: QuestionBankSnapshot) -> Dict:
+        """Sync the collection with a bank snapshot, reusing its precomputed embeddings if any"""
+        embeddings = snapshot.embeddings if snapshot.embedding_model == Config.EMBEDDING_MODEL else None
+        return self.sync_questions(snapshot.questions, embeddings)
     
     def add_questions(self, questions: List[Dict]):
         """
-        Add interview questions to vector store
+        Add or update interview questions in the vector store
+        
+        Questions are keyed by stable content-derived ids, so adding a
+        question again overwrites it instead of duplicating it.
         """
         # Skip if in production mode
         if not Config.USE_EMBEDDINGS:
             print("Production mode: Skipping vector store population")
             return
+        if self.collection is None:
+            print("Numpy backend: build the index offline with: python -m src.dense_index")
+            return
+        
+        entries = assign_ids(questions)
+        self._upsert(list(entries.items()))
+        self.invalidate_caches()
+        print(f"Added {len(entries)} questions to vector store")
+    
+    def sync_questions(self, questions: Sequence[Dict], embeddings: Optional[np.ndarray] = None) -> Dict:
+        """
+        Bring the collection in line with a question bank
         
-        documents = []
-        metadatas = []
-        ids = []
+        Only questions that are new or whose indexed fields changed are
+        embedded; questions no longer in the bank are deleted.
         
-        for idx, q in enumerate(questions):
-            # Create rich document text for better embedding
-            doc_text = f"{q['question']} {' '.join(q.get('keywords', []))}"
-            documents.append(doc_text)
-            
-            metadatas.append({
-                "category": q.get("category", "General"),
-                "difficulty": q.get("difficulty", "Medium"),
-                "question": q["question"],
-                "answer_hints": q.get("answer_hints", ""),
-                "keywords": ",".join(q.get("keywords", []))
-            })
-            
-            ids.append(f"q_{idx}")
+        Args:
+            questions: Full question bank
+            embeddings: Precomputed document embeddings (Config.EMBEDDING_MODEL),
+                one row per question; used instead of running the encoder
         
-        # Add to collection
-        self.collection.add(
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
+        Returns:
+            Counts of added, updated, deleted and unchanged questions
+        """
+        if self.collection is None:
+            return {"added": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        
+        # assign_ids keeps bank order, so the i-th id belongs to embeddings[i]
+        wanted = assign_ids(questions)
+        existing = self.collection.get(include=["metadatas"])
+        indexed = dict(zip(existing["ids"], existing["metadatas"]))
+        
+        stale = [qid for qid in indexed if qid not in wanted]
+        changed = [
+            (qid, q) for qid, q in wanted.items()
+            if qid not in indexed
+            or indexed[qid].get("content_hash") != content_hash(q)
+            or indexed[qid].get("embedding_model") != Config.EMBEDDING_MODEL
+        ]
         
-        print(f"Added {len(questions)} questions to vector store")
+        vectors = None
+        if embeddings is not None and changed:
+            row = {qid: i for i, qid in enumerate(wanted)}
+            vectors = embeddings[[row[qid] for qid, _ in changed]]
+        
+        for start in range(0, len(stale), self.ADD_CHUNK_SIZE):
+            self.collection.delete(ids=stale[start:start + self.ADD_CHUNK_SIZE])
+        self._upsert(changed, vectors)
+        if stale or changed:
+            self.invalidate_caches()
+        
+        added = sum(1 for qid, _ in changed if qid not in indexed)
+        stats = {
+            "added": added,
+            "updated": len(changed) - added,
+            "deleted": len(stale),
+            "unchanged": len(wanted) - len(changed)
+        }
+        print(
+            f"Synced vector store: {stats['added']} added, {stats['updated']} updated, "
+            f"{stats['deleted']} deleted, {stats['unchanged']} unchanged"
+        )
+        return stats
+    
+    def _upsert(self, entries: List[Tuple[str, Dict]], vectors: Optional[np.ndarray] = None):
+        """Write (question id, question) pairs in chunks, embedding them unless vectors (one per entry) are given"""
+        # The encoder batches within each chunk
+        for start in range(0, len(entries), self.ADD_CHUNK_SIZE):
+            chunk = entries[start:start + self.ADD_CHUNK_SIZE]
+            documents = []
+            metadatas = []
+            ids = []
+            
+            for qid, q in chunk:
+                # Create rich document text for better embedding
+                documents.append(question_document(q))
+                
+                metadatas.append({
+                    "category": q.get("category", "General"),
+                    "difficulty": q.get("difficulty", "Medium"),
+                    "question": q["question"],
+                    "answer_hints": q.get("answer_hints", ""),
+                    "keywords": ",".join(q.get("keywords", [])),
+                    "content_hash": content_hash(q),
+                    "embedding_model": Config.EMBEDDING_MODEL
+                })
+                
+                ids.append(qid)
+            
+            if vectors is None:
+                chunk_vectors = encode(documents, Config.EMBEDDING_MODEL)
+            else:
+                chunk_vectors = vectors[start:start + self.ADD_CHUNK_SIZE]
+            
+            self.collection.upsert(
+                ids=ids,
+                embeddings=np.asarray(chunk_vectors, dtype=np.float32).tolist(),
+                documents=documents,
+                metadatas=metadatas
+            )
     
     def search_questions(
         self, 
@@ -100,14 +269,36 @@ class VectorStore:
             n_results: Number of results to return
             category: Filter by category
             difficulty: Filter by difficulty
-            
+        
         Returns:
             List of relevant questions with metadata
         """
+        key = (self.generation, normalize_query(query), n_results, category, difficulty)
+        results = self.result_cache.get(key)
+        if results is None:
+            results = self._search(query, n_results, category, difficulty)
+            self.result_cache.set(key, results)
+        
+        # Shallow copies, so callers can annotate results without touching the cache
+        return [dict(result) for result in results]
+    
+    def _search(
+        self,
+        query: str,
+        n_results: int,
+        category: Optional[str],
+        difficulty: Optional[str]
+    ) -> List[Dict]:
+        """Run a search against the active backend (no result cache)"""
         # If embeddings disabled, use keyword-based search from JSON
         if not Config.USE_EMBEDDINGS:
             return self._keyword_search(query, n_results, category, difficulty)
         
+        if Config.VECTOR_BACKEND == "numpy":
+            if self.dense_index is None:
+                return self._keyword_search(query, n_results, category, difficulty)
+            return self.dense_index.search(self._get_embedding(query), n_results, category, difficulty)
+        
         where_filter = {}
         
         if category:
@@ -117,7 +308,7 @@ class VectorStore:
         
         # Perform semantic search
         results = self.collection.query(
-            query_texts=[query],
+            query_embeddings=[self._get_embedding(query).tolist()],
             n_results=n_results,
             where=where_filter if where_filter else None
         )
@@ -138,16 +329,16 @@ class VectorStore:
         return questions
     
     def load_questions_from_file(self, file_path: Path):
-        """Load questions from JSON file"""
+        """Sync the collection with a question bank JSON file"""
         # Skip if in production mode
         if not Config.USE_EMBEDDINGS:
             print("Production mode: Skipping vector store loading")
             return
+        if self.collection is None:
+            print("Numpy backend: build the index offline with: python -m src.dense_index")
+            return
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            questions = data.get("questions", [])
-            self.add_questions(questions)
+        self.sync_questions(load_question_bank(file_path))
     
     def clear_database(self):
         """Clear all data from the collection"""
@@ -156,10 +347,8 @@ class VectorStore:
             return
         
         self.client.delete_collection("interview_questions")
-        self.collection = self.client.get_or_create_collection(
-            name="interview_questions",
-            metadata={"hnsw:space": "cosine"}
-        )
+        self.collection = self._get_collection()
+        self.invalidate_caches()
         print("Vector database cleared")
     
     def _keyword_search(
@@ -172,112 +361,59 @@ class VectorStore:
         """
         Lightweight keyword-based search for production (low memory)
         """
-        # Load questions from JSON
-        questions_file = Config.BASE_DIR / "data" / "interview_questions.json"
-        with open(questions_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            all_questions = data.get('questions', [])
-        
-        # Filter by category/difficulty
-        filtered = []
-        for q in all_questions:
-            if category and q.get('category') != category:
-                continue
-            if difficulty and q.get('difficulty') != difficulty:
-                continue
-            filtered.append(q)
-        
-        # Score by keyword matching
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-        
-        scored_questions = []
-        for q in filtered:
-            score = 0
-            # Check question text
-            q_text = q.get('question', '').lower()
-            score += sum(1 for word in query_words if word in q_text) * 2
-            
-            # Check keywords
-            keywords = q.get('keywords', [])
-            if isinstance(keywords, str):
-                keywords = [k.strip() for k in keywords.split(',')]
-            score += sum(1 for kw in keywords if kw.lower() in query_lower) * 3
-            
-            # Check category
-            if q.get('category', '').lower() in query_lower:
-                score += 2
-            
-            if score > 0:
-                scored_questions.append((score, q))
-        
-        # Sort by score and return top results
-        scored_questions.sort(key=lambda x: x[0], reverse=True)
-        
-        results = []
-        for _, q in scored_questions[:n_results]:
-            hints = q.get('answer_hints', '')
-            if isinstance(hints, str):
-                hints = [hints] if hints else []
-            
-            results.append({
-                'question': q.get('question', ''),
-                'category': q.get('category', ''),
-                'difficulty': q.get('difficulty', ''),
-                'answer_hints': hints,
-                'keywords': q.get('keywords', []) if isinstance(q.get('keywords'), list) else []
-            })
-        
-        return results
+        return self.question_bank.snapshot.keyword_index.search(query, n_results, category, difficulty)
     
     def get_stats(self) -> Dict:
         """Get statistics about the vector store"""
+        if self.dense_index is not None:
+            return {
+                "total_questions": len(self.dense_index),
+                "embedding_model": f"{self.dense_index.model_name} (numpy, {self.dense_index.kind})"
+            }
+        
         if not Config.USE_EMBEDDINGS or not self.collection:
-            # Return stats from JSON file in production
-            questions_file = Config.BASE_DIR / "data" / "interview_questions.json"
-            try:
-                with open(questions_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return {
-                        "total_questions": len(data.get('questions', [])),
-                        "embedding_model": "keyword-based (production)"
-                    }
-            except:
-                return {
-                    "total_questions": 0,
-                    "embedding_model": "keyword-based (production)"
-                }
+            return {
+                "total_questions": len(self.question_bank.snapshot),
+                "embedding_model": "keyword-based BM25 (production)"
+            }
         
         count = self.collection.count()
         return {
             "total_questions": count,
-            "embedding_model": "all-MiniLM-L6-v2 (local)"
+            "embedding_model": f"{Config.EMBEDDING_MODEL} (local)"
+        }
+    
+    def get_cache_stats(self) -> Dict:
+        """Get hit/miss counters for the query embedding and result caches"""
+        return {
+            "generation": self.generation,
+            "embeddings": self.embedding_cache.get_stats(),
+            "results": self.result_cache.get_stats()
         }
 
 
 def initialize_vector_store(force_reload: bool = False) -> VectorStore:
     """
-    Initialize and populate vector store
+    Initialize vector store and sync it with the question bank
+    
+    Only new or edited questions are embedded; see VectorStore.sync_questions.
     
     Args:
-        force_reload: If True, clear existing data and reload
-        
+        force_reload: If True, clear existing data and re-embed everything
+    
     Returns:
         Initialized VectorStore instance
     """
+    # Construction already syncs the Chroma collection with the bank
     vector_store = VectorStore()
     
-    # Check if already populated
-    stats = vector_store.get_stats()
+    # Keyword and numpy backends are built from the bank elsewhere
+    if vector_store.collection is None:
+        return vector_store
     
-    if stats["total_questions"] == 0 or force_reload:
-        if force_reload:
-            vector_store.clear_database()
-        
-        # Load questions from file
-        if Config.QUESTIONS_FILE.exists():
-            vector_store.load_questions_from_file(Config.QUESTIONS_FILE)
-        else:
-            print("Warning: Questions file not found. Please run data generation.")
+    if force_reload:
+        vector_store.clear_database()
+        vector_store.sync_from_bank(vector_store.question_bank.snapshot)
     
     return vector_store
+
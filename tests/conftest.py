@@ -0,0 +1,14 @@
+"""
+Test configuration
+Runs the suite against the offline fake LLM provider
+"""
+import os
+
+# config.config validates on import and needs a key for the Groq provider
+os.environ.setdefault("LLM_PROVIDER", "fake")
+os.environ.setdefault("FAKE_LLM_LATENCY_MS", "0")
+os.environ.setdefault("FAKE_LLM_JITTER_MS", "0")
+# Keep tests off the shared on-disk cache and background threads
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("WARMUP_ON_STARTUP", "false")
+os.environ.setdefault("QUESTION_BANK_POLL_SECONDS", "0")
@@ -0,0 +1,31 @@
+"""
+Answer evaluator tests
+Independent LLM calls must run concurrently
+"""
+import asyncio
+from src.answer_evaluator import AnswerEvaluator
+
+
+class SlowScorer:
+    """LLM service stand-in that records how many evaluations overlap"""
+    
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+    
+    async def evaluate_answer(self, question, user_answer):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return {"score": len(user_answer)}
+
+
+def test_compare_answers_scores_concurrently():
+    scorer = SlowScorer()
+    evaluator = AnswerEvaluator(llm_service=scorer)
+    
+    result = asyncio.run(evaluator.compare_answers("What is a list?", "short", "a longer answer"))
+    assert scorer.peak == 2
+    assert result["better_answer"] == "Answer 2"
+    assert result["score_difference"] == len("a longer answer") - len("short")
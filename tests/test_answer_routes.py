@@ -0,0 +1,29 @@
+"""
+Answer route tests
+Evaluation results must reach the API response
+"""
+import pytest
+from fastapi.testclient import TestClient
+from api.main import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("mode", ["multi", "structured"])
+def test_evaluation_feedback_reaches_response(client, mode):
+    response = client.post("/api/evaluate-answer", json={
+        "question": "What is a Python decorator?",
+        "user_answer": "A decorator wraps a function to add behaviour, for example logging or caching.",
+        "category": "Python",
+        "difficulty": "Medium",
+        "evaluation_mode": mode
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["follow_up_questions"]
+    assert body["weaknesses"]
+    assert body["improvements"]
@@ -0,0 +1,36 @@
+"""
+Answer store tests
+A running server must pick up answers precomputed after it loaded the store
+"""
+import json
+from src.answer_store import AnswerStore
+
+
+def answer(text):
+    return {"answer": text, "key_points": []}
+
+
+def test_refresh_picks_up_answers_written_later(tmp_path):
+    path = tmp_path / "answers.json"
+    writer = AnswerStore(path)
+    writer.put("What is a list?", "mutable", answer("A mutable sequence"))
+    writer.save()
+    
+    server = AnswerStore(path)
+    assert server.get("What is a tuple?", "immutable") is None
+    assert not server.refresh()
+    
+    writer.put("What is a tuple?", "immutable", answer("An immutable sequence"))
+    writer.save()
+    assert server.refresh()
+    assert server.get("What is a tuple?", "immutable")["answer"] == "An immutable sequence"
+    assert server.get("What is a list?", "mutable")["answer"] == "A mutable sequence"
+
+
+def test_non_object_file_is_ignored(tmp_path):
+    path = tmp_path / "answers.json"
+    path.write_text(json.dumps([{"answer": "not a store"}]))
+    
+    store = AnswerStore(path)
+    assert store.answers == {}
+    assert store.get("What is a list?") is None
@@ -0,0 +1,34 @@
+"""
+LLM response cache tests
+Expired rows must not accumulate in the SQLite tier
+"""
+import time
+from src.cache import LLMResponseCache
+
+
+def disk_rows(cache):
+    return cache.get_stats()["disk_entries"]
+
+
+def test_expired_rows_are_purged_periodically(tmp_path, monkeypatch):
+    monkeypatch.setattr(LLMResponseCache, "PURGE_EVERY_WRITES", 10)
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3")
+    for i in range(9):
+        cache.set(f"old-{i}", "response", ttl=0.01)
+    time.sleep(0.05)
+    assert disk_rows(cache) == 9
+    
+    cache.set("fresh", "response", ttl=60)
+    assert disk_rows(cache) == 1
+    assert cache.get("fresh") == "response"
+
+
+def test_expired_rows_are_purged_at_startup(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3")
+    cache.set("old", "response", ttl=0.01)
+    cache.set("kept", "response")
+    time.sleep(0.05)
+    
+    reopened = LLMResponseCache(tmp_path / "cache.sqlite3")
+    assert disk_rows(reopened) == 1
+    assert reopened.purged == 1
@@ -0,0 +1,128 @@
+"""
+Dense index reload tests
+The numpy backend must follow question bank reloads
+"""
+import json
+import zlib
+import numpy as np
+import pytest
+from config.config import Config
+from src import embeddings
+from src.dense_index import DenseIndex, build_dense_index
+from src.question_bank_manager import QuestionBankManager
+from src.vector_store import VectorStore
+
+MODEL = "fake-bag-of-words"
+
+
+class BagOfWordsModel:
+    """Deterministic stand-in for a sentence-transformers model"""
+    
+    def __init__(self):
+        self.encoded = []
+    
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        self.encoded.extend(texts)
+        vectors = np.zeros((len(texts), 64), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, zlib.crc32(word.encode()) % 64] += 1.0
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+        return vectors[0] if single else vectors
+
+
+def question(text, category="Python"):
+    return {"question": text, "category": category, "difficulty": "Medium", "keywords": [], "answer_hints": ""}
+
+
+def write_bank(path, questions):
+    path.write_text(json.dumps({"questions": questions}))
+
+
+@pytest.fixture
+def dense_backend(tmp_path, monkeypatch):
+    model = BagOfWordsModel()
+    monkeypatch.setitem(embeddings._models, MODEL, model)
+    monkeypatch.setattr(Config, "USE_EMBEDDINGS", True)
+    monkeypatch.setattr(Config, "VECTOR_BACKEND", "numpy")
+    monkeypatch.setattr(Config, "DENSE_INDEX_DIR", tmp_path / "dense")
+    return model
+
+
+def open_store(tmp_path, questions, storage="float32"):
+    bank = tmp_path / "bank.json"
+    write_bank(bank, questions)
+    build_dense_index(questions, tmp_path / "dense", MODEL, storage=storage)
+    manager = QuestionBankManager(bank, poll_interval=0)
+    return bank, manager, VectorStore(question_bank=manager)
+
+
+def texts(results):
+    return [r["question"] for r in results]
+
+
+def test_reload_drops_removed_and_serves_edited_questions(tmp_path, dense_backend):
+    questions = [
+        question("What is a python decorator"),
+        question("Explain python generators"),
+        question("How does a database index work", "Databases"),
+    ]
+    bank, manager, store = open_store(tmp_path, questions)
+    assert "What is a python decorator" in texts(store.search_questions("python decorator", 3))
+    
+    dense_backend.encoded.clear()
+    write_bank(bank, [question("What does a python decorator return"), questions[2]])
+    assert manager.reload(force=True)
+    
+    found = texts(store.search_questions("python decorator", 3))
+    assert "What is a python decorator" not in found
+    assert "Explain python generators" not in found
+    assert "What does a python decorator return" in found
+    assert len(store.dense_index) == 2
+    # Only the edited question went through the encoder (plus the query)
+    assert [t for t in dense_backend.encoded if t != "python decorator"] == ["What does a python decorator return "]
+
+
+def test_reload_keeps_index_storage(tmp_path, dense_backend):
+    questions = [question("What is a python decorator"), question("Explain python generators")]
+    bank, manager, store = open_store(tmp_path, questions, storage="int8")
+    
+    write_bank(bank, questions[:1])
+    assert manager.reload(force=True)
+    
+    assert store.dense_index.storage == "int8"
+    assert texts(store.search_questions("python generators", 5)) == ["What is a python decorator"]
+    assert len(DenseIndex(tmp_path / "dense")) == 1
+
+
+def test_rebuild_never_changes_an_open_index(tmp_path, dense_backend):
+    path = tmp_path / "dense"
+    build_dense_index([question("What is a python decorator")], path, MODEL)
+    old = DenseIndex(path)
+    
+    # Same row count, different content: a reader must never mix the two builds
+    for text in ("Explain python generators", "What is a closure", "What is a python metaclass"):
+        build_dense_index([question(text)], path, MODEL)
+    
+    assert texts(old.search(embeddings.encode_query("python decorator", MODEL), 1)) == ["What is a python decorator"]
+    new = DenseIndex(path)
+    assert texts(new.search(embeddings.encode_query("python metaclass", MODEL), 1)) == ["What is a python metaclass"]
+    assert sorted(p.name for p in path.iterdir() if p.name.startswith("build-")) == ["build-000003", "build-000004"]
+
+
+def test_flat_layout_still_opens_and_is_replaced(tmp_path, dense_backend):
+    path = tmp_path / "dense"
+    build_dense_index([question("What is a python decorator")], path, MODEL)
+    # Simulate an index written before builds had their own directories
+    build = DenseIndex(path).build_path
+    for item in build.iterdir():
+        item.rename(path / item.name)
+    (path / "CURRENT").unlink()
+    build.rmdir()
+    assert len(DenseIndex(path)) == 1
+    
+    build_dense_index([question("What is a python decorator"), question("What is a closure")], path, MODEL)
+    assert len(DenseIndex(path)) == 2
+    assert not (path / "meta.json").exists()
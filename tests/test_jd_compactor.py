@@ -0,0 +1,76 @@
+"""
+JD Compactor tests
+Boilerplate removal must never drop real requirements
+"""
+from src.jd_compactor import JDCompactor
+
+REQUIREMENTS = [
+    "Senior Platform Engineer",
+    "Requirements:",
+    "- API design in Python",
+    "- Catalog ingestion pipelines",
+    "Data privacy",
+    "- Kubernetes",
+    "- Docker",
+    "- Terraform",
+]
+
+
+def test_under_budget_text_is_unchanged():
+    text = "\n".join(REQUIREMENTS + ["Benefits:", "- Free lunch"])
+    assert JDCompactor(max_tokens=10_000).compact(text) == text
+
+
+def test_line_filter_matches_whole_words_only():
+    compacted = JDCompactor(max_tokens=60).compact("\n".join(REQUIREMENTS + ["Sign in to apply", "Log in"] * 20))
+    assert "API design in Python" in compacted
+    assert "Catalog ingestion pipelines" in compacted
+    assert "Sign in to apply" not in compacted
+    assert "\nLog in" not in compacted
+
+
+def test_short_line_inside_requirements_keeps_following_lines():
+    filler = [f"- Filler requirement number {i}" for i in range(40)]
+    compacted = JDCompactor(max_tokens=80).compact("\n".join(REQUIREMENTS + filler))
+    for skill in ("Kubernetes", "Docker", "Terraform", "Data privacy"):
+        assert skill in compacted
+
+
+def test_boilerplate_sections_are_dropped_when_over_budget():
+    text = "\n".join([
+        "Backend Engineer",
+        "We build payments infrastructure.",
+        "Benefits:",
+        "- Unlimited vacation",
+        "- Gym membership",
+        "Equal Opportunity Employer",
+        "We welcome everyone.",
+        "Requirements:",
+        "- Go and PostgreSQL",
+    ] * 1 + [f"Company history paragraph {i}." for i in range(60)])
+    compacted = JDCompactor(max_tokens=60).compact(text)
+    assert "Go and PostgreSQL" in compacted
+    assert "Unlimited vacation" not in compacted
+    assert "We welcome everyone." not in compacted
+
+
+def test_colon_heading_after_requirements_starts_boilerplate():
+    sections = JDCompactor(max_tokens=100)._split_sections(
+        ["Requirements:", "- Python", "Privacy policy", "Salary:", "- Competitive"]
+    )
+    assert [kind for kind, _ in sections] == ["neutral", "priority", "boilerplate"]
+    assert "Privacy policy" in sections[1][1]
+
+
+def test_benefits_after_requirements_do_not_fill_budget():
+    perks = [f"- Perk number {i}: free snacks, gym, travel and learning budget" for i in range(30)]
+    text = "\n".join(
+        ["Backend Engineer", "Requirements:", "- Go and PostgreSQL", "- Kafka streaming"]
+        + ["Benefits:"] + perks + ["Salary:", "- $150k to $180k", "Nice to have:", "- Rust"]
+    )
+    compacted = JDCompactor(max_tokens=120).compact(text)
+    assert "Go and PostgreSQL" in compacted
+    assert "Kafka streaming" in compacted
+    assert "Rust" in compacted
+    assert "Perk number" not in compacted
+    assert "$150k" not in compacted
@@ -0,0 +1,39 @@
+"""
+JD route tests
+Only complete analyses are served from the JD result cache
+"""
+from fastapi.testclient import TestClient
+from api.main import app
+
+JD = (
+    "Senior Python Developer. We need Django, PostgreSQL, Docker and Kubernetes "
+    "experience, plus a track record of shipping REST APIs."
+)
+
+
+def test_failed_llm_analysis_is_not_cached():
+    with TestClient(app) as client:
+        services = app.state.services
+        llm_service = services.jd_analyzer.llm_service
+        real_call = llm_service._call_llm
+        calls = []
+        
+        async def flaky_call(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise Exception("429 Too Many Requests")
+            return await real_call(*args, **kwargs)
+        
+        llm_service._call_llm = flaky_call
+        try:
+            first = client.post("/api/analyze-jd", json={"job_description": JD}).json()
+            second = client.post("/api/analyze-jd", json={"job_description": JD}).json()
+            third = client.post("/api/analyze-jd", json={"job_description": JD}).json()
+        finally:
+            del llm_service._call_llm
+    
+    assert first["analysis"]["job_role"] == "Not specified"
+    assert second["analysis"]["job_role"] != "Not specified"
+    assert third == second
+    assert len(calls) == 2
+    assert services.jd_cache.get_stats()["hits"] == 1
@@ -0,0 +1,46 @@
+"""
+Question bank manager tests
+Startup from the prebuilt artifact must still follow the JSON source
+"""
+import json
+from src.compiled_bank import write_compiled_bank
+from src.question_bank import file_digest, file_signature
+from src.question_bank_manager import QuestionBankManager
+
+
+def question(text):
+    return {"question": text, "category": "Python", "difficulty": "Easy", "keywords": [], "answer_hints": ""}
+
+
+def write_bank(path, questions):
+    path.write_text(json.dumps({"questions": questions}))
+
+
+def compile_artifact(bank, artifact):
+    questions = json.loads(bank.read_text())["questions"]
+    write_compiled_bank(questions, artifact, 1, file_signature(bank), file_digest(bank))
+
+
+def test_shared_reload_after_starting_from_artifact(tmp_path):
+    bank, artifact = tmp_path / "bank.json", tmp_path / "bank.bin"
+    write_bank(bank, [question("What is a list?")])
+    compile_artifact(bank, artifact)
+    
+    manager = QuestionBankManager(bank, poll_interval=0, shared_dir=tmp_path / "shared", compiled_path=artifact)
+    assert manager.snapshot.generation == 1
+    
+    write_bank(bank, [question("What is a list?"), question("What is a tuple?")])
+    assert manager.reload()
+    assert len(manager.snapshot) == 2
+    assert manager.snapshot.generation > 1
+    assert not manager.reload()
+
+
+def test_stale_artifact_is_ignored_at_startup(tmp_path):
+    bank, artifact = tmp_path / "bank.json", tmp_path / "bank.bin"
+    write_bank(bank, [question("What is a list?")])
+    compile_artifact(bank, artifact)
+    write_bank(bank, [question("What is a dict?"), question("What is a set?")])
+    
+    manager = QuestionBankManager(bank, poll_interval=0, compiled_path=artifact)
+    assert [q["question"] for q in manager.snapshot.questions] == ["What is a dict?", "What is a set?"]
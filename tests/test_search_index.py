@@ -0,0 +1,33 @@
+"""
+Keyword search tests
+Plural and singular forms must match the same questions
+"""
+import pytest
+from config.config import Config
+from src.question_bank import load_question_bank
+from src.search_index import BM25Index, fold_term, tokenize
+
+
+@pytest.fixture(scope="module")
+def index():
+    return BM25Index(load_question_bank(Config.QUESTIONS_FILE))
+
+
+def questions(results):
+    return [r["question"] for r in results]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("python decorators", "What is a Python decorator and how would you implement one?"),
+    ("decorators", "What is a Python decorator and how would you implement one?"),
+    ("database indexes", "What is a database index and how does it work?"),
+])
+def test_plural_query_ranks_singular_question_first(index, query, expected):
+    assert questions(index.search(query, 5))[0] == expected
+
+
+def test_folding_keeps_tech_terms_and_short_words():
+    assert tokenize("c++ node.js ci/cd aws redis class status") == [
+        "c++", "node.js", "ci/cd", "aws", "redis", "class", "status"
+    ]
+    assert [fold_term(t) for t in ("queries", "processes", "boxes", "hooks")] == ["query", "process", "box", "hook"]